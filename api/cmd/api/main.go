@@ -120,11 +120,8 @@ func main() {
 	}
 	log.Info().Msg("Gemini AI client initialized")
 
-	// Initialize Gemini Embeddings client
-	geminiEmbeddings, err := gemini.NewEmbeddingsClient(context.Background(), cfg.GeminiAPIKey)
-	if err != nil {
-		log.Fatal().Err(err).Msg("Failed to create Gemini embeddings client")
-	}
+	// Initialize Gemini Embeddings client (shares the chat client's connection pool)
+	geminiEmbeddings := geminiClient.Embeddings()
 
 	// Initialize email service (1:1 with Python)
 	emailConfig := &email.Config{
@@ -147,6 +144,15 @@ func main() {
 	dashboardRepository := dashboardRepo.NewPostgresDashboardRepository(db.Pool)
 	websiteRepository := websiteRepo.NewPostgresWebsiteRepository(db.Pool)
 
+	// Share cached OAuth credentials across restarts and replicas
+	if redis.IsEnabled() {
+		if credentialStore, err := adapters.NewCredentialStoreAdapter(redis, cfg.JWTSecret); err != nil {
+			log.Warn().Err(err).Msg("Shared credential cache disabled")
+		} else {
+			authRepository.SetCredentialStore(credentialStore)
+		}
+	}
+
 	// Initialize services
 	authSvc := authService.NewAuthService(authRepository, oauthClient, cfg.JWTSecret)
 	gscSvc := gscService.NewGSCService(gscRepository, gscClient, oauthClient, authSvc, authRepository)
@@ -32,6 +32,15 @@ var CTRBenchmarks = map[int]float64{
 	10: 0.025, // Position 10: 2.5% CTR
 }
 
+// ctrByPosition is CTRBenchmarks flattened into an array indexed by position (1-10),
+// built once so scoring does plain index reads instead of map lookups
+var ctrByPosition = func() (table [11]float64) {
+	for pos, ctr := range CTRBenchmarks {
+		table[pos] = ctr
+	}
+	return table
+}()
+
 // Component weights (must sum to 1.0) - 1:1 with Python
 var Weights = map[string]float64{
 	"traffic":  0.30,
@@ -40,6 +49,14 @@ var Weights = map[string]float64{
 	"trends":   0.20,
 }
 
+// Weights resolved once so each score calculation skips the string-keyed map lookups
+var (
+	weightTraffic  = Weights["traffic"]
+	weightPosition = Weights["position"]
+	weightCTR      = Weights["ctr"]
+	weightTrends   = Weights["trends"]
+)
+
 // HistoricalData represents previous period data for trend analysis
 type HistoricalData struct {
 	Clicks   int
@@ -82,10 +99,10 @@ func (e *SEOScoringEngine) CalculateScore(clicks, impressions int, ctr, position
 	trendScore := e.calculateTrendScore(clicks, position, ctr, historical)
 
 	// Calculate weighted final score
-	finalScore := trafficScore*Weights["traffic"] +
-		positionScore*Weights["position"] +
-		ctrScore*Weights["ctr"] +
-		trendScore*Weights["trends"]
+	finalScore := trafficScore*weightTraffic +
+		positionScore*weightPosition +
+		ctrScore*weightCTR +
+		trendScore*weightTrends
 
 	// Apply penalties for critical issues
 	finalScore = e.applyPenalties(finalScore, clicks, impressions, ctr)
@@ -114,10 +131,10 @@ func (e *SEOScoringEngine) CalculateScoreWithBreakdown(clicks, impressions int,
 	trendScore := e.calculateTrendScore(clicks, position, ctr, historical)
 
 	// Calculate weighted final score
-	finalScore := trafficScore*Weights["traffic"] +
-		positionScore*Weights["position"] +
-		ctrScore*Weights["ctr"] +
-		trendScore*Weights["trends"]
+	finalScore := trafficScore*weightTraffic +
+		positionScore*weightPosition +
+		ctrScore*weightCTR +
+		trendScore*weightTrends
 
 	// Apply penalties for critical issues
 	finalScore = e.applyPenalties(finalScore, clicks, impressions, ctr)
@@ -193,34 +210,22 @@ func (e *SEOScoringEngine) getExpectedCTR(position float64) float64 {
 	// Exact match - 1:1 with Python seo_scoring.py:230 and shared/scoring/seo_score.go:212
 	// Must verify position is an exact integer before returning benchmark
 	posInt := int(position)
-	if val, exists := CTRBenchmarks[posInt]; exists && position == float64(posInt) {
-		return val
+	if posInt >= 1 && posInt <= 10 && position == float64(posInt) {
+		return ctrByPosition[posInt]
 	}
 
 	// Interpolate between known values
 	if position < 1 {
-		return CTRBenchmarks[1]
+		return ctrByPosition[1]
 	} else if position > 10 {
 		// Exponential decay after position 10
-		return CTRBenchmarks[10] * math.Pow(0.9, position-10)
+		return ctrByPosition[10] * math.Pow(0.9, position-10)
 	}
 
-	// Linear interpolation between known points
+	// Linear interpolation between known points (lower is 1-9 here, so upper is always in range)
 	lower := int(position)
-	upper := lower + 1
-
-	lowerVal, lowerExists := CTRBenchmarks[lower]
-	upperVal, upperExists := CTRBenchmarks[upper]
-
-	if lowerExists && upperExists {
-		weight := position - float64(lower)
-		return lowerVal*(1-weight) + upperVal*weight
-	} else if lowerExists {
-		return lowerVal
-	}
-
-	// Estimate based on position 10
-	return CTRBenchmarks[10]
+	weight := position - float64(lower)
+	return ctrByPosition[lower]*(1-weight) + ctrByPosition[lower+1]*weight
 }
 
 // calculateTrendScore calculates trend component score (0-100) - 1:1 with Python
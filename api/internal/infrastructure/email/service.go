@@ -13,6 +13,7 @@ import (
 	"time"
 
 	"github.com/jackc/pgx/v5/pgxpool"
+	"github.com/rs/zerolog/log"
 )
 
 // ============================================================================
@@ -61,14 +62,17 @@ type EmailLog struct {
 }
 
 // logEmailActivity logs email activity to database (1:1 with Python)
-func (s *Service) logEmailActivity(ctx context.Context, log *EmailLog) {
+func (s *Service) logEmailActivity(ctx context.Context, entry *EmailLog) {
 	if s.db == nil {
-		fmt.Printf("[EMAIL LOG] DB not available, skipping log: %s to %s - %s\n",
-			log.EmailType, log.RecipientEmail, log.Status)
+		log.Debug().
+			Str("type", entry.EmailType).
+			Str("recipient", entry.RecipientEmail).
+			Str("status", entry.Status).
+			Msg("[EMAIL LOG] DB not available, skipping log")
 		return
 	}
 
-	metadataJSON, _ := json.Marshal(log.Metadata)
+	metadataJSON, _ := json.Marshal(entry.Metadata)
 
 	query := `
 		INSERT INTO email_logs
@@ -78,30 +82,33 @@ func (s *Service) logEmailActivity(ctx context.Context, log *EmailLog) {
 	`
 
 	var sentAt interface{}
-	if log.SentAt != nil {
-		sentAt = log.SentAt
+	if entry.SentAt != nil {
+		sentAt = entry.SentAt
 	}
 
 	_, err := s.db.Exec(ctx, query,
-		log.UserEmail,
-		log.RecipientEmail,
-		log.EmailType,
-		log.Subject,
-		log.Status,
-		log.ErrorMessage,
-		log.AuditID,
-		log.AttachmentName,
-		log.SMTPServer,
-		log.SentFrom,
+		entry.UserEmail,
+		entry.RecipientEmail,
+		entry.EmailType,
+		entry.Subject,
+		entry.Status,
+		entry.ErrorMessage,
+		entry.AuditID,
+		entry.AttachmentName,
+		entry.SMTPServer,
+		entry.SentFrom,
 		sentAt,
 		string(metadataJSON),
 	)
 
 	if err != nil {
-		fmt.Printf("[EMAIL LOG] Failed to log email activity: %v\n", err)
+		log.Warn().Err(err).Msg("[EMAIL LOG] Failed to log email activity")
 	} else {
-		fmt.Printf("[EMAIL LOG] Logged email activity: %s to %s - %s\n",
-			log.EmailType, log.RecipientEmail, log.Status)
+		log.Debug().
+			Str("type", entry.EmailType).
+			Str("recipient", entry.RecipientEmail).
+			Str("status", entry.Status).
+			Msg("[EMAIL LOG] Logged email activity")
 	}
 }
 
@@ -116,7 +123,7 @@ func (s *Service) SendAuditReportEmail(ctx context.Context, recipientEmail, pdfP
 
 	// Check if email is enabled
 	if !s.config.Enabled {
-		fmt.Printf("[EMAIL] Email disabled. Would have sent report to %s\n", recipientEmail)
+		log.Debug().Str("recipient", recipientEmail).Msg("[EMAIL] Email disabled, skipping audit report")
 		s.logEmailActivity(ctx, &EmailLog{
 			UserEmail:      userEmail,
 			RecipientEmail: recipientEmail,
@@ -144,7 +151,7 @@ func (s *Service) SendAuditReportEmail(ctx context.Context, recipientEmail, pdfP
 		if _, err := os.Stat(pdfPath); err == nil {
 			pdfData, err = os.ReadFile(pdfPath)
 			if err != nil {
-				fmt.Printf("[EMAIL] Warning: Could not read PDF file: %v\n", err)
+				log.Warn().Err(err).Str("pdf_path", pdfPath).Msg("[EMAIL] Could not read PDF file")
 			} else {
 				attachmentName = fmt.Sprintf("seo_audit_%s.pdf", auditID)
 			}
@@ -202,7 +209,7 @@ func (s *Service) SendAuditNotification(ctx context.Context, recipientEmail, aud
 
 	// Check if email is enabled
 	if !s.config.Enabled {
-		fmt.Printf("[EMAIL] Email disabled. Would have sent notification to %s\n", recipientEmail)
+		log.Debug().Str("recipient", recipientEmail).Msg("[EMAIL] Email disabled, skipping notification")
 		s.logEmailActivity(ctx, &EmailLog{
 			UserEmail:      userEmail,
 			RecipientEmail: recipientEmail,
@@ -315,9 +322,9 @@ func (s *Service) sendEmail(to, subject, htmlBody, attachmentName string, attach
 	return nil
 }
 
-// generateAuditReportBody generates HTML body for audit report email (1:1 with Python)
-func (s *Service) generateAuditReportBody(seoScore float64, auditID string) (string, error) {
-	tmpl := `
+// auditReportTemplate is the audit report email body, parsed once at startup
+// instead of on every send
+var auditReportTemplate = template.Must(template.New("audit_report").Parse(`
 <!DOCTYPE html>
 <html>
 <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
@@ -360,13 +367,10 @@ func (s *Service) generateAuditReportBody(seoScore float64, auditID string) (str
     </div>
 </body>
 </html>
-`
-
-	t, err := template.New("audit_report").Parse(tmpl)
-	if err != nil {
-		return "", err
-	}
+`))
 
+// generateAuditReportBody generates HTML body for audit report email (1:1 with Python)
+func (s *Service) generateAuditReportBody(seoScore float64, auditID string) (string, error) {
 	data := struct {
 		Score   string
 		AuditID string
@@ -376,7 +380,7 @@ func (s *Service) generateAuditReportBody(seoScore float64, auditID string) (str
 	}
 
 	var buf bytes.Buffer
-	if err := t.Execute(&buf, data); err != nil {
+	if err := auditReportTemplate.Execute(&buf, data); err != nil {
 		return "", err
 	}
 
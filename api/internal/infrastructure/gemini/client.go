@@ -3,6 +3,7 @@ package gemini
 import (
 	"context"
 	"fmt"
+	"strings"
 	"time"
 
 	"github.com/rs/zerolog/log"
@@ -28,13 +29,20 @@ const (
 	DefaultMaxTokens = 2000 // Default for most responses
 	RAGMaxTokens     = 3000 // Higher for RAG responses with context
 	ChatMaxTokens    = 3000 // Higher for chat with weekly/daily data context
-	BenchmarkTokens  = 3000 // For benchmark analysis
+	BenchmarkTokens  = 1500 // For benchmark analysis (schema-bound JSON: a few sentences and three short lists)
 
 	// Embedding dimension (configurable: 768, 1536, 3072)
 	EmbeddingDimension = 768 // Optimized for efficiency, compatible with pgvector
 
 	// Timeout
 	DefaultTimeout = 60 * time.Second
+
+	// MaxConcurrentRequests caps in-flight GenerateContent calls per client so bursts
+	// of concurrent chat/benchmark requests are throttled instead of hitting rate limits
+	MaxConcurrentRequests = 20
+
+	// JSONResponseMIMEType constrains the model to emit a bare JSON object (JSON mode)
+	JSONResponseMIMEType = "application/json"
 )
 
 // Client wraps the Google Generative AI client for Gemini
@@ -42,6 +50,7 @@ type Client struct {
 	client     *genai.Client
 	chatModel  string
 	embedModel string
+	sem        chan struct{} // limits concurrent requests to MaxConcurrentRequests
 }
 
 // Message represents a chat message (compatible interface with previous OpenAI)
@@ -83,6 +92,7 @@ func NewClient(ctx context.Context, apiKey string) (*Client, error) {
 		client:     client,
 		chatModel:  DefaultChatModel,
 		embedModel: DefaultEmbeddingModel,
+		sem:        make(chan struct{}, MaxConcurrentRequests),
 	}, nil
 }
 
@@ -112,12 +122,19 @@ func (c *Client) ChatWithRAG(ctx context.Context, messages []Message) (*ChatResp
 
 // ChatWithBenchmark sends a chat for benchmark insights generation
 // 1:1 with Python benchmark_analyzer.py - higher token limit for detailed analysis
+// Uses structured output (JSON mode + BenchmarkResponseSchema) so the response always
+// matches the insights shape without spelling out a JSON template in the prompt
 func (c *Client) ChatWithBenchmark(ctx context.Context, messages []Message) (*ChatResponse, error) {
-	return c.ChatWithOptions(ctx, messages, BenchmarkTokens, RAGTemperature)
+	return c.chat(ctx, messages, BenchmarkTokens, RAGTemperature, BenchmarkResponseSchema)
 }
 
 // ChatWithOptions sends a chat completion request with custom options
 func (c *Client) ChatWithOptions(ctx context.Context, messages []Message, maxTokens int, temperature float64) (*ChatResponse, error) {
+	return c.chat(ctx, messages, maxTokens, temperature, nil)
+}
+
+// buildRequest converts messages to Gemini contents and builds the generation config
+func buildRequest(messages []Message, maxTokens int, temperature float64, responseSchema *genai.Schema) ([]*genai.Content, *genai.GenerateContentConfig) {
 	// Extract system instruction and convert messages to Gemini format
 	var systemInstruction *genai.Content
 	var contents []*genai.Content
@@ -157,6 +174,27 @@ func (c *Client) ChatWithOptions(ctx context.Context, messages []Message, maxTok
 		config.SystemInstruction = systemInstruction
 	}
 
+	// Request structured output when asked (e.g. benchmark insights)
+	if responseSchema != nil {
+		config.ResponseMIMEType = JSONResponseMIMEType
+		config.ResponseSchema = responseSchema
+	}
+
+	return contents, config
+}
+
+// chat sends a chat completion request; responseSchema is optional (nil for plain text)
+func (c *Client) chat(ctx context.Context, messages []Message, maxTokens int, temperature float64, responseSchema *genai.Schema) (*ChatResponse, error) {
+	contents, config := buildRequest(messages, maxTokens, temperature, responseSchema)
+
+	// Wait for a free request slot (or give up if the caller goes away)
+	select {
+	case c.sem <- struct{}{}:
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+	defer func() { <-c.sem }()
+
 	// Generate content
 	result, err := c.client.Models.GenerateContent(ctx, c.chatModel, contents, config)
 	if err != nil {
@@ -237,6 +275,52 @@ func (c *Client) ChatWithOptions(ctx context.Context, messages []Message, maxTok
 	}, nil
 }
 
+// ChatStream sends a chat completion request and streams the response, calling onChunk
+// with each piece of text as it arrives so callers can forward partial output before
+// the model finishes. The full response is still returned once the stream ends.
+func (c *Client) ChatStream(ctx context.Context, messages []Message, maxTokens int, temperature float64, onChunk func(text string) error) (*ChatResponse, error) {
+	contents, config := buildRequest(messages, maxTokens, temperature, nil)
+
+	// Wait for a free request slot (or give up if the caller goes away)
+	select {
+	case c.sem <- struct{}{}:
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+	defer func() { <-c.sem }()
+
+	var responseText strings.Builder
+	var usage UsageStats
+
+	for result, err := range c.client.Models.GenerateContentStream(ctx, c.chatModel, contents, config) {
+		if err != nil {
+			return nil, fmt.Errorf("Gemini API error: %w", err)
+		}
+
+		if text := result.Text(); text != "" {
+			responseText.WriteString(text)
+			if err := onChunk(text); err != nil {
+				return nil, err
+			}
+		}
+
+		// Usage metadata is cumulative; the last chunk carries the totals
+		if result.UsageMetadata != nil {
+			usage = UsageStats{
+				PromptTokens:     int(result.UsageMetadata.PromptTokenCount),
+				CompletionTokens: int(result.UsageMetadata.CandidatesTokenCount),
+				TotalTokens:      int(result.UsageMetadata.TotalTokenCount),
+			}
+		}
+	}
+
+	return &ChatResponse{
+		Content: responseText.String(),
+		Model:   c.chatModel,
+		Usage:   usage,
+	}, nil
+}
+
 // GetContent extracts the content from a response (compatibility method)
 func (r *ChatResponse) GetContent() string {
 	return r.Content
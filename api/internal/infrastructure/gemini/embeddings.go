@@ -74,6 +74,15 @@ func NewEmbeddingsClient(ctx context.Context, apiKey string) (*EmbeddingsClient,
 	}, nil
 }
 
+// Embeddings returns an embeddings client that shares c's underlying genai client,
+// so chat and embedding calls reuse one connection pool instead of building a second client
+func (c *Client) Embeddings() *EmbeddingsClient {
+	return &EmbeddingsClient{
+		client: c.client,
+		config: DefaultEmbeddingConfig(),
+	}
+}
+
 // WithDimension sets custom embedding dimension (768, 1536, or 3072)
 func (c *EmbeddingsClient) WithDimension(dim int) *EmbeddingsClient {
 	if dim == 768 || dim == 1536 || dim == 3072 {
@@ -2,6 +2,9 @@ package gemini
 
 import (
 	"fmt"
+	"strings"
+
+	"google.golang.org/genai"
 )
 
 // ============================================================================
@@ -153,19 +156,31 @@ type AuditIssue struct {
 	Description string
 }
 
+// enhancedPromptPrefix is the static head of every enhanced system prompt, concatenated
+// at compile time so each build starts with a single copy
+const enhancedPromptPrefix = SEOSystemPrompt + "\n\n## DATA CONTEXT PROVIDED TO YOU:\n"
+
 // BuildEnhancedSystemPrompt creates a system prompt with injected data context
 // 1:1 with Python build_enhanced_system_prompt
 func BuildEnhancedSystemPrompt(websiteURL string, metrics *WebsiteMetrics, auditData *AuditContext) string {
-	prompt := SEOSystemPrompt
-
 	if websiteURL == "" && metrics == nil && auditData == nil {
-		return prompt
+		return SEOSystemPrompt
+	}
+
+	// Build into a single pre-sized buffer rather than re-copying the prompt on every append
+	size := len(enhancedPromptPrefix) + 2048
+	if metrics != nil {
+		size += len(metrics.DailyTrend) * 64 // one table row per day
 	}
+	var prompt strings.Builder
+	prompt.Grow(size)
 
-	prompt += "\n\n## DATA CONTEXT PROVIDED TO YOU:\n"
+	prompt.WriteString(enhancedPromptPrefix)
 
 	if websiteURL != "" {
-		prompt += "\n### Website Being Tracked:\n" + websiteURL + "\n"
+		prompt.WriteString("\n### Website Being Tracked:\n")
+		prompt.WriteString(websiteURL)
+		prompt.WriteString("\n")
 	}
 
 	// Determine SEO stage from metrics if not in audit data (1:1 with Python)
@@ -178,75 +193,75 @@ func BuildEnhancedSystemPrompt(websiteURL string, metrics *WebsiteMetrics, audit
 
 	// Add SEO Stage context with description (1:1 with Python)
 	if seoStage != "" {
-		prompt += "\n### SEO Visibility Stage:\n"
-		prompt += fmt.Sprintf("- Current Stage: %s\n", seoStage)
+		prompt.WriteString("\n### SEO Visibility Stage:\n")
+		fmt.Fprintf(&prompt, "- Current Stage: %s\n", seoStage)
 		if desc, ok := seoStageDescriptions[seoStage]; ok {
-			prompt += fmt.Sprintf("- What This Means: %s\n", desc)
+			fmt.Fprintf(&prompt, "- What This Means: %s\n", desc)
 		}
-		prompt += "- Stage Progression: Hidden (< 50 impressions) → Emerging (50-299) → Discoverable (300-1999) → Trusted (2000+)\n"
+		prompt.WriteString("- Stage Progression: Hidden (< 50 impressions) → Emerging (50-299) → Discoverable (300-1999) → Trusted (2000+)\n")
 	}
 
 	if metrics != nil {
-		prompt += "\n### Current GSC Metrics (Last 30 Days):\n"
-		prompt += fmt.Sprintf("- Impressions: %d\n", metrics.Impressions)
-		prompt += fmt.Sprintf("- Clicks: %d\n", metrics.Clicks)
-		prompt += fmt.Sprintf("- CTR: %.2f%%\n", metrics.CTR*100)
-		prompt += fmt.Sprintf("- Average Position: %.1f\n", metrics.Position)
-		prompt += fmt.Sprintf("- SEO Score: %.1f/100\n", metrics.SEOScore)
+		prompt.WriteString("\n### Current GSC Metrics (Last 30 Days):\n")
+		fmt.Fprintf(&prompt, "- Impressions: %d\n", metrics.Impressions)
+		fmt.Fprintf(&prompt, "- Clicks: %d\n", metrics.Clicks)
+		fmt.Fprintf(&prompt, "- CTR: %.2f%%\n", metrics.CTR*100)
+		fmt.Fprintf(&prompt, "- Average Position: %.1f\n", metrics.Position)
+		fmt.Fprintf(&prompt, "- SEO Score: %.1f/100\n", metrics.SEOScore)
 
 		if metrics.ImpressionsChange != 0 || metrics.ClicksChange != 0 {
-			prompt += "\n### Changes vs Previous Period (30-day comparison):\n"
-			prompt += fmt.Sprintf("- Impressions Change: %+.1f%%\n", metrics.ImpressionsChange)
-			prompt += fmt.Sprintf("- Clicks Change: %+.1f%%\n", metrics.ClicksChange)
-			prompt += fmt.Sprintf("- CTR Change: %+.2f%%\n", metrics.CTRChange)
-			prompt += fmt.Sprintf("- Position Change: %+.1f positions\n", metrics.PositionChange)
+			prompt.WriteString("\n### Changes vs Previous Period (30-day comparison):\n")
+			fmt.Fprintf(&prompt, "- Impressions Change: %+.1f%%\n", metrics.ImpressionsChange)
+			fmt.Fprintf(&prompt, "- Clicks Change: %+.1f%%\n", metrics.ClicksChange)
+			fmt.Fprintf(&prompt, "- CTR Change: %+.2f%%\n", metrics.CTRChange)
+			fmt.Fprintf(&prompt, "- Position Change: %+.1f positions\n", metrics.PositionChange)
 		}
 
-		// Add weekly data for "last week" queries
-		if metrics.WeeklyData != nil {
-			wd := metrics.WeeklyData
-			prompt += "\n### Last Week Performance (Last 7 Days):\n"
-			prompt += fmt.Sprintf("- Impressions: %d\n", wd.LastWeekImpressions)
-			prompt += fmt.Sprintf("- Clicks: %d\n", wd.LastWeekClicks)
-			prompt += fmt.Sprintf("- CTR: %.2f%%\n", wd.LastWeekCTR*100)
-			prompt += fmt.Sprintf("- Average Position: %.1f\n", wd.LastWeekPosition)
-
-			prompt += "\n### Week-over-Week Changes (vs Previous 7 Days):\n"
-			prompt += fmt.Sprintf("- Previous Week Impressions: %d → This Week: %d (%+.1f%%)\n", wd.PrevWeekImpressions, wd.LastWeekImpressions, wd.ImpressionsChange)
-			prompt += fmt.Sprintf("- Previous Week Clicks: %d → This Week: %d (%+.1f%%)\n", wd.PrevWeekClicks, wd.LastWeekClicks, wd.ClicksChange)
-			prompt += fmt.Sprintf("- CTR Change: %+.2f%%\n", wd.CTRChange)
-			prompt += fmt.Sprintf("- Position Change: %+.1f positions\n", wd.PositionChange)
+		// Add weekly data for "last week" queries; skip it when neither week has any
+		// impressions, since an all-zero section only adds prompt tokens
+		if wd := metrics.WeeklyData; wd != nil && (wd.LastWeekImpressions > 0 || wd.PrevWeekImpressions > 0) {
+			prompt.WriteString("\n### Last Week Performance (Last 7 Days):\n")
+			fmt.Fprintf(&prompt, "- Impressions: %d\n", wd.LastWeekImpressions)
+			fmt.Fprintf(&prompt, "- Clicks: %d\n", wd.LastWeekClicks)
+			fmt.Fprintf(&prompt, "- CTR: %.2f%%\n", wd.LastWeekCTR*100)
+			fmt.Fprintf(&prompt, "- Average Position: %.1f\n", wd.LastWeekPosition)
+
+			prompt.WriteString("\n### Week-over-Week Changes (vs Previous 7 Days):\n")
+			fmt.Fprintf(&prompt, "- Previous Week Impressions: %d → This Week: %d (%+.1f%%)\n", wd.PrevWeekImpressions, wd.LastWeekImpressions, wd.ImpressionsChange)
+			fmt.Fprintf(&prompt, "- Previous Week Clicks: %d → This Week: %d (%+.1f%%)\n", wd.PrevWeekClicks, wd.LastWeekClicks, wd.ClicksChange)
+			fmt.Fprintf(&prompt, "- CTR Change: %+.2f%%\n", wd.CTRChange)
+			fmt.Fprintf(&prompt, "- Position Change: %+.1f positions\n", wd.PositionChange)
 		}
 
 		// Add daily trend data for "show trends" queries
 		if len(metrics.DailyTrend) > 0 {
-			prompt += "\n### HISTORICAL TREND DATA - Daily Metrics (Use this for 'show trends' queries):\n"
-			prompt += "This is the actual historical data showing daily performance over time:\n"
-			prompt += "| Date | Impressions | Clicks | CTR | Position |\n"
-			prompt += "|------|-------------|--------|-----|----------|\n"
+			prompt.WriteString("\n### HISTORICAL TREND DATA - Daily Metrics (Use this for 'show trends' queries):\n")
+			prompt.WriteString("This is the actual historical data showing daily performance over time:\n")
+			prompt.WriteString("| Date | Impressions | Clicks | CTR | Position |\n")
+			prompt.WriteString("|------|-------------|--------|-----|----------|\n")
 			for _, day := range metrics.DailyTrend {
-				prompt += fmt.Sprintf("| %s | %d | %d | %.2f%% | %.1f |\n", day.Date, day.Impressions, day.Clicks, day.CTR*100, day.Position)
+				fmt.Fprintf(&prompt, "| %s | %d | %d | %.2f%% | %.1f |\n", day.Date, day.Impressions, day.Clicks, day.CTR*100, day.Position)
 			}
-			prompt += "\nWhen asked about trends, analyze this daily data to identify patterns, changes, and provide insights about the trend direction.\n"
+			prompt.WriteString("\nWhen asked about trends, analyze this daily data to identify patterns, changes, and provide insights about the trend direction.\n")
 		}
 	}
 
 	if auditData != nil {
-		prompt += "\n### Latest Audit Results:\n"
-		prompt += fmt.Sprintf("- Audit Date: %s\n", auditData.AuditDate)
-		prompt += fmt.Sprintf("- SEO Score: %.1f/100\n", auditData.SEOScore)
+		prompt.WriteString("\n### Latest Audit Results:\n")
+		fmt.Fprintf(&prompt, "- Audit Date: %s\n", auditData.AuditDate)
+		fmt.Fprintf(&prompt, "- SEO Score: %.1f/100\n", auditData.SEOScore)
 
 		if len(auditData.Issues) > 0 {
-			prompt += "\n### Current Issues:\n"
+			prompt.WriteString("\n### Current Issues:\n")
 			for _, issue := range auditData.Issues {
-				prompt += fmt.Sprintf("- [%s] %s: %s\n", issue.Severity, issue.Title, issue.Description)
+				fmt.Fprintf(&prompt, "- [%s] %s: %s\n", issue.Severity, issue.Title, issue.Description)
 			}
 		}
 	}
 
-	prompt += "\nUse this data to provide personalized, data-driven recommendations. Consider the user's SEO stage when giving advice."
+	prompt.WriteString("\nUse this data to provide personalized, data-driven recommendations. Consider the user's SEO stage when giving advice.")
 
-	return prompt
+	return prompt.String()
 }
 
 // ============================================================================
@@ -265,57 +280,79 @@ Guidelines:
 4. Consider the user's current SEO stage when giving advice
 5. Be encouraging but realistic about what can be achieved
 
-Response Format:
-Provide your analysis as a JSON object with the following structure:
-{
-    "visibility_performance": {
-        "overall_assessment": "A 2-3 sentence summary of overall SEO health",
-        "score": <number>,
-        "trend": "improving|stable|declining"
-    },
-    "analysis": {
-        "summary": "Detailed paragraph about performance",
-        "strengths": ["strength1", "strength2"],
-        "improvements": ["improvement1", "improvement2"],
-        "recommendations": ["recommendation1", "recommendation2", "recommendation3"]
-    }
-}
-
 Important:
 - Base all insights on the actual metrics provided
 - Don't make up data or use placeholder numbers
 - Keep recommendations actionable and specific
 - Consider the SEO stage when prioritizing advice`
 
-// BuildBenchmarkPrompt creates a prompt for benchmark analysis
-// 1:1 with Python benchmark_analyzer.py generate_ai_insights()
-func BuildBenchmarkPrompt(websiteURL string, metrics *WebsiteMetrics, seoStage string) string {
-	prompt := BenchmarkAnalysisPrompt
+// BenchmarkResponseSchema is the structured output schema for benchmark insights.
+// It replaces the JSON template that used to be inlined in BenchmarkAnalysisPrompt;
+// field guidance lives in the descriptions instead.
+var BenchmarkResponseSchema = &genai.Schema{
+	Type: genai.TypeObject,
+	Properties: map[string]*genai.Schema{
+		"visibility_performance": {
+			Type: genai.TypeObject,
+			Properties: map[string]*genai.Schema{
+				"overall_assessment": {Type: genai.TypeString, Description: "A 2-3 sentence summary of overall SEO health"},
+				"score":              {Type: genai.TypeNumber, Description: "Visibility score from 0 to 100"},
+				"trend":              {Type: genai.TypeString, Enum: []string{"improving", "stable", "declining"}},
+			},
+			Required: []string{"overall_assessment", "score", "trend"},
+		},
+		"analysis": {
+			Type: genai.TypeObject,
+			Properties: map[string]*genai.Schema{
+				"summary":         {Type: genai.TypeString, Description: "Detailed paragraph about performance"},
+				"strengths":       {Type: genai.TypeArray, Items: &genai.Schema{Type: genai.TypeString}},
+				"improvements":    {Type: genai.TypeArray, Items: &genai.Schema{Type: genai.TypeString}},
+				"recommendations": {Type: genai.TypeArray, Items: &genai.Schema{Type: genai.TypeString}, Description: "At least three actionable recommendations"},
+			},
+			Required: []string{"summary", "strengths", "improvements", "recommendations"},
+		},
+	},
+	Required: []string{"visibility_performance", "analysis"},
+}
+
+// Static parts of the benchmark metrics section, so each request only
+// formats the metric values in between
+const (
+	benchmarkMetricsHeader = "## METRICS TO ANALYZE:\n"
+	benchmarkPromptSuffix  = "\nGenerate comprehensive AI insights based on these metrics. Respond with valid JSON only."
+)
 
-	prompt += "\n\n## METRICS TO ANALYZE:\n"
-	prompt += fmt.Sprintf("Website: %s\n", websiteURL)
-	prompt += fmt.Sprintf("SEO Stage: %s\n", seoStage)
+// BuildBenchmarkMetricsPrompt creates only the per-request metrics section of the benchmark prompt.
+// Callers send BenchmarkAnalysisPrompt as the system instruction and this as the user turn, which
+// keeps the large static instruction an identical prefix across calls (eligible for prompt caching).
+func BuildBenchmarkMetricsPrompt(websiteURL string, metrics *WebsiteMetrics, seoStage string) string {
+	var b strings.Builder
+	b.Grow(len(benchmarkMetricsHeader) + len(benchmarkPromptSuffix) + 512)
+
+	b.WriteString(benchmarkMetricsHeader)
+	fmt.Fprintf(&b, "Website: %s\n", websiteURL)
+	fmt.Fprintf(&b, "SEO Stage: %s\n", seoStage)
 
 	if metrics != nil {
-		prompt += fmt.Sprintf("\nCurrent Period (Last 30 Days):\n")
-		prompt += fmt.Sprintf("- Total Impressions: %d\n", metrics.Impressions)
-		prompt += fmt.Sprintf("- Total Clicks: %d\n", metrics.Clicks)
-		prompt += fmt.Sprintf("- Average CTR: %.2f%%\n", metrics.CTR*100)
-		prompt += fmt.Sprintf("- Average Position: %.1f\n", metrics.Position)
-		prompt += fmt.Sprintf("- SEO Score: %.1f/100\n", metrics.SEOScore)
+		b.WriteString("\nCurrent Period (Last 30 Days):\n")
+		fmt.Fprintf(&b, "- Total Impressions: %d\n", metrics.Impressions)
+		fmt.Fprintf(&b, "- Total Clicks: %d\n", metrics.Clicks)
+		fmt.Fprintf(&b, "- Average CTR: %.2f%%\n", metrics.CTR*100)
+		fmt.Fprintf(&b, "- Average Position: %.1f\n", metrics.Position)
+		fmt.Fprintf(&b, "- SEO Score: %.1f/100\n", metrics.SEOScore)
 
 		if metrics.ImpressionsChange != 0 || metrics.ClicksChange != 0 {
-			prompt += fmt.Sprintf("\nChanges vs Previous Period:\n")
-			prompt += fmt.Sprintf("- Impressions: %+.1f%%\n", metrics.ImpressionsChange)
-			prompt += fmt.Sprintf("- Clicks: %+.1f%%\n", metrics.ClicksChange)
-			prompt += fmt.Sprintf("- CTR: %+.2fpp\n", metrics.CTRChange)
-			prompt += fmt.Sprintf("- Position: %+.1f\n", metrics.PositionChange)
+			b.WriteString("\nChanges vs Previous Period:\n")
+			fmt.Fprintf(&b, "- Impressions: %+.1f%%\n", metrics.ImpressionsChange)
+			fmt.Fprintf(&b, "- Clicks: %+.1f%%\n", metrics.ClicksChange)
+			fmt.Fprintf(&b, "- CTR: %+.2fpp\n", metrics.CTRChange)
+			fmt.Fprintf(&b, "- Position: %+.1f\n", metrics.PositionChange)
 		}
 	}
 
-	prompt += "\nGenerate comprehensive AI insights based on these metrics. Respond with valid JSON only."
+	b.WriteString(benchmarkPromptSuffix)
 
-	return prompt
+	return b.String()
 }
 
 // ============================================================================
@@ -344,32 +381,40 @@ Always provide specific, measurable recommendations with expected outcomes.
 
 Respond only with valid JSON array format.`
 
+// advancedAuditInstructions is the static closing block of every advanced audit prompt
+const advancedAuditInstructions = "\n\nAnalyze each issue and provide:\n" +
+	"1. Detailed description with specific numbers from the data\n" +
+	"2. Business impact (revenue/traffic implications)\n" +
+	"3. Step-by-step recommendation (specific actions)\n" +
+	"4. Expected outcome if fixed (% improvement, timeframe)\n" +
+	"\nFormat as JSON array with objects containing: description, impact, recommendation, expected_outcome"
+
 // BuildAdvancedAuditPrompt builds an advanced prompt for audit report generation
+// The static system prompt and closing instructions are written once into a pre-sized
+// buffer; only the metrics and issues are formatted per call
 func BuildAdvancedAuditPrompt(metrics *WebsiteMetrics, issues []AuditIssue) string {
-	prompt := AdvancedAuditReportPrompt
+	var prompt strings.Builder
+	prompt.Grow(len(AdvancedAuditReportPrompt) + len(advancedAuditInstructions) + 256 + len(issues)*160)
+
+	prompt.WriteString(AdvancedAuditReportPrompt)
 
 	if metrics != nil {
-		prompt += "\n\n## WEBSITE METRICS:\n"
-		prompt += fmt.Sprintf("- Impressions: %d\n", metrics.Impressions)
-		prompt += fmt.Sprintf("- Clicks: %d\n", metrics.Clicks)
-		prompt += fmt.Sprintf("- CTR: %.2f%%\n", metrics.CTR*100)
-		prompt += fmt.Sprintf("- Average Position: %.1f\n", metrics.Position)
-		prompt += fmt.Sprintf("- SEO Score: %.1f/100\n", metrics.SEOScore)
+		prompt.WriteString("\n\n## WEBSITE METRICS:\n")
+		fmt.Fprintf(&prompt, "- Impressions: %d\n", metrics.Impressions)
+		fmt.Fprintf(&prompt, "- Clicks: %d\n", metrics.Clicks)
+		fmt.Fprintf(&prompt, "- CTR: %.2f%%\n", metrics.CTR*100)
+		fmt.Fprintf(&prompt, "- Average Position: %.1f\n", metrics.Position)
+		fmt.Fprintf(&prompt, "- SEO Score: %.1f/100\n", metrics.SEOScore)
 	}
 
 	if len(issues) > 0 {
-		prompt += "\n## DETECTED ISSUES TO ANALYZE:\n"
+		prompt.WriteString("\n## DETECTED ISSUES TO ANALYZE:\n")
 		for i, issue := range issues {
-			prompt += fmt.Sprintf("%d. [%s] %s: %s\n", i+1, issue.Severity, issue.Title, issue.Description)
+			fmt.Fprintf(&prompt, "%d. [%s] %s: %s\n", i+1, issue.Severity, issue.Title, issue.Description)
 		}
 	}
 
-	prompt += "\n\nAnalyze each issue and provide:\n"
-	prompt += "1. Detailed description with specific numbers from the data\n"
-	prompt += "2. Business impact (revenue/traffic implications)\n"
-	prompt += "3. Step-by-step recommendation (specific actions)\n"
-	prompt += "4. Expected outcome if fixed (% improvement, timeframe)\n"
-	prompt += "\nFormat as JSON array with objects containing: description, impact, recommendation, expected_outcome"
+	prompt.WriteString(advancedAuditInstructions)
 
-	return prompt
+	return prompt.String()
 }
@@ -2,9 +2,10 @@ package google
 
 import (
 	"context"
-	"fmt"
 	"net/http"
 	"time"
+
+	"github.com/rs/zerolog/log"
 )
 
 // DetailedGSCDataFetcher handles detailed GSC data fetching (1:1 with Python)
@@ -109,8 +110,11 @@ func (f *DetailedGSCDataFetcher) FetchDetailedData(ctx context.Context, httpClie
 			chunkQueries, err := f.fetchQueriesWithPagination(ctx, httpClient, config.WebsiteURL, currentDate, chunkEnd)
 			if err != nil {
 				// Log error but continue processing
-				fmt.Printf("[GSC] Warning: Query fetch failed for chunk %s to %s: %v\n",
-					currentDate.Format("2006-01-02"), chunkEnd.Format("2006-01-02"), err)
+				log.Warn().
+					Err(err).
+					Str("chunk_start", currentDate.Format("2006-01-02")).
+					Str("chunk_end", chunkEnd.Format("2006-01-02")).
+					Msg("[GSC] Query fetch failed for chunk")
 			} else {
 				// Normalize and add to result
 				for _, q := range chunkQueries {
@@ -123,8 +127,11 @@ func (f *DetailedGSCDataFetcher) FetchDetailedData(ctx context.Context, httpClie
 		if config.FetchPages {
 			chunkPages, err := f.fetchPagesWithPagination(ctx, httpClient, config.WebsiteURL, currentDate, chunkEnd)
 			if err != nil {
-				fmt.Printf("[GSC] Warning: Page fetch failed for chunk %s to %s: %v\n",
-					currentDate.Format("2006-01-02"), chunkEnd.Format("2006-01-02"), err)
+				log.Warn().
+					Err(err).
+					Str("chunk_start", currentDate.Format("2006-01-02")).
+					Str("chunk_end", chunkEnd.Format("2006-01-02")).
+					Msg("[GSC] Page fetch failed for chunk")
 			} else {
 				for _, p := range chunkPages {
 					result.Pages = append(result.Pages, f.normalizePageData(config.UserEmail, config.WebsiteURL, p))
@@ -9,11 +9,54 @@ import (
 
 	"golang.org/x/oauth2"
 	"golang.org/x/oauth2/google"
+
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
 )
 
 // OAuthClient handles Google OAuth operations
 type OAuthClient struct {
 	config *oauth2.Config
+
+	// Authorization URL options never vary per request, so they are built once
+	authURLOpts     []oauth2.AuthCodeOption
+	consentURLOpts  []oauth2.AuthCodeOption // new devices or forced re-auth
+	rememberURLOpts []oauth2.AuthCodeOption // returning users with trusted devices
+
+	clients *lru.Cache[string, cachedAPIClient] // user email -> client for the user's current tokens
+}
+
+const (
+	// apiClientCacheMaxEntries bounds how many users' authenticated clients are kept
+	apiClientCacheMaxEntries = 10000
+
+	// apiClientCacheTimeout matches Google's access token lifetime; a client for an older
+	// token would only be reused after its token has been replaced anyway
+	apiClientCacheTimeout = time.Hour
+)
+
+// cachedAPIClient is an authenticated client built for one pair of tokens
+type cachedAPIClient struct {
+	accessToken  string
+	refreshToken string
+	client       *http.Client
+}
+
+// apiTransport is shared by every Google API and token request. http.DefaultTransport keeps
+// only 2 idle connections per host, so concurrent GSC calls for different users kept
+// redialing googleapis.com; a larger idle pool lets them reuse warm TLS connections
+var apiTransport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 100
+	t.MaxIdleConnsPerHost = 20
+	return t
+}()
+
+// apiHTTPClient is the base client that oauth2 wraps for token exchange, refresh and API calls
+var apiHTTPClient = &http.Client{Transport: apiTransport}
+
+// withAPIClient makes oauth2 use the shared pooled client for requests made with ctx
+func withAPIClient(ctx context.Context) context.Context {
+	return context.WithValue(ctx, oauth2.HTTPClient, apiHTTPClient)
 }
 
 // UserInfo represents Google user profile
@@ -50,37 +93,44 @@ func NewOAuthClient(clientID, clientSecret, redirectURI string) *OAuthClient {
 			},
 			Endpoint: google.Endpoint,
 		},
+		authURLOpts: []oauth2.AuthCodeOption{
+			oauth2.AccessTypeOffline, // Request refresh token
+			oauth2.ApprovalForce,     // Force consent screen for refresh token
+			oauth2.SetAuthURLParam("prompt", "consent"),
+		},
+		consentURLOpts:  promptURLOpts("consent"),
+		rememberURLOpts: promptURLOpts("none"),
+		clients:         lru.New[string, cachedAPIClient](apiClientCacheMaxEntries, apiClientCacheTimeout),
+	}
+}
+
+// promptURLOpts builds the device trust authorization URL options for a prompt value (1:1 with Python)
+func promptURLOpts(prompt string) []oauth2.AuthCodeOption {
+	return []oauth2.AuthCodeOption{
+		oauth2.AccessTypeOffline,
+		oauth2.SetAuthURLParam("prompt", prompt),
+		oauth2.SetAuthURLParam("include_granted_scopes", "true"), // Enable incremental authorization
 	}
 }
 
 // GetAuthURL generates the Google OAuth authorization URL
 func (c *OAuthClient) GetAuthURL(state string) string {
-	return c.config.AuthCodeURL(state,
-		oauth2.AccessTypeOffline,   // Request refresh token
-		oauth2.ApprovalForce,       // Force consent screen for refresh token
-		oauth2.SetAuthURLParam("prompt", "consent"),
-	)
+	return c.config.AuthCodeURL(state, c.authURLOpts...)
 }
 
 // GetAuthURLWithPrompt generates OAuth URL with device trust support (1:1 with Python)
 // For returning users with trusted devices: prompt='none' (skip consent)
 // For new devices or forced re-auth: prompt='consent' to ensure refresh tokens
 func (c *OAuthClient) GetAuthURLWithPrompt(state string, rememberDevice bool) string {
-	promptValue := "consent"
 	if rememberDevice {
-		promptValue = "none"
+		return c.config.AuthCodeURL(state, c.rememberURLOpts...)
 	}
-
-	return c.config.AuthCodeURL(state,
-		oauth2.AccessTypeOffline,
-		oauth2.SetAuthURLParam("prompt", promptValue),
-		oauth2.SetAuthURLParam("include_granted_scopes", "true"), // Enable incremental authorization
-	)
+	return c.config.AuthCodeURL(state, c.consentURLOpts...)
 }
 
 // ExchangeCode exchanges authorization code for tokens
 func (c *OAuthClient) ExchangeCode(ctx context.Context, code string) (*TokenResponse, error) {
-	token, err := c.config.Exchange(ctx, code)
+	token, err := c.config.Exchange(withAPIClient(ctx), code)
 	if err != nil {
 		return nil, fmt.Errorf("failed to exchange code: %w", err)
 	}
@@ -99,7 +149,7 @@ func (c *OAuthClient) RefreshToken(ctx context.Context, refreshToken string) (*T
 		RefreshToken: refreshToken,
 	}
 
-	tokenSource := c.config.TokenSource(ctx, token)
+	tokenSource := c.config.TokenSource(withAPIClient(ctx), token)
 	newToken, err := tokenSource.Token()
 	if err != nil {
 		return nil, fmt.Errorf("failed to refresh token: %w", err)
@@ -115,7 +165,7 @@ func (c *OAuthClient) RefreshToken(ctx context.Context, refreshToken string) (*T
 
 // GetUserInfo fetches user profile from Google
 func (c *OAuthClient) GetUserInfo(ctx context.Context, accessToken string) (*UserInfo, error) {
-	client := c.config.Client(ctx, &oauth2.Token{AccessToken: accessToken})
+	client := c.config.Client(withAPIClient(ctx), &oauth2.Token{AccessToken: accessToken})
 
 	resp, err := client.Get("https://www.googleapis.com/oauth2/v2/userinfo")
 	if err != nil {
@@ -135,13 +185,32 @@ func (c *OAuthClient) GetUserInfo(ctx context.Context, accessToken string) (*Use
 	return &userInfo, nil
 }
 
-// GetHTTPClient returns an authenticated HTTP client for API calls
-func (c *OAuthClient) GetHTTPClient(ctx context.Context, accessToken, refreshToken string) *http.Client {
+// GetHTTPClient returns an authenticated HTTP client for userEmail's API calls
+// Every GSC call builds one, so the client for a user's current tokens is kept and
+// reused until the tokens change instead of wrapping a new token source each time
+func (c *OAuthClient) GetHTTPClient(ctx context.Context, userEmail, accessToken, refreshToken string) *http.Client {
 	token := &oauth2.Token{
 		AccessToken:  accessToken,
 		RefreshToken: refreshToken,
 		TokenType:    "Bearer",
 	}
 
-	return c.config.Client(ctx, token)
+	if refreshToken == "" {
+		return c.config.Client(withAPIClient(ctx), token)
+	}
+
+	if cached, ok := c.clients.Get(userEmail); ok && cached.accessToken == accessToken && cached.refreshToken == refreshToken {
+		return cached.client
+	}
+
+	// The cached client outlives this request, so it must not hold on to the request context
+	client := c.config.Client(withAPIClient(context.Background()), token)
+	c.clients.Set(userEmail, cachedAPIClient{accessToken: accessToken, refreshToken: refreshToken, client: client})
+
+	return client
+}
+
+// ForgetHTTPClient drops the cached client for userEmail, e.g. once their tokens are deleted
+func (c *OAuthClient) ForgetHTTPClient(userEmail string) {
+	c.clients.Delete(userEmail)
 }
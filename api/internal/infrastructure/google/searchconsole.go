@@ -6,8 +6,12 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"math/rand"
 	"net/http"
 	"net/url"
+	"sort"
+	"strconv"
+	"sync"
 	"time"
 
 	"github.com/rs/zerolog/log"
@@ -17,19 +21,22 @@ import (
 const (
 	maxRetries        = 3           // max_retries = 3 in Python
 	baseRetryDelay    = 2 * time.Second // retry_delay = 2 in Python
-	rateLimitDelay    = 60 * time.Second // Wait time for 429 rate limit
+	rateLimitDelay    = 60 * time.Second // Wait time for 429 rate limit (background work)
 	rowLimit          = 25000       // row_limit = 25000 in Python
 )
 
 // SearchConsoleClient handles Google Search Console API operations
 type SearchConsoleClient struct {
-	baseURL string
+	baseURL  string
+	sitesURL string
 }
 
 // NewSearchConsoleClient creates a new GSC client
 func NewSearchConsoleClient() *SearchConsoleClient {
+	baseURL := "https://www.googleapis.com/webmasters/v3"
 	return &SearchConsoleClient{
-		baseURL: "https://www.googleapis.com/webmasters/v3",
+		baseURL:  baseURL,
+		sitesURL: baseURL + "/sites",
 	}
 }
 
@@ -137,14 +144,7 @@ type Changes28Day struct {
 
 // GetSites returns all sites the user has access to
 func (c *SearchConsoleClient) GetSites(ctx context.Context, client *http.Client) ([]Site, error) {
-	url := fmt.Sprintf("%s/sites", c.baseURL)
-
-	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create request: %w", err)
-	}
-
-	resp, err := client.Do(req)
+	resp, err := doWithRetry(ctx, client, "GET", c.sitesURL, nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get sites: %w", err)
 	}
@@ -205,8 +205,7 @@ func (c *SearchConsoleClient) querySearchAnalytics(ctx context.Context, client *
 // querySearchAnalyticsWithPagination performs a search analytics query with pagination (1:1 with Python)
 func (c *SearchConsoleClient) querySearchAnalyticsWithPagination(ctx context.Context, client *http.Client, siteURL string, startDate, endDate time.Time, dimensions []string, limit int, startRow int) ([]SearchAnalyticsRow, error) {
 	// URL-encode the site URL for the path (GSC API requirement)
-	encodedSiteURL := url.PathEscape(siteURL)
-	apiURL := fmt.Sprintf("%s/sites/%s/searchAnalytics/query", c.baseURL, encodedSiteURL)
+	apiURL := c.baseURL + "/sites/" + url.PathEscape(siteURL) + "/searchAnalytics/query"
 
 	reqBody := SearchAnalyticsRequest{
 		StartDate:  startDate.Format("2006-01-02"),
@@ -227,13 +226,7 @@ func (c *SearchConsoleClient) querySearchAnalyticsWithPagination(ctx context.Con
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	req, err := http.NewRequestWithContext(ctx, "POST", apiURL, bytes.NewReader(bodyBytes))
-	if err != nil {
-		return nil, fmt.Errorf("failed to create request: %w", err)
-	}
-	req.Header.Set("Content-Type", "application/json")
-
-	resp, err := client.Do(req)
+	resp, err := doWithRetry(ctx, client, "POST", apiURL, bodyBytes)
 	if err != nil {
 		return nil, fmt.Errorf("search analytics request failed: %w", err)
 	}
@@ -263,8 +256,29 @@ func (c *SearchConsoleClient) querySearchAnalyticsWithPagination(ctx context.Con
 // CTR = total_clicks / total_impressions (NOT average of individual row CTRs)
 // Position = sum(position * impressions) / total_impressions (weighted average)
 func (c *SearchConsoleClient) GetAggregatedMetrics(ctx context.Context, client *http.Client, siteURL string, startDate, endDate time.Time, withComparison bool) (*AggregatedMetrics, error) {
+	// The comparison period is independent of the current one, so fetch it concurrently
+	// and pay for one round trip instead of two
+	var (
+		wg       sync.WaitGroup
+		prevRows []SearchAnalyticsRow
+		prevErr  error
+	)
+	if withComparison {
+		// Calculate comparison period (same length, immediately before)
+		periodDuration := endDate.Sub(startDate)
+		prevEndDate := startDate.AddDate(0, 0, -1)
+		prevStartDate := prevEndDate.Add(-periodDuration)
+
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			prevRows, prevErr = c.querySearchAnalytics(ctx, client, siteURL, prevStartDate, prevEndDate, []string{"query"}, 25000)
+		}()
+	}
+
 	// Fetch current period data with dimensions to get individual rows
 	rows, err := c.querySearchAnalytics(ctx, client, siteURL, startDate, endDate, []string{"query"}, 25000)
+	wg.Wait()
 	if err != nil {
 		return nil, err
 	}
@@ -272,28 +286,20 @@ func (c *SearchConsoleClient) GetAggregatedMetrics(ctx context.Context, client *
 	// Calculate current period metrics using GSC-exact method
 	current := c.calculateAggregatedFromRows(rows)
 
-	// If comparison requested, fetch previous period
-	if withComparison {
-		// Calculate comparison period (same length, immediately before)
-		periodDuration := endDate.Sub(startDate)
-		prevEndDate := startDate.AddDate(0, 0, -1)
-		prevStartDate := prevEndDate.Add(-periodDuration)
-
-		prevRows, err := c.querySearchAnalytics(ctx, client, siteURL, prevStartDate, prevEndDate, []string{"query"}, 25000)
-		if err == nil && len(prevRows) > 0 {
-			prev := c.calculateAggregatedFromRows(prevRows)
+	// If comparison requested, apply previous period
+	if withComparison && prevErr == nil && len(prevRows) > 0 {
+		prev := c.calculateAggregatedFromRows(prevRows)
 
-			current.ComparisonClicks = prev.TotalClicks
-			current.ComparisonImpressions = prev.TotalImpressions
-			current.ComparisonCTR = prev.AverageCTR
-			current.ComparisonPosition = prev.AveragePosition
+		current.ComparisonClicks = prev.TotalClicks
+		current.ComparisonImpressions = prev.TotalImpressions
+		current.ComparisonCTR = prev.AverageCTR
+		current.ComparisonPosition = prev.AveragePosition
 
-			// Calculate changes EXACTLY like Python
-			current.ClicksChange = current.TotalClicks - prev.TotalClicks
-			current.ImpressionsChange = current.TotalImpressions - prev.TotalImpressions
-			current.CTRChange = current.AverageCTR - prev.AverageCTR
-			current.PositionChange = current.AveragePosition - prev.AveragePosition
-		}
+		// Calculate changes EXACTLY like Python
+		current.ClicksChange = current.TotalClicks - prev.TotalClicks
+		current.ImpressionsChange = current.TotalImpressions - prev.TotalImpressions
+		current.CTRChange = current.AverageCTR - prev.AverageCTR
+		current.PositionChange = current.AveragePosition - prev.AveragePosition
 	}
 
 	return current, nil
@@ -344,7 +350,7 @@ func (c *SearchConsoleClient) GetTimeSeriesMetrics(ctx context.Context, client *
 		return nil, err
 	}
 
-	var metrics []DailyMetric
+	metrics := make([]DailyMetric, 0, len(rows))
 	for _, row := range rows {
 		if len(row.Keys) > 0 {
 			metrics = append(metrics, DailyMetric{
@@ -363,15 +369,32 @@ func (c *SearchConsoleClient) GetTimeSeriesMetrics(ctx context.Context, client *
 	return metrics, nil
 }
 
+// MetricsFromDailyMetrics sums a date-dimensioned time series into period totals,
+// so callers that already fetch the time series don't need a second summary query
+// CTR = total_clicks / total_impressions, Position = weighted by impressions (like GSC)
+func MetricsFromDailyMetrics(daily []DailyMetric) *Metrics {
+	var clicks, impressions int
+	var positionSum float64
+	for _, d := range daily {
+		clicks += d.Clicks
+		impressions += d.Impressions
+		positionSum += d.Position * float64(d.Impressions)
+	}
+
+	metrics := &Metrics{Clicks: clicks, Impressions: impressions}
+	if impressions > 0 {
+		metrics.CTR = float64(clicks) / float64(impressions)
+		metrics.Position = positionSum / float64(impressions)
+	}
+	return metrics
+}
+
 // sortDailyMetrics sorts daily metrics by date ascending
+// Dates are YYYY-MM-DD strings, so lexical order is chronological
 func sortDailyMetrics(metrics []DailyMetric) {
-	for i := 0; i < len(metrics)-1; i++ {
-		for j := i + 1; j < len(metrics); j++ {
-			if metrics[i].Date > metrics[j].Date {
-				metrics[i], metrics[j] = metrics[j], metrics[i]
-			}
-		}
-	}
+	sort.Slice(metrics, func(i, j int) bool {
+		return metrics[i].Date < metrics[j].Date
+	})
 }
 
 // Calculate28DayChanges calculates V1 (first day) vs V2 (last day) changes
@@ -548,91 +571,130 @@ func (c *SearchConsoleClient) GetFilteredMetrics(ctx context.Context, client *ht
 // Includes retry logic with exponential backoff (1:1 with Python _make_gsc_request)
 func (c *SearchConsoleClient) querySearchAnalyticsWithFilters(ctx context.Context, client *http.Client, siteURL string, reqBody SearchAnalyticsRequest) ([]SearchAnalyticsRow, error) {
 	// URL-encode the site URL for the path (GSC API requirement)
-	encodedSiteURL := url.PathEscape(siteURL)
-	apiURL := fmt.Sprintf("%s/sites/%s/searchAnalytics/query", c.baseURL, encodedSiteURL)
+	apiURL := c.baseURL + "/sites/" + url.PathEscape(siteURL) + "/searchAnalytics/query"
 
 	bodyBytes, err := json.Marshal(reqBody)
 	if err != nil {
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
+	resp, err := doWithRetry(ctx, client, "POST", apiURL, bodyBytes)
+	if err != nil {
+		return nil, err
+	}
+	defer resp.Body.Close()
+
+	// Handle client errors (4xx except 429) - don't retry
+	if resp.StatusCode >= 400 {
+		body, _ := io.ReadAll(resp.Body)
+		return nil, fmt.Errorf("client error (status %d): %s", resp.StatusCode, string(body))
+	}
+
+	if resp.StatusCode != http.StatusOK {
+		body, _ := io.ReadAll(resp.Body)
+		return nil, fmt.Errorf("search analytics failed with status: %d, body: %s", resp.StatusCode, string(body))
+	}
+
+	var analyticsResp SearchAnalyticsResponse
+	if err := json.NewDecoder(resp.Body).Decode(&analyticsResp); err != nil {
+		return nil, fmt.Errorf("failed to decode response: %w", err)
+	}
+
+	return analyticsResp.Rows, nil
+}
+
+// interactiveRateLimitDelay is the longest 429 wait while a user is waiting on the request
+const interactiveRateLimitDelay = 5 * time.Second
+
+// backgroundRetryKey marks a context as background work in doWithRetry
+type backgroundRetryKey struct{}
+
+// WithBackgroundRetries marks ctx as background work (e.g. an audit), which may wait out a 429
+// for up to rateLimitDelay. Other requests have a user waiting and wait at most
+// interactiveRateLimitDelay.
+func WithBackgroundRetries(ctx context.Context) context.Context {
+	return context.WithValue(ctx, backgroundRetryKey{}, true)
+}
+
+// rateLimitWait returns how long to wait after a 429: the Retry-After the server sent, or
+// rateLimitDelay without one, capped at what the kind of request in ctx can afford
+func rateLimitWait(ctx context.Context, resp *http.Response) time.Duration {
+	wait := rateLimitDelay
+	if retryAfter := resp.Header.Get("Retry-After"); retryAfter != "" {
+		if seconds, err := strconv.Atoi(retryAfter); err == nil {
+			wait = time.Duration(seconds) * time.Second
+		} else if at, err := http.ParseTime(retryAfter); err == nil {
+			wait = time.Until(at)
+		}
+	}
+
+	limit := interactiveRateLimitDelay
+	if background, _ := ctx.Value(backgroundRetryKey{}).(bool); background {
+		limit = rateLimitDelay
+	}
+	return min(max(wait, 0), limit)
+}
+
+// backoffDelay returns the wait before retrying after the given (zero-based) attempt:
+// exponential from baseRetryDelay (2s, 4s, 8s...) with up to 50% jitter, so requests
+// that failed together don't all retry at the same moment
+func backoffDelay(attempt int) time.Duration {
+	delay := baseRetryDelay * time.Duration(1<<attempt)
+	return delay/2 + time.Duration(rand.Int63n(int64(delay/2)+1))
+}
+
+// doWithRetry sends a GSC API request, retrying transient failures (1:1 with Python _make_gsc_request):
+// network errors and 5xx responses with exponential backoff, 429 responses after rateLimitWait.
+// A retry that would not finish before ctx's deadline is not attempted.
+// Any other response, including 401/403, is returned to the caller without retrying, so only
+// genuine auth failures reach the token refresh logic. body may be nil.
+func doWithRetry(ctx context.Context, client *http.Client, method, apiURL string, body []byte) (*http.Response, error) {
 	var lastErr error
+	var delay time.Duration
 
-	// Retry loop with exponential backoff (1:1 with Python)
 	for attempt := 0; attempt < maxRetries; attempt++ {
+		if attempt > 0 {
+			if deadline, ok := ctx.Deadline(); ok && time.Until(deadline) < delay {
+				return nil, fmt.Errorf("not retrying past the request deadline: %w", lastErr)
+			}
+			select {
+			case <-ctx.Done():
+				return nil, ctx.Err()
+			case <-time.After(delay):
+			}
+		}
+
 		// Create new request for each attempt
-		req, err := http.NewRequestWithContext(ctx, "POST", apiURL, bytes.NewReader(bodyBytes))
+		var bodyReader io.Reader
+		if body != nil {
+			bodyReader = bytes.NewReader(body)
+		}
+		req, err := http.NewRequestWithContext(ctx, method, apiURL, bodyReader)
 		if err != nil {
 			return nil, fmt.Errorf("failed to create request: %w", err)
 		}
-		req.Header.Set("Content-Type", "application/json")
-
-		resp, err := client.Do(req)
-		if err != nil {
-			lastErr = fmt.Errorf("search analytics request failed (attempt %d/%d): %w", attempt+1, maxRetries, err)
-			// Wait before retry with exponential backoff
-			if attempt < maxRetries-1 {
-				delay := baseRetryDelay * time.Duration(1<<attempt) // 2s, 4s, 8s...
-				select {
-				case <-ctx.Done():
-					return nil, ctx.Err()
-				case <-time.After(delay):
-				}
-			}
-			continue
+		if body != nil {
+			req.Header.Set("Content-Type", "application/json")
 		}
 
-		// Handle rate limiting (429 status) - 1:1 with Python
-		if resp.StatusCode == http.StatusTooManyRequests {
+		resp, err := client.Do(req)
+		switch {
+		case err != nil:
+			lastErr = fmt.Errorf("request failed (attempt %d/%d): %w", attempt+1, maxRetries, err)
+			delay = backoffDelay(attempt)
+		case resp.StatusCode == http.StatusTooManyRequests:
+			// Handle rate limiting (429 status) - 1:1 with Python
 			resp.Body.Close()
 			lastErr = fmt.Errorf("rate limit exceeded (429) on attempt %d/%d", attempt+1, maxRetries)
-			if attempt < maxRetries-1 {
-				select {
-				case <-ctx.Done():
-					return nil, ctx.Err()
-				case <-time.After(rateLimitDelay):
-				}
-			}
-			continue
-		}
-
-		// Handle server errors (5xx) - retry
-		if resp.StatusCode >= 500 {
-			body, _ := io.ReadAll(resp.Body)
+			delay = rateLimitWait(ctx, resp)
+		case resp.StatusCode >= 500:
+			respBody, _ := io.ReadAll(resp.Body)
 			resp.Body.Close()
-			lastErr = fmt.Errorf("server error (status %d) on attempt %d/%d: %s", resp.StatusCode, attempt+1, maxRetries, string(body))
-			if attempt < maxRetries-1 {
-				delay := baseRetryDelay * time.Duration(1<<attempt)
-				select {
-				case <-ctx.Done():
-					return nil, ctx.Err()
-				case <-time.After(delay):
-				}
-			}
-			continue
-		}
-
-		// Handle client errors (4xx except 429) - don't retry
-		if resp.StatusCode >= 400 && resp.StatusCode != http.StatusTooManyRequests {
-			body, _ := io.ReadAll(resp.Body)
-			resp.Body.Close()
-			return nil, fmt.Errorf("client error (status %d): %s", resp.StatusCode, string(body))
-		}
-
-		// Success - parse response
-		defer resp.Body.Close()
-
-		if resp.StatusCode != http.StatusOK {
-			body, _ := io.ReadAll(resp.Body)
-			return nil, fmt.Errorf("search analytics failed with status: %d, body: %s", resp.StatusCode, string(body))
+			lastErr = fmt.Errorf("server error (status %d) on attempt %d/%d: %s", resp.StatusCode, attempt+1, maxRetries, string(respBody))
+			delay = backoffDelay(attempt)
+		default:
+			return resp, nil
 		}
-
-		var analyticsResp SearchAnalyticsResponse
-		if err := json.NewDecoder(resp.Body).Decode(&analyticsResp); err != nil {
-			return nil, fmt.Errorf("failed to decode response: %w", err)
-		}
-
-		return analyticsResp.Rows, nil
 	}
 
 	// All retries exhausted
@@ -0,0 +1,180 @@
+package google
+
+import (
+	"context"
+	"io"
+	"math"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// TestMetricsFromDailyMetrics verifies daily rows sum into period totals with CTR from the
+// totals and position weighted by impressions, matching GSC's own summary
+func TestMetricsFromDailyMetrics(t *testing.T) {
+	tests := []struct {
+		name     string
+		daily    []DailyMetric
+		expected Metrics
+	}{
+		{"no data", nil, Metrics{}},
+		{
+			"single day",
+			[]DailyMetric{{Date: "2024-01-01", Clicks: 5, Impressions: 100, CTR: 0.05, Position: 4}},
+			Metrics{Clicks: 5, Impressions: 100, CTR: 0.05, Position: 4},
+		},
+		{
+			// Unweighted mean position would be 11 and mean CTR ~0.056
+			"impression-weighted position",
+			[]DailyMetric{
+				{Date: "2024-01-01", Clicks: 10, Impressions: 900, CTR: 0.0111, Position: 2},
+				{Date: "2024-01-02", Clicks: 10, Impressions: 100, CTR: 0.1, Position: 20},
+			},
+			Metrics{Clicks: 20, Impressions: 1000, CTR: 0.02, Position: 3.8},
+		},
+		{
+			"days without impressions",
+			[]DailyMetric{
+				{Date: "2024-01-01", Clicks: 0, Impressions: 0, Position: 0},
+				{Date: "2024-01-02", Clicks: 3, Impressions: 60, CTR: 0.05, Position: 7},
+			},
+			Metrics{Clicks: 3, Impressions: 60, CTR: 0.05, Position: 7},
+		},
+		{
+			"no impressions at all",
+			[]DailyMetric{{Date: "2024-01-01", Position: 12}},
+			Metrics{},
+		},
+	}
+
+	for _, tt := range tests {
+		result := MetricsFromDailyMetrics(tt.daily)
+		if result.Clicks != tt.expected.Clicks || result.Impressions != tt.expected.Impressions {
+			t.Errorf("%s: expected %d clicks / %d impressions, got %d / %d",
+				tt.name, tt.expected.Clicks, tt.expected.Impressions, result.Clicks, result.Impressions)
+		}
+		if math.Abs(result.CTR-tt.expected.CTR) > 1e-9 {
+			t.Errorf("%s: expected CTR %v, got %v", tt.name, tt.expected.CTR, result.CTR)
+		}
+		if math.Abs(result.Position-tt.expected.Position) > 1e-9 {
+			t.Errorf("%s: expected position %v, got %v", tt.name, tt.expected.Position, result.Position)
+		}
+	}
+}
+
+// retryServer answers each request with the next status in statuses (200 once they run out),
+// setting retryAfter on 429 responses, and counts the requests it receives
+func retryServer(t *testing.T, retryAfter string, statuses ...int) (*httptest.Server, *atomic.Int32) {
+	var calls atomic.Int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		n := int(calls.Add(1))
+		if body, _ := io.ReadAll(r.Body); r.Method == http.MethodPost && string(body) != `{"rowLimit":1}` {
+			t.Errorf("Attempt %d: expected request body to be resent, got %q", n, body)
+		}
+		if n > len(statuses) {
+			w.WriteHeader(http.StatusOK)
+			return
+		}
+		if statuses[n-1] == http.StatusTooManyRequests {
+			w.Header().Set("Retry-After", retryAfter)
+		}
+		w.WriteHeader(statuses[n-1])
+	}))
+	t.Cleanup(server.Close)
+	return server, &calls
+}
+
+// TestDoWithRetry verifies which responses are retried and what the caller gets back
+func TestDoWithRetry(t *testing.T) {
+	tests := []struct {
+		name           string
+		statuses       []int
+		expectedStatus int // 0 when an error is expected
+		expectedCalls  int32
+	}{
+		{"success", nil, http.StatusOK, 1},
+		{"429 then success", []int{http.StatusTooManyRequests}, http.StatusOK, 2},
+		{"5xx then success", []int{http.StatusServiceUnavailable}, http.StatusOK, 2},
+		{"401 is not retried", []int{http.StatusUnauthorized}, http.StatusUnauthorized, 1},
+		{"retries exhausted", []int{http.StatusTooManyRequests, http.StatusTooManyRequests, http.StatusTooManyRequests}, 0, maxRetries},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			server, calls := retryServer(t, "0", tt.statuses...)
+
+			resp, err := doWithRetry(context.Background(), server.Client(), http.MethodPost, server.URL, []byte(`{"rowLimit":1}`))
+			if tt.expectedStatus == 0 {
+				if err == nil {
+					resp.Body.Close()
+					t.Error("Expected an error after exhausting retries")
+				}
+			} else if err != nil {
+				t.Errorf("Expected status %d, got error %v", tt.expectedStatus, err)
+			} else {
+				resp.Body.Close()
+				if resp.StatusCode != tt.expectedStatus {
+					t.Errorf("Expected status %d, got %d", tt.expectedStatus, resp.StatusCode)
+				}
+			}
+
+			if got := calls.Load(); got != tt.expectedCalls {
+				t.Errorf("Expected %d requests, got %d", tt.expectedCalls, got)
+			}
+		})
+	}
+}
+
+// TestDoWithRetryRespectsDeadline verifies a 429 whose wait outlasts the request deadline
+// fails straight away instead of sleeping through it
+func TestDoWithRetryRespectsDeadline(t *testing.T) {
+	server, calls := retryServer(t, "3", http.StatusTooManyRequests)
+
+	ctx, cancel := context.WithTimeout(context.Background(), time.Second)
+	defer cancel()
+
+	start := time.Now()
+	_, err := doWithRetry(ctx, server.Client(), http.MethodGet, server.URL, nil)
+	if err == nil {
+		t.Fatal("Expected an error when the retry would pass the deadline")
+	}
+	if elapsed := time.Since(start); elapsed > 500*time.Millisecond {
+		t.Errorf("Expected to give up without waiting, took %v", elapsed)
+	}
+	if got := calls.Load(); got != 1 {
+		t.Errorf("Expected 1 request, got %d", got)
+	}
+}
+
+// TestRateLimitWait verifies Retry-After is honored and capped by the kind of request
+func TestRateLimitWait(t *testing.T) {
+	background := WithBackgroundRetries(context.Background())
+
+	tests := []struct {
+		name       string
+		ctx        context.Context
+		retryAfter string
+		expected   time.Duration
+	}{
+		{"interactive without header", context.Background(), "", interactiveRateLimitDelay},
+		{"background without header", background, "", rateLimitDelay},
+		{"interactive short wait", context.Background(), "2", 2 * time.Second},
+		{"interactive long wait is capped", context.Background(), "120", interactiveRateLimitDelay},
+		{"background long wait is capped", background, "120", rateLimitDelay},
+		{"background wait within limit", background, "30", 30 * time.Second},
+		{"date in the past", context.Background(), "Mon, 01 Jan 2024 00:00:00 GMT", 0},
+		{"unparseable header", background, "soon", rateLimitDelay},
+	}
+
+	for _, tt := range tests {
+		resp := &http.Response{Header: http.Header{}}
+		if tt.retryAfter != "" {
+			resp.Header.Set("Retry-After", tt.retryAfter)
+		}
+		if result := rateLimitWait(tt.ctx, resp); result != tt.expected {
+			t.Errorf("%s: expected %v, got %v", tt.name, tt.expected, result)
+		}
+	}
+}
@@ -10,6 +10,7 @@ import (
 	"time"
 
 	"github.com/jung-kurt/gofpdf"
+	"github.com/rs/zerolog/log"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/audit/domain"
 	auditPDF "github.com/petpeevephobia/solvia-v2/api/internal/modules/audit/pdf"
@@ -23,6 +24,10 @@ import (
 type Generator struct {
 	outputDir string
 	iconPath  string
+	// iconData holds the icon file read once when the path is resolved (nil if it
+	// couldn't be read), so report generation doesn't go back to disk for every PDF
+	iconData []byte
+	iconType string
 }
 
 // NewGenerator creates a new PDF generator
@@ -45,26 +50,34 @@ func NewGenerator(outputDir string) *Generator {
 	var iconPath string
 	for _, p := range possiblePaths {
 		if _, err := os.Stat(p); err == nil {
+			// Resolve once so later reports don't depend on the working directory
+			if abs, err := filepath.Abs(p); err == nil {
+				p = abs
+			}
 			iconPath = p
-			fmt.Printf("[PDF] Found icon at: %s\n", p)
+			log.Debug().Str("path", p).Msg("[PDF] Found icon")
 			break
 		}
 	}
 
 	if iconPath == "" {
-		fmt.Printf("[PDF] Warning: orange-emblem.png not found in any expected location\n")
+		log.Warn().Msg("[PDF] orange-emblem.png not found in any expected location")
 		iconPath = "static/images/orange-emblem.png" // fallback
 	}
 
-	return &Generator{
-		outputDir: outputDir,
-		iconPath:  iconPath,
-	}
+	g := &Generator{outputDir: outputDir}
+	g.SetIconPath(iconPath)
+	return g
 }
 
-// SetIconPath sets a custom icon path
+// SetIconPath sets a custom icon path and loads the icon into memory
 func (g *Generator) SetIconPath(path string) {
 	g.iconPath = path
+	g.iconData = nil
+	if data, err := os.ReadFile(path); err == nil {
+		g.iconData = data
+		g.iconType = strings.TrimPrefix(filepath.Ext(path), ".")
+	}
 }
 
 // ReportData contains all data needed for PDF generation
@@ -362,38 +375,36 @@ func (g *Generator) drawSummary(pdf *gofpdf.Fpdf, y float64, data *ReportData) f
 	return y
 }
 
+// pdfTextReplacer maps Unicode characters to ASCII equivalents for sanitizeTextForPDF.
+// Built once and applied in a single pass instead of a ReplaceAll per character
+var pdfTextReplacer = strings.NewReplacer(
+	"\u2014", "-", // Em-dash
+	"\u2013", "-", // En-dash
+	"\u201C", "\"", // Left double quote
+	"\u201D", "\"", // Right double quote
+	"\u2018", "'", // Left single quote
+	"\u2019", "'", // Right single quote
+	"\u2026", "...", // Ellipsis
+	"\u2022", "*", // Bullet
+	"\u00A0", " ", // Non-breaking space
+	"\u2122", "(TM)", // Trademark
+	"\u00AE", "(R)", // Registered
+	"\u00A9", "(C)", // Copyright
+	"\u00B0", "deg", // Degree
+	"\u00B1", "+/-", // Plus-minus
+	"\u00D7", "x", // Multiplication
+	"\u00F7", "/", // Division
+	"\u2192", "->", // Right arrow
+	"\u2190", "<-", // Left arrow
+	"\u2191", "^", // Up arrow
+	"\u2193", "v", // Down arrow
+)
+
 // sanitizeTextForPDF replaces Unicode characters with ASCII equivalents
 // gofpdf doesn't handle Unicode well with default fonts (causes index out of range panic)
 // 1:1 with Python: FPDF also has issues with Unicode, Python uses latin-1 encoding
 func sanitizeTextForPDF(text string) string {
-	replacements := map[string]string{
-		"\u2014": "-",   // Em-dash
-		"\u2013": "-",   // En-dash
-		"\u201C": "\"",  // Left double quote
-		"\u201D": "\"",  // Right double quote
-		"\u2018": "'",   // Left single quote
-		"\u2019": "'",   // Right single quote
-		"\u2026": "...", // Ellipsis
-		"\u2022": "*",   // Bullet
-		"\u00A0": " ",   // Non-breaking space
-		"\u2122": "(TM)", // Trademark
-		"\u00AE": "(R)",  // Registered
-		"\u00A9": "(C)",  // Copyright
-		"\u00B0": "deg",  // Degree
-		"\u00B1": "+/-",  // Plus-minus
-		"\u00D7": "x",    // Multiplication
-		"\u00F7": "/",    // Division
-		"\u2192": "->",   // Right arrow
-		"\u2190": "<-",   // Left arrow
-		"\u2191": "^",    // Up arrow
-		"\u2193": "v",    // Down arrow
-	}
-
-	result := text
-	for unicodeChar, asciiChar := range replacements {
-		result = strings.ReplaceAll(result, unicodeChar, asciiChar)
-	}
-	return result
+	return pdfTextReplacer.Replace(text)
 }
 
 // BoldSegment represents a text segment that may be bold or regular
@@ -402,13 +413,15 @@ type BoldSegment struct {
 	IsBold bool
 }
 
+// boldMarkdownRegex matches **bold** spans for parseBoldText
+var boldMarkdownRegex = regexp.MustCompile(`\*\*(.*?)\*\*`)
+
 // parseBoldText parses markdown **bold** into segments (1:1 with Python re.sub)
 func (g *Generator) parseBoldText(text string) []BoldSegment {
 	var segments []BoldSegment
-	re := regexp.MustCompile(`\*\*(.*?)\*\*`)
 
 	lastEnd := 0
-	matches := re.FindAllStringSubmatchIndex(text, -1)
+	matches := boldMarkdownRegex.FindAllStringSubmatchIndex(text, -1)
 
 	for _, match := range matches {
 		// Text before this bold segment
@@ -710,10 +723,13 @@ func (g *Generator) drawQuoteBox(pdf *gofpdf.Fpdf, y float64, quote string) floa
 
 	// Draw icon at TOP-LEFT (aligned with top of quote bubble)
 	iconY := y // Icon starts at same Y as bubble top
-	if _, err := os.Stat(g.iconPath); err == nil {
-		pdf.Image(g.iconPath, x, iconY, QuoteIconSize, QuoteIconSize, false, "", 0, "")
+	if g.iconData != nil {
+		// Register from the in-memory copy; gofpdf keeps it for the rest of the document
+		opts := gofpdf.ImageOptions{ImageType: g.iconType}
+		pdf.RegisterImageOptionsReader(g.iconPath, opts, bytes.NewReader(g.iconData))
+		pdf.ImageOptions(g.iconPath, x, iconY, QuoteIconSize, QuoteIconSize, false, opts, 0, "")
 	} else {
-		fmt.Printf("[PDF] Warning: Icon not found at %s\n", g.iconPath)
+		log.Warn().Str("path", g.iconPath).Msg("[PDF] Icon not found")
 	}
 
 	// Draw text centered vertically in bubble (1:1 with Python)
@@ -6,6 +6,8 @@ import (
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"strconv"
+	"strings"
 	"time"
 
 	"github.com/jackc/pgx/v5/pgxpool"
@@ -205,20 +207,27 @@ func (a *Agent) BuildContext(results []SearchResult) string {
 		return ""
 	}
 
-	var context string
-	totalLength := 0
-
+	// Size the buffer for the chunks that fit up front, so each multi-KB chunk is copied
+	// once instead of re-copying the whole context on every append
+	n, size := 0, 0
 	for _, result := range results {
-		if totalLength+len(result.Content) > a.config.MaxContextLength {
+		if size+len(result.Content) > a.config.MaxContextLength {
 			break
 		}
+		size += len(result.Content)
+		n++
+	}
 
-		context += fmt.Sprintf("\n[Source: %s, Relevance: %.2f]\n%s\n",
-			result.Collection, result.Relevance, result.Content)
-		totalLength += len(result.Content)
+	var b strings.Builder
+	b.Grow(size + n*64) // source header per chunk
+
+	for _, result := range results[:n] {
+		fmt.Fprintf(&b, "\n[Source: %s, Relevance: %.2f]\n", result.Collection, result.Relevance)
+		b.WriteString(result.Content)
+		b.WriteString("\n")
 	}
 
-	return context
+	return b.String()
 }
 
 // GetRAGContext gets relevant context for a query (1:1 with Python)
@@ -244,7 +253,11 @@ func (a *Agent) IndexGSCData(
 	websiteURL string,
 	metricsData map[string]interface{},
 ) error {
-	content, _ := json.MarshalIndent(metricsData, "", "  ")
+	// Compact encoding: indentation only adds whitespace to the embedded and retrieved text
+	content, err := json.Marshal(metricsData)
+	if err != nil {
+		return fmt.Errorf("failed to encode GSC data: %w", err)
+	}
 
 	metadata := map[string]interface{}{
 		"type":       "gsc_metrics",
@@ -262,7 +275,10 @@ func (a *Agent) IndexAuditResult(
 	websiteURL string,
 	auditData map[string]interface{},
 ) error {
-	content, _ := json.MarshalIndent(auditData, "", "  ")
+	content, err := json.Marshal(auditData)
+	if err != nil {
+		return fmt.Errorf("failed to encode audit result: %w", err)
+	}
 
 	metadata := map[string]interface{}{
 		"type":       "audit_result",
@@ -295,15 +311,17 @@ func float32SliceToVectorString(v []float32) string {
 		return "[]"
 	}
 
-	result := "["
+	// Single pre-sized buffer; AppendFloat with precision 6 matches the "%f" format
+	buf := make([]byte, 0, len(v)*10+2)
+	buf = append(buf, '[')
 	for i, val := range v {
 		if i > 0 {
-			result += ","
+			buf = append(buf, ',')
 		}
-		result += fmt.Sprintf("%f", val)
+		buf = strconv.AppendFloat(buf, float64(val), 'f', 6, 32)
 	}
-	result += "]"
-	return result
+	buf = append(buf, ']')
+	return string(buf)
 }
 
 func min(a, b int) int {
@@ -317,21 +317,12 @@ func (a *OpportunityAnalyzer) Analyze(data *GSCMetricsData) []EnhancedIssue {
 	return issues
 }
 
+// ctrBenchmarks holds the expected CTR for positions 1-10 (1:1 with Python)
+// Index 0 is unused so the rounded position indexes the table directly
+var ctrBenchmarks = [...]float64{0, 0.285, 0.157, 0.094, 0.062, 0.050, 0.038, 0.030, 0.024, 0.020, 0.025}
+
 // getExpectedCTR returns expected CTR for a given position (1:1 with Python)
 func getExpectedCTR(position float64) float64 {
-	ctrBenchmarks := map[int]float64{
-		1:  0.285,
-		2:  0.157,
-		3:  0.094,
-		4:  0.062,
-		5:  0.050,
-		6:  0.038,
-		7:  0.030,
-		8:  0.024,
-		9:  0.020,
-		10: 0.025,
-	}
-
 	pos := int(math.Round(position))
 	if pos < 1 {
 		pos = 1
@@ -340,10 +331,7 @@ func getExpectedCTR(position float64) float64 {
 		return 0.015 // Below position 10
 	}
 
-	if ctr, ok := ctrBenchmarks[pos]; ok {
-		return ctr
-	}
-	return 0.025
+	return ctrBenchmarks[pos]
 }
 
 // averageImpressions calculates average impressions from daily metrics
@@ -403,16 +391,17 @@ func RunAllAnalyzers(data *GSCMetricsData) []EnhancedIssue {
 	return allIssues
 }
 
+// priorityScoreWeights maps severity to its priority multiplier
+var priorityScoreWeights = map[IssueSeverity]float64{
+	SeverityCritical: 4.0,
+	SeverityHigh:     3.0,
+	SeverityMedium:   2.0,
+	SeverityLow:      1.0,
+}
+
 // calculatePriorityScore calculates issue priority (1:1 with Python)
 func calculatePriorityScore(issue EnhancedIssue) float64 {
-	severityWeights := map[IssueSeverity]float64{
-		SeverityCritical: 4.0,
-		SeverityHigh:     3.0,
-		SeverityMedium:   2.0,
-		SeverityLow:      1.0,
-	}
-
-	weight := severityWeights[issue.Severity]
+	weight := priorityScoreWeights[issue.Severity]
 	if weight == 0 {
 		weight = 1.0
 	}
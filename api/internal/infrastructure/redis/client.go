@@ -1,9 +1,12 @@
 package redis
 
 import (
+	"bytes"
+	"compress/gzip"
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"time"
 
 	"github.com/redis/go-redis/v9"
@@ -88,6 +91,11 @@ func (c *Client) SetWithTTL(ctx context.Context, key string, value interface{},
 		return fmt.Errorf("failed to marshal value: %w", err)
 	}
 
+	data, err = compressValue(data)
+	if err != nil {
+		return fmt.Errorf("failed to compress value: %w", err)
+	}
+
 	return c.rdb.Set(ctx, key, data, ttl).Err()
 }
 
@@ -102,9 +110,55 @@ func (c *Client) Get(ctx context.Context, key string, dest interface{}) error {
 		return err
 	}
 
+	data, err = decompressValue(data)
+	if err != nil {
+		return fmt.Errorf("failed to decompress value: %w", err)
+	}
+
 	return json.Unmarshal(data, dest)
 }
 
+// compressedPrefix marks gzip-compressed values; no JSON document starts with it,
+// so values written before compression was added still read back as plain JSON
+var compressedPrefix = []byte("gz:")
+
+// compressMinBytes is the JSON size from which values are stored gzip-compressed.
+// Dashboard and metrics payloads with daily series shrink several times over;
+// small values like tokens aren't worth the CPU
+const compressMinBytes = 1024
+
+// compressValue gzips JSON data of at least compressMinBytes behind compressedPrefix
+func compressValue(data []byte) ([]byte, error) {
+	if len(data) < compressMinBytes {
+		return data, nil
+	}
+
+	var buf bytes.Buffer
+	buf.Write(compressedPrefix)
+	zw := gzip.NewWriter(&buf)
+	if _, err := zw.Write(data); err != nil {
+		return nil, err
+	}
+	if err := zw.Close(); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+// decompressValue reverses compressValue, passing plain JSON through unchanged
+func decompressValue(data []byte) ([]byte, error) {
+	if !bytes.HasPrefix(data, compressedPrefix) {
+		return data, nil
+	}
+
+	zr, err := gzip.NewReader(bytes.NewReader(data[len(compressedPrefix):]))
+	if err != nil {
+		return nil, err
+	}
+	defer zr.Close()
+	return io.ReadAll(zr)
+}
+
 // Delete removes a key
 func (c *Client) Delete(ctx context.Context, keys ...string) error {
 	if !c.enabled {
@@ -140,8 +194,13 @@ type TokenCache struct {
 
 // SetTokens caches user tokens
 func (c *Client) SetTokens(ctx context.Context, userEmail string, tokens *TokenCache) error {
+	return c.SetTokensWithTTL(ctx, userEmail, tokens, tokenCacheTTL)
+}
+
+// SetTokensWithTTL caches user tokens with a custom TTL (e.g. derived from the token expiry)
+func (c *Client) SetTokensWithTTL(ctx context.Context, userEmail string, tokens *TokenCache, ttl time.Duration) error {
 	key := tokenKeyPrefix + userEmail
-	return c.SetWithTTL(ctx, key, tokens, tokenCacheTTL)
+	return c.SetWithTTL(ctx, key, tokens, ttl)
 }
 
 // GetTokens retrieves cached tokens
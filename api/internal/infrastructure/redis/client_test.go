@@ -0,0 +1,57 @@
+package redis
+
+import (
+	"bytes"
+	"strings"
+	"testing"
+)
+
+// TestCompressValueRoundTrip verifies values are gzipped only from compressMinBytes and
+// that stored values, including pre-compression ones, read back unchanged
+func TestCompressValueRoundTrip(t *testing.T) {
+	small := []byte(`{"clicks":10,"impressions":250}`)
+	large := []byte(`{"rows":"` + strings.Repeat("query ", compressMinBytes) + `"}`)
+
+	compress := func(data []byte) []byte {
+		out, err := compressValue(data)
+		if err != nil {
+			t.Fatalf("compressValue failed: %v", err)
+		}
+		return out
+	}
+
+	tests := []struct {
+		name       string
+		stored     []byte
+		compressed bool
+		expected   []byte
+		wantErr    bool
+	}{
+		{"below threshold", compress(small), false, small, false},
+		{"above threshold", compress(large), true, large, false},
+		{"legacy uncompressed value", large, false, large, false},
+		{"corrupt gz payload", []byte("gz:not gzip data"), true, nil, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := bytes.HasPrefix(tt.stored, compressedPrefix); got != tt.compressed {
+				t.Errorf("Expected compressed=%v, got %v", tt.compressed, got)
+			}
+
+			result, err := decompressValue(tt.stored)
+			if tt.wantErr {
+				if err == nil {
+					t.Errorf("Expected an error, got %q", result)
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("Expected no error, got %v", err)
+			}
+			if !bytes.Equal(result, tt.expected) {
+				t.Errorf("Expected %d bytes back unchanged, got %d bytes", len(tt.expected), len(result))
+			}
+		})
+	}
+}
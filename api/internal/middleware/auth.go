@@ -20,16 +20,14 @@ func AuthMiddleware(authService *service.AuthService) gin.HandlerFunc {
 			return
 		}
 
-		// Extract Bearer token
-		parts := strings.SplitN(authHeader, " ", 2)
-		if len(parts) != 2 || strings.ToLower(parts[0]) != "bearer" {
+		// Extract Bearer token (Cut splits at the first space without allocating a slice)
+		scheme, tokenString, ok := strings.Cut(authHeader, " ")
+		if !ok || !strings.EqualFold(scheme, "bearer") {
 			response.Error(c, http.StatusUnauthorized, "UNAUTHORIZED", "Invalid authorization format")
 			c.Abort()
 			return
 		}
 
-		tokenString := parts[1]
-
 		// Validate token
 		email, err := authService.ValidateToken(tokenString)
 		if err != nil {
@@ -53,13 +51,12 @@ func OptionalAuthMiddleware(authService *service.AuthService) gin.HandlerFunc {
 			return
 		}
 
-		parts := strings.SplitN(authHeader, " ", 2)
-		if len(parts) != 2 || strings.ToLower(parts[0]) != "bearer" {
+		scheme, tokenString, ok := strings.Cut(authHeader, " ")
+		if !ok || !strings.EqualFold(scheme, "bearer") {
 			c.Next()
 			return
 		}
 
-		tokenString := parts[1]
 		email, err := authService.ValidateToken(tokenString)
 		if err == nil {
 			c.Set("user_email", email)
@@ -15,6 +15,27 @@ type ChangeThreshold struct {
 	Medium   float64
 }
 
+// severity maps a change onto the critical/high/medium ladder, returning "" when the
+// change does not reach the medium threshold. Thresholds are negative for metrics where
+// a drop is bad and positive where a rise is bad (position), so the sign of Medium picks
+// the comparison direction
+func (t ChangeThreshold) severity(change float64) string {
+	if t.Medium < 0 {
+		change, t.Critical, t.High, t.Medium = -change, -t.Critical, -t.High, -t.Medium
+	}
+
+	switch {
+	case change >= t.Critical:
+		return "critical"
+	case change >= t.High:
+		return "high"
+	case change >= t.Medium:
+		return "medium"
+	default:
+		return ""
+	}
+}
+
 // AnomalyDetector detects statistical anomalies in GSC data
 // Implements Z-score based anomaly detection (1:1 with Python audit_engine.py)
 type AnomalyDetector struct {
@@ -102,16 +123,19 @@ func (d *AnomalyDetector) Analyze(dailyMetrics []google.DailyMetric, auditID int
 	}
 
 	// Detect anomalies in each metric using Z-score (statistical method)
-	impressionAnomalies := d.detectAnomaliesInSeries(extractImpressions(dailyMetrics), dailyMetrics, "impressions")
-	clickAnomalies := d.detectAnomaliesInSeries(extractClicks(dailyMetrics), dailyMetrics, "clicks")
-	ctrAnomalies := d.detectAnomaliesInSeries(extractCTR(dailyMetrics), dailyMetrics, "ctr")
-	positionAnomalies := d.detectAnomaliesInSeries(extractPosition(dailyMetrics), dailyMetrics, "position")
-
-	// Combine all anomalies
-	result.Anomalies = append(result.Anomalies, impressionAnomalies...)
-	result.Anomalies = append(result.Anomalies, clickAnomalies...)
-	result.Anomalies = append(result.Anomalies, ctrAnomalies...)
-	result.Anomalies = append(result.Anomalies, positionAnomalies...)
+	// One values buffer is reused for every series since detection doesn't retain it, and the
+	// series total is accumulated while extracting so the mean needs no separate pass
+	values := make([]float64, len(dailyMetrics))
+	for _, series := range anomalySeries {
+		total := 0.0
+		for i, m := range dailyMetrics {
+			v := series.value(m)
+			values[i] = v
+			total += v
+		}
+		mean := total / float64(len(values))
+		result.Anomalies = append(result.Anomalies, d.detectAnomaliesInSeries(values, mean, dailyMetrics, series.metric)...)
+	}
 
 	result.HasAnomalies = len(result.Anomalies) > 0
 
@@ -121,6 +145,17 @@ func (d *AnomalyDetector) Analyze(dailyMetrics []google.DailyMetric, auditID int
 	return result
 }
 
+// anomalySeries lists the daily metrics checked for anomalies, in report order
+var anomalySeries = []struct {
+	metric string
+	value  func(google.DailyMetric) float64
+}{
+	{"impressions", func(m google.DailyMetric) float64 { return float64(m.Impressions) }},
+	{"clicks", func(m google.DailyMetric) float64 { return float64(m.Clicks) }},
+	{"ctr", func(m google.DailyMetric) float64 { return m.CTR }},
+	{"position", func(m google.DailyMetric) float64 { return m.Position }},
+}
+
 // AnalyzeWithComparison performs percentage-based anomaly detection comparing current vs previous period
 // This is 1:1 with Python's detect_anomalies() method
 func (d *AnomalyDetector) AnalyzeWithComparison(
@@ -163,14 +198,8 @@ func (d *AnomalyDetector) detectTrafficPercentageAnomaly(currentClicks, previous
 
 	changePct := float64(currentClicks-previousClicks) / float64(previousClicks) * 100
 
-	var severity string
-	if changePct <= d.trafficThresholds.Critical {
-		severity = "critical"
-	} else if changePct <= d.trafficThresholds.High {
-		severity = "high"
-	} else if changePct <= d.trafficThresholds.Medium {
-		severity = "medium"
-	} else {
+	severity := d.trafficThresholds.severity(changePct)
+	if severity == "" {
 		return nil
 	}
 
@@ -197,14 +226,8 @@ func (d *AnomalyDetector) detectPositionPercentageAnomaly(currentPosition, previ
 	// Position change (positive means dropped in rankings - higher position number is worse)
 	positionChange := currentPosition - previousPosition
 
-	var severity string
-	if positionChange >= d.positionThresholds.Critical {
-		severity = "critical"
-	} else if positionChange >= d.positionThresholds.High {
-		severity = "high"
-	} else if positionChange >= d.positionThresholds.Medium {
-		severity = "medium"
-	} else {
+	severity := d.positionThresholds.severity(positionChange)
+	if severity == "" {
 		return nil
 	}
 
@@ -281,14 +304,8 @@ func (d *AnomalyDetector) detectImpressionPercentageAnomaly(currentImpressions,
 
 	changePct := float64(currentImpressions-previousImpressions) / float64(previousImpressions) * 100
 
-	var severity string
-	if changePct <= d.impressionThresholds.Critical {
-		severity = "critical"
-	} else if changePct <= d.impressionThresholds.High {
-		severity = "high"
-	} else if changePct <= d.impressionThresholds.Medium {
-		severity = "medium"
-	} else {
+	severity := d.impressionThresholds.severity(changePct)
+	if severity == "" {
 		return nil
 	}
 
@@ -306,16 +323,15 @@ func (d *AnomalyDetector) detectImpressionPercentageAnomaly(currentImpressions,
 	}
 }
 
-// detectAnomaliesInSeries detects anomalies in a single metric series
-func (d *AnomalyDetector) detectAnomaliesInSeries(values []float64, dailyMetrics []google.DailyMetric, metricName string) []Anomaly {
+// detectAnomaliesInSeries detects anomalies in a single metric series whose mean is already known
+func (d *AnomalyDetector) detectAnomaliesInSeries(values []float64, mean float64, dailyMetrics []google.DailyMetric, metricName string) []Anomaly {
 	var anomalies []Anomaly
 
 	if len(values) < d.minDataPoints {
 		return anomalies
 	}
 
-	// Calculate mean and standard deviation
-	mean := calculateMean(values)
+	// Calculate standard deviation around the precomputed mean
 	stdDev := calculateStdDev(values, mean)
 
 	// Skip if no variation (all same values)
@@ -323,32 +339,30 @@ func (d *AnomalyDetector) detectAnomaliesInSeries(values []float64, dailyMetrics
 		return anomalies
 	}
 
+	// Expected range is the same for every point in the series
+	expectedMin := mean - (2 * stdDev)
+	expectedMax := mean + (2 * stdDev)
+
 	// Check each value for anomalies
 	for i, value := range values {
 		zScore := (value - mean) / stdDev
 
 		// Detect drops (significant negative z-score)
-		if zScore < -d.zScoreThresholdHigh {
-			anomalies = append(anomalies, Anomaly{
-				Type:        "drop",
-				Metric:      metricName,
-				Date:        dailyMetrics[i].Date,
-				Value:       value,
-				ExpectedMin: mean - (2 * stdDev),
-				ExpectedMax: mean + (2 * stdDev),
-				ZScore:      zScore,
-				Severity:    "high",
-			})
-		} else if zScore < -d.zScoreThresholdMedium {
+		if zScore < -d.zScoreThresholdMedium {
+			severity := "medium"
+			if zScore < -d.zScoreThresholdHigh {
+				severity = "high"
+			}
+
 			anomalies = append(anomalies, Anomaly{
 				Type:        "drop",
 				Metric:      metricName,
 				Date:        dailyMetrics[i].Date,
 				Value:       value,
-				ExpectedMin: mean - (2 * stdDev),
-				ExpectedMax: mean + (2 * stdDev),
+				ExpectedMin: expectedMin,
+				ExpectedMax: expectedMax,
 				ZScore:      zScore,
-				Severity:    "medium",
+				Severity:    severity,
 			})
 		}
 
@@ -368,8 +382,8 @@ func (d *AnomalyDetector) detectAnomaliesInSeries(values []float64, dailyMetrics
 				Metric:      metricName,
 				Date:        dailyMetrics[i].Date,
 				Value:       value,
-				ExpectedMin: mean - (2 * stdDev),
-				ExpectedMax: mean + (2 * stdDev),
+				ExpectedMin: expectedMin,
+				ExpectedMax: expectedMax,
 				ZScore:      zScore,
 				Severity:    severity,
 			})
@@ -486,17 +500,6 @@ func extractPosition(dailyMetrics []google.DailyMetric) []float64 {
 
 // Statistical helper functions
 
-func calculateMean(values []float64) float64 {
-	if len(values) == 0 {
-		return 0
-	}
-	sum := 0.0
-	for _, v := range values {
-		sum += v
-	}
-	return sum / float64(len(values))
-}
-
 func calculateStdDev(values []float64, mean float64) float64 {
 	if len(values) < 2 {
 		return 0
@@ -0,0 +1,35 @@
+package analyzers
+
+import "testing"
+
+// TestChangeThresholdSeverity verifies the severity ladder for metrics where a drop is bad
+// (negative thresholds) and where a rise is bad (position), including the inclusive boundaries
+func TestChangeThresholdSeverity(t *testing.T) {
+	detector := NewAnomalyDetector()
+
+	tests := []struct {
+		name      string
+		threshold ChangeThreshold
+		change    float64
+		expected  string
+	}{
+		{"traffic beyond critical", detector.trafficThresholds, -75, "critical"},
+		{"traffic at critical", detector.trafficThresholds, -50, "critical"},
+		{"traffic at high", detector.trafficThresholds, -20, "high"},
+		{"traffic between high and critical", detector.trafficThresholds, -35, "high"},
+		{"traffic at medium", detector.trafficThresholds, -10, "medium"},
+		{"traffic small drop", detector.trafficThresholds, -9.9, ""},
+		{"traffic gain", detector.trafficThresholds, 40, ""},
+		{"position at critical", detector.positionThresholds, 5, "critical"},
+		{"position at high", detector.positionThresholds, 3, "high"},
+		{"position at medium", detector.positionThresholds, 2, "medium"},
+		{"position small drop", detector.positionThresholds, 1.5, ""},
+		{"position improvement", detector.positionThresholds, -6, ""},
+	}
+
+	for _, tt := range tests {
+		if result := tt.threshold.severity(tt.change); result != tt.expected {
+			t.Errorf("%s (%v): expected %q, got %q", tt.name, tt.change, tt.expected, result)
+		}
+	}
+}
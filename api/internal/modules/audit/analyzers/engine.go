@@ -125,18 +125,11 @@ func (e *AuditEngine) deduplicateIssues(issues []domain.AuditIssue) []domain.Aud
 
 // sortIssuesBySeverity sorts issues by severity (critical > high > medium > low) - 1:1 with Python
 func (e *AuditEngine) sortIssuesBySeverity(issues []domain.AuditIssue) []domain.AuditIssue {
-	severityOrder := map[string]int{
-		"critical": 0, // 1:1 with Python - weight 1000
-		"high":     1, // 1:1 with Python - weight 100
-		"medium":   2, // 1:1 with Python - weight 10
-		"low":      3, // 1:1 with Python - weight 1
-	}
-
 	// Bubble sort by severity
 	for i := 0; i < len(issues)-1; i++ {
 		for j := i + 1; j < len(issues); j++ {
-			iOrder := severityOrder[issues[i].Severity]
-			jOrder := severityOrder[issues[j].Severity]
+			iOrder := domain.IssueSeverityOrder[issues[i].Severity]
+			jOrder := domain.IssueSeverityOrder[issues[j].Severity]
 			if iOrder > jOrder {
 				issues[i], issues[j] = issues[j], issues[i]
 			}
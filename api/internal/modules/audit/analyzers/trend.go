@@ -183,23 +183,23 @@ func (a *TrendAnalyzer) calculateConsistency(values []float64, direction string)
 	return consecutiveDays
 }
 
+// momentumWeights weights each metric's trend in the momentum score (impressions and clicks most important)
+var momentumWeights = map[string]float64{
+	"impressions": 0.30,
+	"clicks":      0.35,
+	"ctr":         0.20,
+	"position":    0.15,
+}
+
 // calculateMomentumScore calculates overall momentum (-100 to +100)
 func (a *TrendAnalyzer) calculateMomentumScore(trends []Trend) float64 {
 	if len(trends) == 0 {
 		return 0
 	}
 
-	// Weights for each metric (impressions and clicks most important)
-	weights := map[string]float64{
-		"impressions": 0.30,
-		"clicks":      0.35,
-		"ctr":         0.20,
-		"position":    0.15,
-	}
-
 	score := 0.0
 	for _, trend := range trends {
-		weight := weights[trend.Metric]
+		weight := momentumWeights[trend.Metric]
 		if weight == 0 {
 			weight = 0.25
 		}
@@ -325,16 +325,17 @@ func MergeRAGInsights(existingIssues []AuditIssue, ragIssues []EnhancedIssue) *M
 	return result
 }
 
+// issuePriorityWeights maps severity to its base priority score
+var issuePriorityWeights = map[string]float64{
+	"critical": 100,
+	"high":     75,
+	"medium":   50,
+	"low":      25,
+}
+
 // calculateIssuePriority calculates priority score (1:1 with Python)
 func calculateIssuePriority(severity string, confidence float64) float64 {
-	severityWeights := map[string]float64{
-		"critical": 100,
-		"high":     75,
-		"medium":   50,
-		"low":      25,
-	}
-
-	weight, ok := severityWeights[severity]
+	weight, ok := issuePriorityWeights[severity]
 	if !ok {
 		weight = 25
 	}
@@ -342,20 +343,21 @@ func calculateIssuePriority(severity string, confidence float64) float64 {
 	return weight * confidence
 }
 
+// IssueSeverityOrder ranks severities for sorting issues (critical first)
+var IssueSeverityOrder = map[string]int{
+	"critical": 0, // 1:1 with Python - weight 1000
+	"high":     1, // 1:1 with Python - weight 100
+	"medium":   2, // 1:1 with Python - weight 10
+	"low":      3, // 1:1 with Python - weight 1
+}
+
 // sortEnhancedIssues sorts issues by severity and confidence (1:1 with Python)
 func sortEnhancedIssues(issues []EnhancedIssue) {
-	severityOrder := map[string]int{
-		"critical": 0,
-		"high":     1,
-		"medium":   2,
-		"low":      3,
-	}
-
 	// Simple bubble sort for small list
 	for i := 0; i < len(issues)-1; i++ {
 		for j := i + 1; j < len(issues); j++ {
-			iSeverity := severityOrder[issues[i].Severity]
-			jSeverity := severityOrder[issues[j].Severity]
+			iSeverity := IssueSeverityOrder[issues[i].Severity]
+			jSeverity := IssueSeverityOrder[issues[j].Severity]
 
 			// Sort by severity first, then by confidence, then by priority
 			if iSeverity > jSeverity ||
@@ -1,7 +1,6 @@
 package handler
 
 import (
-	"encoding/json"
 	"fmt"
 	"net/http"
 	"os"
@@ -321,22 +320,14 @@ func (h *AuditHandler) StreamAuditProgress(c *gin.Context) {
 			progress.Error = audit.Error
 		}
 
-		c.Header("Content-Type", "text/event-stream")
-		c.Header("Cache-Control", "no-cache")
-		c.Header("Connection", "keep-alive")
-		c.Header("X-Accel-Buffering", "no")
+		response.SetSSEHeaders(c)
 
-		data, _ := json.Marshal(progress)
-		c.Writer.WriteString(fmt.Sprintf("data: %s\n\n", string(data)))
-		c.Writer.Flush()
+		_ = response.SSEEvent(c.Writer, progress)
 		return
 	}
 
 	// Set headers for SSE
-	c.Header("Content-Type", "text/event-stream")
-	c.Header("Cache-Control", "no-cache")
-	c.Header("Connection", "keep-alive")
-	c.Header("X-Accel-Buffering", "no")
+	response.SetSSEHeaders(c)
 	c.Header("Access-Control-Allow-Origin", "*")
 
 	// Subscribe to progress updates
@@ -371,9 +362,7 @@ func (h *AuditHandler) StreamAuditProgress(c *gin.Context) {
 				Message:  "Audit timed out",
 				Error:    "The audit took too long to complete",
 			}
-			data, _ := json.Marshal(errProgress)
-			c.Writer.WriteString(fmt.Sprintf("data: %s\n\n", string(data)))
-			c.Writer.Flush()
+			_ = response.SSEEvent(c.Writer, errProgress)
 			return
 
 		case progress, ok := <-subscription.Ch:
@@ -383,14 +372,10 @@ func (h *AuditHandler) StreamAuditProgress(c *gin.Context) {
 			}
 
 			// Send progress update
-			data, err := json.Marshal(progress)
-			if err != nil {
+			if err := response.SSEEvent(c.Writer, progress); err != nil {
 				continue
 			}
 
-			c.Writer.WriteString(fmt.Sprintf("data: %s\n\n", string(data)))
-			c.Writer.Flush()
-
 			// If completed or error, close stream
 			if progress.Stage == domain.StageCompleted || progress.Stage == domain.StageError {
 				return
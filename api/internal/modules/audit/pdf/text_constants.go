@@ -3,13 +3,8 @@ package pdf
 import (
 	"fmt"
 	"math/rand"
-	"time"
 )
 
-func init() {
-	rand.Seed(time.Now().UnixNano())
-}
-
 // ============================================================================
 // 1. SEO STAGE DESCRIPTIONS (1:1 with Python)
 // ============================================================================
@@ -15,7 +15,7 @@ type AuditRepository interface {
 	GetLatestAudit(ctx context.Context, userEmail, websiteURL string) (*domain.Audit, error)
 	UpdateAuditStatus(ctx context.Context, id int64, status domain.AuditStatus, pdfPath string) error
 	UpdateAuditError(ctx context.Context, id int64, errorMsg string) error
-	UpdateAuditScore(ctx context.Context, id int64, score float64, stage domain.SEOStage) error
+	UpdateAuditScore(ctx context.Context, id int64, score float64, stage domain.SEOStage) (*domain.Audit, error)
 
 	// Issue operations
 	SaveIssues(ctx context.Context, issues []domain.AuditIssue) error
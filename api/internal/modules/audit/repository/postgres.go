@@ -39,18 +39,12 @@ func (r *PostgresAuditRepository) CreateAudit(ctx context.Context, audit *domain
 	).Scan(&audit.ID)
 }
 
-// GetAudit retrieves an audit by ID
-func (r *PostgresAuditRepository) GetAudit(ctx context.Context, id int64) (*domain.Audit, error) {
-	query := `
-		SELECT id, user_email, website_url, status, seo_score, seo_stage, pdf_path, created_at, completed_at, error
-		FROM audits
-		WHERE id = $1
-	`
-
+// scanAudit scans a single audits row (in the column order used by the queries below)
+func scanAudit(row pgx.Row) (*domain.Audit, error) {
 	var audit domain.Audit
 	var pdfPath, errMsg *string
 
-	err := r.pool.QueryRow(ctx, query, id).Scan(
+	err := row.Scan(
 		&audit.ID,
 		&audit.UserEmail,
 		&audit.WebsiteURL,
@@ -81,6 +75,17 @@ func (r *PostgresAuditRepository) GetAudit(ctx context.Context, id int64) (*doma
 	return &audit, nil
 }
 
+// GetAudit retrieves an audit by ID
+func (r *PostgresAuditRepository) GetAudit(ctx context.Context, id int64) (*domain.Audit, error) {
+	query := `
+		SELECT id, user_email, website_url, status, seo_score, seo_stage, pdf_path, created_at, completed_at, error
+		FROM audits
+		WHERE id = $1
+	`
+
+	return scanAudit(r.pool.QueryRow(ctx, query, id))
+}
+
 // GetAuditsByUser retrieves audits for a user
 func (r *PostgresAuditRepository) GetAuditsByUser(ctx context.Context, userEmail string, limit int) ([]domain.Audit, error) {
 	query := `
@@ -141,38 +146,7 @@ func (r *PostgresAuditRepository) GetLatestAudit(ctx context.Context, userEmail,
 		LIMIT 1
 	`
 
-	var audit domain.Audit
-	var pdfPath, errMsg *string
-
-	err := r.pool.QueryRow(ctx, query, userEmail, websiteURL).Scan(
-		&audit.ID,
-		&audit.UserEmail,
-		&audit.WebsiteURL,
-		&audit.Status,
-		&audit.SEOScore,
-		&audit.SEOStage,
-		&pdfPath,
-		&audit.CreatedAt,
-		&audit.CompletedAt,
-		&errMsg,
-	)
-
-	if errors.Is(err, pgx.ErrNoRows) {
-		return nil, nil
-	}
-	if err != nil {
-		return nil, err
-	}
-
-	if pdfPath != nil && *pdfPath != "" {
-		audit.PDFPath = *pdfPath
-		audit.PDFGenerated = true
-	}
-	if errMsg != nil {
-		audit.Error = *errMsg
-	}
-
-	return &audit, nil
+	return scanAudit(r.pool.QueryRow(ctx, query, userEmail, websiteURL))
 }
 
 // UpdateAuditStatus updates audit status and PDF path
@@ -198,22 +172,32 @@ func (r *PostgresAuditRepository) UpdateAuditError(ctx context.Context, id int64
 	return err
 }
 
-// UpdateAuditScore updates the SEO score and stage
-func (r *PostgresAuditRepository) UpdateAuditScore(ctx context.Context, id int64, score float64, stage domain.SEOStage) error {
-	query := `UPDATE audits SET seo_score = $2, seo_stage = $3 WHERE id = $1`
-	_, err := r.pool.Exec(ctx, query, id, score, stage)
-	return err
+// UpdateAuditScore updates the SEO score and stage and returns the updated audit,
+// so callers that need the row afterwards don't have to read it back separately
+func (r *PostgresAuditRepository) UpdateAuditScore(ctx context.Context, id int64, score float64, stage domain.SEOStage) (*domain.Audit, error) {
+	query := `
+		UPDATE audits SET seo_score = $2, seo_stage = $3
+		WHERE id = $1
+		RETURNING id, user_email, website_url, status, seo_score, seo_stage, pdf_path, created_at, completed_at, error
+	`
+
+	return scanAudit(r.pool.QueryRow(ctx, query, id, score, stage))
 }
 
-// SaveIssues saves audit issues
+// SaveIssues saves audit issues, sending all inserts in a single batch
 func (r *PostgresAuditRepository) SaveIssues(ctx context.Context, issues []domain.AuditIssue) error {
-	for _, issue := range issues {
-		query := `
-			INSERT INTO audit_issues (audit_id, severity, category, title, description, impact, suggestion, created_at)
-			VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
-		`
+	if len(issues) == 0 {
+		return nil
+	}
 
-		if _, err := r.pool.Exec(ctx, query,
+	query := `
+		INSERT INTO audit_issues (audit_id, severity, category, title, description, impact, suggestion, created_at)
+		VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
+	`
+
+	batch := &pgx.Batch{}
+	for _, issue := range issues {
+		batch.Queue(query,
 			issue.AuditID,
 			issue.Severity,
 			issue.Category,
@@ -221,12 +205,10 @@ func (r *PostgresAuditRepository) SaveIssues(ctx context.Context, issues []domai
 			issue.Description,
 			issue.Impact,
 			issue.Recommendation, // DB column is 'suggestion', Go field is 'Recommendation' (1:1 with Python)
-		); err != nil {
-			return err
-		}
+		)
 	}
 
-	return nil
+	return r.pool.SendBatch(ctx, batch).Close()
 }
 
 // GetIssuesByAudit retrieves issues for an audit
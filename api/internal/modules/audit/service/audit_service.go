@@ -4,8 +4,11 @@ import (
 	"context"
 	"fmt"
 	"net/http"
+	"sync"
 	"time"
 
+	"github.com/rs/zerolog/log"
+
 	chatDomain "github.com/petpeevephobia/solvia-v2/api/internal/modules/chat/domain"
 	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/email"
 	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/google"
@@ -112,8 +115,8 @@ func (s *AuditService) CreateAuditWithOptions(ctx context.Context, userEmail, we
 		return nil, apperrors.DatabaseError(err)
 	}
 
-	// Process audit asynchronously with options
-	go s.processAuditWithOptions(context.Background(), audit.ID, userEmail, websiteURL, options)
+	// Process audit asynchronously with options; nobody waits on it, so GSC calls may sit out rate limits
+	go s.processAuditWithOptions(google.WithBackgroundRetries(context.Background()), audit.ID, userEmail, websiteURL, options)
 
 	return audit, nil
 }
@@ -128,7 +131,7 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 	// Panic recovery to prevent silent goroutine failures
 	defer func() {
 		if r := recover(); r != nil {
-			fmt.Printf("[AUDIT PANIC] Goroutine panicked for audit %d: %v\n", auditID, r)
+			log.Error().Int64("audit_id", auditID).Interface("panic", r).Msg("[AUDIT PANIC] Goroutine panicked")
 			_ = s.repo.UpdateAuditError(ctx, auditID, fmt.Sprintf("Audit processing panicked: %v", r))
 		}
 	}()
@@ -168,27 +171,39 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 	endDate := now.AddDate(0, 0, -1) // GSC data delayed by 1 day
 	startDate := endDate.AddDate(0, 0, -(options.DateRangeDays - 1)) // Use custom date range
 
-	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageFetchingGSCData, 15, "Fetching current period metrics...")
+	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageFetchingGSCData, 15, "Fetching current and comparison period metrics...")
+
+	// Fetch metrics for previous period (same duration before current, 1:1 with Python)
+	// concurrently with the current period, since the two requests are independent
+	prevEndDate := startDate.AddDate(0, 0, -1)
+	prevStartDate := prevEndDate.AddDate(0, 0, -(options.DateRangeDays - 1)) // Same duration as current
 
-	currentMetrics, err := s.gscClient.GetMetrics(ctx, client, websiteURL, startDate, endDate)
+	var prevMetrics *google.GSCMetrics
+	var prevErr error
+	var prevWG sync.WaitGroup
+	prevWG.Add(1)
+	go func() {
+		defer prevWG.Done()
+		prevMetrics, prevErr = s.gscClient.GetMetrics(ctx, client, websiteURL, prevStartDate, prevEndDate)
+	}()
+
+	// Time series data for V1/V2 28-day changes (1:1 with Python gamified PDF). The current period
+	// summary is just its sum, so derive it locally instead of issuing a second query for the same range
+	timeSeriesData, err := s.gscClient.GetTimeSeriesMetrics(ctx, client, websiteURL, startDate, endDate)
+	prevWG.Wait()
 	if err != nil {
 		domain.GlobalProgressTracker.SetError(auditID, "Failed to fetch metrics: "+err.Error())
 		_ = s.repo.UpdateAuditError(ctx, auditID, "Failed to fetch metrics: "+err.Error())
 		return
 	}
 
-	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageFetchingGSCData, 25, "Fetching comparison period metrics...")
-
-	// Fetch metrics for previous period (same duration before current, 1:1 with Python)
-	prevEndDate := startDate.AddDate(0, 0, -1)
-	prevStartDate := prevEndDate.AddDate(0, 0, -(options.DateRangeDays - 1)) // Same duration as current
-
-	prevMetrics, err := s.gscClient.GetMetrics(ctx, client, websiteURL, prevStartDate, prevEndDate)
-	if err != nil {
+	if prevErr != nil {
 		// Non-fatal - continue with zeros for previous period
 		prevMetrics = &google.GSCMetrics{}
 	}
 
+	currentMetrics := google.MetricsFromDailyMetrics(timeSeriesData)
+
 	// Calculate changes
 	auditMetrics := &domain.AuditMetrics{
 		Impressions:       currentMetrics.Impressions,
@@ -208,9 +223,28 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 	// Stage 3: Analyzing Metrics
 	domain.GlobalProgressTracker.SetStage(auditID, domain.StageAnalyzingMetrics, "Analyzing SEO metrics...")
 
-	// Fetch top queries
-	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageAnalyzingMetrics, 35, "Fetching top queries...")
-	queries, _ := s.gscClient.GetQueries(ctx, client, websiteURL, startDate, endDate, 10)
+	// GSC only returns query and page rows that had impressions, so when the period has
+	// none both breakdown requests below would come back empty; skip the round trips
+	hasImpressions := currentMetrics.Impressions > 0
+
+	// Fetch top queries and top pages. The two requests are independent, so they run
+	// concurrently and the stage waits on one round trip
+	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageAnalyzingMetrics, 35, "Fetching top queries and pages...")
+	var queries, pages []google.SearchAnalyticsRow
+	if hasImpressions {
+		var wg sync.WaitGroup
+		wg.Add(2)
+		go func() {
+			defer wg.Done()
+			queries, _ = s.gscClient.GetQueries(ctx, client, websiteURL, startDate, endDate, 10)
+		}()
+		go func() {
+			defer wg.Done()
+			pages, _ = s.gscClient.GetPages(ctx, client, websiteURL, startDate, endDate, 10)
+		}()
+		wg.Wait()
+	}
+
 	var topQueries []domain.TopQuery
 	for _, q := range queries {
 		if len(q.Keys) > 0 {
@@ -224,9 +258,6 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 		}
 	}
 
-	// Fetch top pages
-	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageAnalyzingMetrics, 40, "Fetching top pages...")
-	pages, _ := s.gscClient.GetPages(ctx, client, websiteURL, startDate, endDate, 10)
 	var topPages []domain.TopPage
 	for _, p := range pages {
 		if len(p.Keys) > 0 {
@@ -240,10 +271,6 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 		}
 	}
 
-	// Fetch time series data for V1/V2 28-day changes (1:1 with Python gamified PDF)
-	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageAnalyzingMetrics, 42, "Fetching time series data...")
-	timeSeriesData, _ := s.gscClient.GetTimeSeriesMetrics(ctx, client, websiteURL, startDate, endDate)
-
 	// Calculate 28-day changes using V1 (first day) vs V2 (last day) method
 	changes28Day := google.Calculate28DayChanges(timeSeriesData)
 
@@ -288,11 +315,8 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 
 	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageGeneratingRecommendations, 80, "Updating audit score...")
 
-	// Update audit with score
-	_ = s.repo.UpdateAuditScore(ctx, auditID, seoScore, seoStage)
-
-	// Get audit for PDF generation
-	audit, err := s.repo.GetAudit(ctx, auditID)
+	// Update audit with score; the updated row is returned for PDF generation
+	audit, err := s.repo.UpdateAuditScore(ctx, auditID, seoScore, seoStage)
 	if err != nil || audit == nil {
 		domain.GlobalProgressTracker.SetError(auditID, "Failed to retrieve audit")
 		_ = s.repo.UpdateAuditError(ctx, auditID, "Failed to retrieve audit")
@@ -361,7 +385,7 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 			auditIDStr := fmt.Sprintf("%d", auditID)
 			if err := s.emailService.SendAuditReportEmail(ctx, userEmail, pdfPath, auditIDStr, seoScore, userEmail); err != nil {
 				// Non-fatal error - log but don't fail the audit
-				fmt.Printf("[AUDIT] Warning: Failed to send email: %v\n", err)
+				log.Warn().Err(err).Int64("audit_id", auditID).Msg("[AUDIT] Failed to send email")
 			}
 		}
 	} else if options.DeliveryMethod == "download" {
@@ -373,22 +397,22 @@ func (s *AuditService) processAuditWithOptions(ctx context.Context, auditID int6
 	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageFinalizing, 96, "Saving results...")
 
 	// Update status to completed with proper error logging
-	fmt.Printf("[AUDIT] Updating status to completed for audit %d, pdfPath: %s\n", auditID, pdfPath)
+	log.Debug().Int64("audit_id", auditID).Str("pdf_path", pdfPath).Msg("[AUDIT] Updating status to completed")
 	if err := s.repo.UpdateAuditStatus(ctx, auditID, domain.AuditStatusCompleted, pdfPath); err != nil {
-		fmt.Printf("[AUDIT ERROR] Failed to update status to completed: %v\n", err)
+		log.Error().Err(err).Int64("audit_id", auditID).Msg("[AUDIT] Failed to update status to completed")
 	} else {
-		fmt.Printf("[AUDIT] ✅ Status updated to completed for audit %d\n", auditID)
+		log.Debug().Int64("audit_id", auditID).Msg("[AUDIT] Status updated to completed")
 	}
 
 	domain.GlobalProgressTracker.UpdateProgress(auditID, domain.StageFinalizing, 98, "Cleaning up old audits...")
 
 	// Cleanup old audits (keep last 10)
 	if err := s.repo.DeleteOldAudits(ctx, userEmail, 10); err != nil {
-		fmt.Printf("[AUDIT WARNING] Failed to cleanup old audits: %v\n", err)
+		log.Warn().Err(err).Str("user", userEmail).Msg("[AUDIT] Failed to cleanup old audits")
 	}
 
 	// Stage 8: Completed
-	fmt.Printf("[AUDIT] ✅ Audit %d completed successfully\n", auditID)
+	log.Info().Int64("audit_id", auditID).Msg("[AUDIT] Audit completed successfully")
 	domain.GlobalProgressTracker.Complete(auditID)
 }
 
@@ -643,11 +667,10 @@ func (s *AuditService) limitIssues(issues []domain.AuditIssue, limit int) []doma
 	}
 
 	// Sort by severity (critical > high > medium > low) - 1:1 with Python
-	severityOrder := map[string]int{"critical": 0, "high": 1, "medium": 2, "low": 3}
 	for i := 0; i < len(issues)-1; i++ {
 		for j := i + 1; j < len(issues); j++ {
-			iOrder := severityOrder[issues[i].Severity]
-			jOrder := severityOrder[issues[j].Severity]
+			iOrder := domain.IssueSeverityOrder[issues[i].Severity]
+			jOrder := domain.IssueSeverityOrder[issues[j].Severity]
 			if iOrder > jOrder {
 				issues[i], issues[j] = issues[j], issues[i]
 			}
@@ -664,7 +687,7 @@ func (s *AuditService) getHTTPClient(ctx context.Context, userEmail string) (*ht
 		return nil, err
 	}
 
-	return s.oauthClient.GetHTTPClient(ctx, accessToken, refreshToken), nil
+	return s.oauthClient.GetHTTPClient(ctx, userEmail, accessToken, refreshToken), nil
 }
 
 // calculateSEOScore calculates SEO score using shared scoring engine (1:1 with Python)
@@ -4,13 +4,17 @@ import (
 	"crypto/sha256"
 	"encoding/hex"
 	"fmt"
-	"sync"
 	"time"
+
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
 )
 
 // DeviceTrustTimeout is 30 days in seconds (1:1 with Python)
 const DeviceTrustTimeout = 30 * 24 * 60 * 60 // 2592000 seconds
 
+// DeviceTrustCacheMaxEntries bounds how many user/device pairs are kept in memory
+const DeviceTrustCacheMaxEntries = 10000
+
 // TrustedDevice represents a trusted device record
 type TrustedDevice struct {
 	ID                int64     `json:"id"`
@@ -22,76 +26,38 @@ type TrustedDevice struct {
 }
 
 // DeviceTrustCache provides in-memory caching for device trust lookups
+// It holds at most DeviceTrustCacheMaxEntries pairs and evicts the least recently used one
+// when full; untrusted results are cached too, so without a bound every fingerprint
+// (which includes the client IP) ever seen would stay in memory for 30 days
 type DeviceTrustCache struct {
-	mu      sync.RWMutex
-	cache   map[string]*deviceTrustEntry
-	timeout time.Duration
-}
-
-type deviceTrustEntry struct {
-	Timestamp time.Time
-	Trusted   bool
+	cache *lru.Cache[string, bool] // key -> trusted
 }
 
 // NewDeviceTrustCache creates a new device trust cache
 func NewDeviceTrustCache() *DeviceTrustCache {
 	return &DeviceTrustCache{
-		cache:   make(map[string]*deviceTrustEntry),
-		timeout: time.Duration(DeviceTrustTimeout) * time.Second,
+		cache: lru.New[string, bool](DeviceTrustCacheMaxEntries, time.Duration(DeviceTrustTimeout)*time.Second),
 	}
 }
 
 // Get retrieves a cached trust entry
 func (c *DeviceTrustCache) Get(userEmail, deviceFingerprint string) (trusted bool, found bool) {
-	c.mu.RLock()
-	defer c.mu.RUnlock()
-
-	key := c.cacheKey(userEmail, deviceFingerprint)
-	entry, exists := c.cache[key]
-	if !exists {
-		return false, false
-	}
-
-	// Check if entry has expired
-	if time.Since(entry.Timestamp) > c.timeout {
-		return false, false
-	}
-
-	return entry.Trusted, true
+	return c.cache.Get(c.cacheKey(userEmail, deviceFingerprint))
 }
 
 // Set stores a trust entry in cache
 func (c *DeviceTrustCache) Set(userEmail, deviceFingerprint string, trusted bool) {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	key := c.cacheKey(userEmail, deviceFingerprint)
-	c.cache[key] = &deviceTrustEntry{
-		Timestamp: time.Now(),
-		Trusted:   trusted,
-	}
+	c.cache.Set(c.cacheKey(userEmail, deviceFingerprint), trusted)
 }
 
 // Delete removes an entry from cache
 func (c *DeviceTrustCache) Delete(userEmail, deviceFingerprint string) {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	key := c.cacheKey(userEmail, deviceFingerprint)
-	delete(c.cache, key)
+	c.cache.Delete(c.cacheKey(userEmail, deviceFingerprint))
 }
 
 // Clear removes all expired entries
 func (c *DeviceTrustCache) Clear() {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	now := time.Now()
-	for key, entry := range c.cache {
-		if now.Sub(entry.Timestamp) > c.timeout {
-			delete(c.cache, key)
-		}
-	}
+	c.cache.RemoveExpired()
 }
 
 func (c *DeviceTrustCache) cacheKey(userEmail, deviceFingerprint string) string {
@@ -0,0 +1,31 @@
+package domain
+
+import "testing"
+
+// TestDeviceTrustCache verifies trust results are cached per user and device,
+// including negative results, and can be removed
+func TestDeviceTrustCache(t *testing.T) {
+	cache := NewDeviceTrustCache()
+	cache.Set("user@example.com", "laptop", true)
+	cache.Set("user@example.com", "phone", false)
+
+	if trusted, found := cache.Get("user@example.com", "laptop"); !found || !trusted {
+		t.Errorf("Expected laptop to be cached as trusted, got trusted=%v found=%v", trusted, found)
+	}
+	if trusted, found := cache.Get("user@example.com", "phone"); !found || trusted {
+		t.Errorf("Expected phone to be cached as untrusted, got trusted=%v found=%v", trusted, found)
+	}
+	if _, found := cache.Get("other@example.com", "laptop"); found {
+		t.Error("Expected trust to be cached per user")
+	}
+
+	cache.Delete("user@example.com", "laptop")
+	if _, found := cache.Get("user@example.com", "laptop"); found {
+		t.Error("Expected deleted device to miss")
+	}
+
+	cache.Clear()
+	if _, found := cache.Get("user@example.com", "phone"); !found {
+		t.Error("Expected Clear to keep unexpired entries")
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"net/url"
 
 	"github.com/gin-gonic/gin"
+	"github.com/rs/zerolog/log"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/auth/domain"
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/auth/service"
@@ -77,10 +78,11 @@ func (h *AuthHandler) Callback(c *gin.Context) {
 		deviceRequest := h.extractDeviceTrustRequest(c)
 		if err := h.authService.MarkDeviceTrusted(c.Request.Context(), result.User.Email, deviceRequest); err != nil {
 			// Non-fatal error - log but don't fail the callback
-			fmt.Printf("[DEVICE TRUST] Warning: Could not mark device as trusted: %v\n", err)
-		} else {
+			log.Warn().Err(err).Msg("[DEVICE TRUST] Could not mark device as trusted")
+		} else if e := log.Debug(); e.Enabled() {
+			// The fingerprint is only recomputed for this message, so skip it unless debug logging is on
 			fingerprint := deviceRequest.GenerateFingerprint()
-			fmt.Printf("[DEVICE TRUST] Device %s... marked as trusted for %s\n", fingerprint[:8], result.User.Email)
+			e.Str("device", fingerprint[:8]).Str("email", result.User.Email).Msg("[DEVICE TRUST] Device marked as trusted")
 		}
 	}
 
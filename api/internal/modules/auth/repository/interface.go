@@ -13,11 +13,13 @@ type AuthRepository interface {
 	CreateUser(ctx context.Context, user *domain.User) error
 	GetUserByEmail(ctx context.Context, email string) (*domain.User, error)
 	UpdateUser(ctx context.Context, user *domain.User) error
+	SaveLogin(ctx context.Context, user *domain.User, accessToken, refreshToken string, expiry time.Time) error
 
 	// Token operations
 	SaveTokens(ctx context.Context, email, accessToken, refreshToken string, expiry time.Time) error
-	GetTokens(ctx context.Context, email string) (accessToken, refreshToken string, err error)
+	GetTokens(ctx context.Context, email string) (accessToken, refreshToken string, expiresAt time.Time, err error)
 	DeleteTokens(ctx context.Context, email string) error
+	ClearCredentialsCache(email string)
 
 	// Device trust operations (1:1 with Python)
 	GetTrustedDevice(ctx context.Context, email, fingerprint string) (*domain.TrustedDevice, error)
@@ -4,13 +4,13 @@ import (
 	"context"
 	"errors"
 	"fmt"
-	"sync"
 	"time"
 
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgxpool"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/auth/domain"
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
 )
 
 // ============================================================================
@@ -20,84 +20,93 @@ import (
 const (
 	// CredentialCacheTimeout is the cache timeout for credentials (5 minutes, 1:1 with Python)
 	CredentialCacheTimeout = 5 * time.Minute
+
+	// CredentialExpirySkew is how long before the token's real expiry a cached copy stops being served
+	CredentialExpirySkew = 60 * time.Second
+
+	// CredentialCacheMaxEntries bounds how many users' credentials are kept in memory
+	CredentialCacheMaxEntries = 10000
+
+	// CredentialSharedCacheTimeout caps the in-memory copy when a shared store is configured,
+	// so tokens rotated by another replica are picked up within seconds instead of minutes
+	CredentialSharedCacheTimeout = 30 * time.Second
 )
 
-// cachedCredentials stores cached token data with timestamp
+// credentialsTTL returns how long credentials expiring at expiry may be cached.
+// Tokens without a known expiry fall back to CredentialCacheTimeout.
+func credentialsTTL(expiry time.Time) time.Duration {
+	if expiry.IsZero() {
+		return CredentialCacheTimeout
+	}
+	ttl := time.Until(expiry) - CredentialExpirySkew
+	if ttl < 0 {
+		return 0
+	}
+	return ttl
+}
+
+// cachedCredentials stores cached token data
 type cachedCredentials struct {
 	accessToken  string
 	refreshToken string
-	timestamp    time.Time
+	tokenExpiry  time.Time // when the access token itself expires
 }
 
 // credentialsCache provides thread-safe credential caching (1:1 with Python _credentials_cache)
+// It holds at most CredentialCacheMaxEntries users and evicts the least recently used one
+// when full, so a long-running server doesn't grow it with every user who ever logged in
 type credentialsCache struct {
-	mu    sync.RWMutex
-	cache map[string]*cachedCredentials
+	cache *lru.Cache[string, cachedCredentials] // email -> credentials
 }
 
 // newCredentialsCache creates a new credentials cache
 func newCredentialsCache() *credentialsCache {
 	return &credentialsCache{
-		cache: make(map[string]*cachedCredentials),
+		cache: lru.New[string, cachedCredentials](CredentialCacheMaxEntries, CredentialCacheTimeout),
 	}
 }
 
 // get retrieves credentials from cache if not expired
-func (c *credentialsCache) get(email string) (accessToken, refreshToken string, found bool) {
-	c.mu.RLock()
-	defer c.mu.RUnlock()
-
-	key := fmt.Sprintf("creds_%s", email)
-	cached, ok := c.cache[key]
-	if !ok {
-		return "", "", false
-	}
-
-	// Check if cache has expired
-	if time.Since(cached.timestamp) > CredentialCacheTimeout {
-		// Cache expired - will be cleaned up on next set or explicit clear
-		return "", "", false
-	}
-
-	return cached.accessToken, cached.refreshToken, true
+func (c *credentialsCache) get(email string) (accessToken, refreshToken string, tokenExpiry time.Time, found bool) {
+	cached, found := c.cache.Get(email)
+	return cached.accessToken, cached.refreshToken, cached.tokenExpiry, found
 }
 
-// set stores credentials in cache
-func (c *credentialsCache) set(email, accessToken, refreshToken string) {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	key := fmt.Sprintf("creds_%s", email)
-	c.cache[key] = &cachedCredentials{
+// set stores credentials in cache for ttl. Other replicas may rotate the token,
+// so the in-memory copy is never kept longer than CredentialCacheTimeout.
+func (c *credentialsCache) set(email, accessToken, refreshToken string, tokenExpiry time.Time, ttl time.Duration) {
+	c.cache.SetWithTTL(email, cachedCredentials{
 		accessToken:  accessToken,
 		refreshToken: refreshToken,
-		timestamp:    time.Now(),
-	}
+		tokenExpiry:  tokenExpiry,
+	}, min(ttl, CredentialCacheTimeout))
 }
 
 // clear removes credentials from cache for a specific user
 func (c *credentialsCache) clear(email string) {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	key := fmt.Sprintf("creds_%s", email)
-	delete(c.cache, key)
+	c.cache.Delete(email)
 }
 
 // clearAll clears all cached credentials
 func (c *credentialsCache) clearAll() {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
-	c.cache = make(map[string]*cachedCredentials)
+	c.cache.Clear()
 }
 
 // Global credentials cache instance (1:1 with Python)
 var globalCredentialsCache = newCredentialsCache()
 
+// CredentialStore is a cache shared across processes (e.g. Redis), so restarted
+// processes and other replicas don't all go back to the database for tokens
+type CredentialStore interface {
+	GetCredentials(ctx context.Context, email string) (accessToken, refreshToken string, expiry time.Time, found bool)
+	SetCredentials(ctx context.Context, email, accessToken, refreshToken string, expiry time.Time, ttl time.Duration) error
+	DeleteCredentials(ctx context.Context, email string) error
+}
+
 // PostgresAuthRepository implements AuthRepository with PostgreSQL
 type PostgresAuthRepository struct {
-	pool *pgxpool.Pool
+	pool  *pgxpool.Pool
+	store CredentialStore
 }
 
 // NewPostgresAuthRepository creates a new PostgreSQL auth repository
@@ -105,6 +114,28 @@ func NewPostgresAuthRepository(pool *pgxpool.Pool) *PostgresAuthRepository {
 	return &PostgresAuthRepository{pool: pool}
 }
 
+// SetCredentialStore sets the shared credential cache (optional)
+func (r *PostgresAuthRepository) SetCredentialStore(store CredentialStore) {
+	r.store = store
+}
+
+// localTTL returns how long credentials may stay in this process's memory. Other replicas
+// only invalidate the shared store, so with one configured the local copy is kept briefly
+func (r *PostgresAuthRepository) localTTL(ttl time.Duration) time.Duration {
+	if r.store != nil && ttl > CredentialSharedCacheTimeout {
+		return CredentialSharedCacheTimeout
+	}
+	return ttl
+}
+
+// clearCredentials drops cached credentials for a user from the in-memory and shared caches
+func (r *PostgresAuthRepository) clearCredentials(ctx context.Context, email string) {
+	globalCredentialsCache.clear(email)
+	if r.store != nil {
+		_ = r.store.DeleteCredentials(ctx, email)
+	}
+}
+
 // CreateUser creates a new user
 func (r *PostgresAuthRepository) CreateUser(ctx context.Context, user *domain.User) error {
 	query := `
@@ -167,6 +198,37 @@ func (r *PostgresAuthRepository) UpdateUser(ctx context.Context, user *domain.Us
 	return err
 }
 
+// SaveLogin upserts the user and their OAuth tokens in a single round trip.
+// Both statements go out as one batch (run as one implicit transaction), and
+// user.ID and user.CreatedAt are filled from the stored row.
+func (r *PostgresAuthRepository) SaveLogin(ctx context.Context, user *domain.User, accessToken, refreshToken string, expiry time.Time) error {
+	batch := &pgx.Batch{}
+	batch.Queue(`
+		INSERT INTO users (email, name, picture, created_at, last_login)
+		VALUES ($1, $2, $3, $4, $4)
+		ON CONFLICT (email)
+		DO UPDATE SET name = $2, picture = $3, last_login = $4
+		RETURNING id, created_at
+	`, user.Email, user.Name, user.Picture, user.LastLogin).QueryRow(func(row pgx.Row) error {
+		return row.Scan(&user.ID, &user.CreatedAt)
+	})
+	batch.Queue(`
+		INSERT INTO oauth_tokens (user_email, access_token, refresh_token, expiry, updated_at)
+		VALUES ($1, $2, $3, $4, NOW())
+		ON CONFLICT (user_email)
+		DO UPDATE SET access_token = $2, refresh_token = $3, expiry = $4, updated_at = NOW()
+	`, user.Email, accessToken, refreshToken, expiry)
+
+	if err := r.pool.SendBatch(ctx, batch).Close(); err != nil {
+		return err
+	}
+
+	// Clear cache after save so fresh credentials are fetched from DB (1:1 with Python)
+	r.clearCredentials(ctx, user.Email)
+
+	return nil
+}
+
 // SaveTokens saves OAuth tokens (1:1 with Python - clears cache after save)
 func (r *PostgresAuthRepository) SaveTokens(ctx context.Context, email, accessToken, refreshToken string, expiry time.Time) error {
 	query := `
@@ -182,38 +244,55 @@ func (r *PostgresAuthRepository) SaveTokens(ctx context.Context, email, accessTo
 	}
 
 	// Clear cache after save so fresh credentials are fetched from DB (1:1 with Python)
-	globalCredentialsCache.clear(email)
+	r.clearCredentials(ctx, email)
 
 	return nil
 }
 
-// GetTokens retrieves OAuth tokens (1:1 with Python get_credentials with caching)
-func (r *PostgresAuthRepository) GetTokens(ctx context.Context, email string) (accessToken, refreshToken string, err error) {
+// GetTokens retrieves OAuth tokens and the access token's expiry (zero if unknown)
+// (1:1 with Python get_credentials with caching)
+func (r *PostgresAuthRepository) GetTokens(ctx context.Context, email string) (accessToken, refreshToken string, expiresAt time.Time, err error) {
 	// Check cache first (1:1 with Python)
-	if cachedAccess, cachedRefresh, found := globalCredentialsCache.get(email); found {
+	if cachedAccess, cachedRefresh, cachedExpiry, found := globalCredentialsCache.get(email); found {
 		// Cache hit
-		return cachedAccess, cachedRefresh, nil
+		return cachedAccess, cachedRefresh, cachedExpiry, nil
+	}
+
+	// Then the shared cache, which survives restarts and is shared between replicas
+	if r.store != nil {
+		if storedAccess, storedRefresh, expiry, found := r.store.GetCredentials(ctx, email); found {
+			globalCredentialsCache.set(email, storedAccess, storedRefresh, expiry, r.localTTL(credentialsTTL(expiry)))
+			return storedAccess, storedRefresh, expiry, nil
+		}
 	}
 
 	// Cache miss - query database
 	query := `
-		SELECT access_token, refresh_token
+		SELECT access_token, refresh_token, expiry
 		FROM oauth_tokens
 		WHERE user_email = $1
 	`
 
-	err = r.pool.QueryRow(ctx, query, email).Scan(&accessToken, &refreshToken)
+	var expiry *time.Time
+	err = r.pool.QueryRow(ctx, query, email).Scan(&accessToken, &refreshToken, &expiry)
 	if errors.Is(err, pgx.ErrNoRows) {
-		return "", "", fmt.Errorf("tokens not found")
+		return "", "", time.Time{}, fmt.Errorf("tokens not found")
 	}
 	if err != nil {
-		return "", "", err
+		return "", "", time.Time{}, err
 	}
 
-	// Store in cache for future requests (1:1 with Python)
-	globalCredentialsCache.set(email, accessToken, refreshToken)
+	// Store in cache for future requests, until shortly before the token expires
+	if expiry != nil {
+		expiresAt = *expiry
+	}
+	ttl := credentialsTTL(expiresAt)
+	globalCredentialsCache.set(email, accessToken, refreshToken, expiresAt, r.localTTL(ttl))
+	if r.store != nil && ttl > 0 {
+		_ = r.store.SetCredentials(ctx, email, accessToken, refreshToken, expiresAt, ttl)
+	}
 
-	return accessToken, refreshToken, nil
+	return accessToken, refreshToken, expiresAt, nil
 }
 
 // DeleteTokens deletes OAuth tokens (1:1 with Python - clears cache)
@@ -225,14 +304,14 @@ func (r *PostgresAuthRepository) DeleteTokens(ctx context.Context, email string)
 	}
 
 	// Clear cache after delete (1:1 with Python)
-	globalCredentialsCache.clear(email)
+	r.clearCredentials(ctx, email)
 
 	return nil
 }
 
 // ClearCredentialsCache clears the credentials cache for a user (1:1 with Python clear_credentials_cache)
 func (r *PostgresAuthRepository) ClearCredentialsCache(email string) {
-	globalCredentialsCache.clear(email)
+	r.clearCredentials(context.Background(), email)
 }
 
 // ============================================================
@@ -286,9 +365,11 @@ func (r *PostgresAuthRepository) SaveTrustedDevice(ctx context.Context, device *
 	).Scan(&device.ID)
 }
 
-// DeleteTrustedDevice deletes a trusted device by ID
+// DeleteTrustedDevice deletes a trusted device by ID if it has expired
+// Re-trusting a device upserts the same row, so the expiry check keeps a late delete
+// from removing a device the user has just trusted again
 func (r *PostgresAuthRepository) DeleteTrustedDevice(ctx context.Context, id int64) error {
-	query := `DELETE FROM trusted_devices WHERE id = $1`
+	query := `DELETE FROM trusted_devices WHERE id = $1 AND expires_at < NOW()`
 	_, err := r.pool.Exec(ctx, query, id)
 	return err
 }
@@ -0,0 +1,30 @@
+package repository
+
+import (
+	"testing"
+	"time"
+)
+
+// TestCredentialsCache verifies credentials round-trip through the cache and that a
+// token too close to expiry replaces, rather than keeps, the cached copy
+func TestCredentialsCache(t *testing.T) {
+	cache := newCredentialsCache()
+	expiry := time.Now().Add(time.Hour)
+	cache.set("user@example.com", "access", "refresh", expiry, credentialsTTL(expiry))
+
+	access, refresh, tokenExpiry, found := cache.get("user@example.com")
+	if !found || access != "access" || refresh != "refresh" || !tokenExpiry.Equal(expiry) {
+		t.Errorf("Expected cached credentials, got %q/%q expiring %v (found=%v)", access, refresh, tokenExpiry, found)
+	}
+
+	cache.set("user@example.com", "expiring", "refresh", time.Now(), credentialsTTL(time.Now()))
+	if _, _, _, found := cache.get("user@example.com"); found {
+		t.Error("Expected credentials with no remaining TTL to drop the cached copy")
+	}
+
+	cache.set("user@example.com", "access", "refresh", expiry, time.Minute)
+	cache.clear("user@example.com")
+	if _, _, _, found := cache.get("user@example.com"); found {
+		t.Error("Expected cleared credentials to miss")
+	}
+}
@@ -6,9 +6,11 @@ import (
 	"fmt"
 	"io"
 	"net/http"
+	"sync"
 	"time"
 
 	"github.com/golang-jwt/jwt/v5"
+	"github.com/rs/zerolog/log"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/google"
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/auth/domain"
@@ -20,6 +22,10 @@ type AuthService struct {
 	repo        repository.AuthRepository
 	oauthClient *google.OAuthClient
 	jwtSecret   []byte
+	httpClient  *http.Client
+
+	// refreshing holds the emails whose tokens are being refreshed in the background
+	refreshing sync.Map
 }
 
 // NewAuthService creates a new auth service
@@ -32,6 +38,9 @@ func NewAuthService(
 		repo:        repo,
 		oauthClient: oauthClient,
 		jwtSecret:   []byte(jwtSecret),
+		httpClient: &http.Client{
+			Timeout: 10 * time.Second,
+		},
 	}
 }
 
@@ -54,7 +63,7 @@ func (s *AuthService) HandleCallback(ctx context.Context, code string) (*domain.
 		return nil, fmt.Errorf("failed to get user info: %w", err)
 	}
 
-	// Save or update user
+	// Save or update the user together with their OAuth tokens (one round trip)
 	user := &domain.User{
 		Email:     userInfo.Email,
 		Name:      userInfo.Name,
@@ -62,23 +71,8 @@ func (s *AuthService) HandleCallback(ctx context.Context, code string) (*domain.
 		LastLogin: time.Now(),
 	}
 
-	existingUser, _ := s.repo.GetUserByEmail(ctx, user.Email)
-	if existingUser != nil {
-		user.ID = existingUser.ID
-		user.CreatedAt = existingUser.CreatedAt
-		if err := s.repo.UpdateUser(ctx, user); err != nil {
-			return nil, fmt.Errorf("failed to update user: %w", err)
-		}
-	} else {
-		user.CreatedAt = time.Now()
-		if err := s.repo.CreateUser(ctx, user); err != nil {
-			return nil, fmt.Errorf("failed to create user: %w", err)
-		}
-	}
-
-	// Save OAuth tokens
-	if err := s.repo.SaveTokens(ctx, user.Email, token.AccessToken, token.RefreshToken, token.ExpiresAt); err != nil {
-		return nil, fmt.Errorf("failed to save tokens: %w", err)
+	if err := s.repo.SaveLogin(ctx, user, token.AccessToken, token.RefreshToken, token.ExpiresAt); err != nil {
+		return nil, fmt.Errorf("failed to save user: %w", err)
 	}
 
 	// Generate JWT
@@ -120,21 +114,85 @@ func (s *AuthService) RefreshToken(ctx context.Context, userEmail string) (*doma
 
 // Logout logs out a user
 func (s *AuthService) Logout(ctx context.Context, userEmail string) error {
-	return s.repo.DeleteTokens(ctx, userEmail)
+	if err := s.repo.DeleteTokens(ctx, userEmail); err != nil {
+		return err
+	}
+	s.oauthClient.ForgetHTTPClient(userEmail)
+	return nil
 }
 
+// TokenRefreshWindow is how long before expiry an access token is refreshed in the background
+const TokenRefreshWindow = 5 * time.Minute
+
+// tokenRefreshTimeout bounds a background token refresh
+const tokenRefreshTimeout = 30 * time.Second
+
 // GetUserTokens retrieves OAuth tokens for a user (implements UserTokenGetter)
+// A token that is about to expire is refreshed in the background while the still-valid one
+// is returned, so requests don't wait on Google's token endpoint or fail with a 401 first.
+// Only an already expired token is refreshed inline, and if that fails the error is returned
+// so callers can prompt the user to reconnect instead of calling GSC with a dead token.
 func (s *AuthService) GetUserTokens(ctx context.Context, email string) (accessToken, refreshToken string, err error) {
-	return s.repo.GetTokens(ctx, email)
+	accessToken, refreshToken, expiresAt, err := s.repo.GetTokens(ctx, email)
+	if err != nil || expiresAt.IsZero() || refreshToken == "" {
+		return accessToken, refreshToken, err
+	}
+
+	remaining := time.Until(expiresAt)
+	switch {
+	case remaining <= 0:
+		// Expired - the caller can't use it, so wait for a fresh one
+		newAccessToken, refreshErr := s.RefreshAndSaveTokens(ctx, email, refreshToken, "")
+		if refreshErr != nil {
+			return "", "", fmt.Errorf("failed to refresh expired token: %w", refreshErr)
+		}
+		return newAccessToken, refreshToken, nil
+	case remaining < TokenRefreshWindow:
+		s.refreshTokensAsync(email, refreshToken)
+	}
+
+	return accessToken, refreshToken, nil
+}
+
+// refreshTokensAsync refreshes a user's tokens in the background, at most once at a time per user.
+// It is detached from the request context so the request can return immediately.
+func (s *AuthService) refreshTokensAsync(email, refreshToken string) {
+	if _, inFlight := s.refreshing.LoadOrStore(email, struct{}{}); inFlight {
+		return
+	}
+
+	go func() {
+		defer s.refreshing.Delete(email)
+
+		ctx, cancel := context.WithTimeout(context.Background(), tokenRefreshTimeout)
+		defer cancel()
+
+		if _, err := s.RefreshAndSaveTokens(ctx, email, refreshToken, ""); err != nil {
+			log.Warn().Err(err).Str("user", email).Msg("[AUTH] Background token refresh failed")
+		}
+	}()
 }
 
 // RefreshAndSaveTokens refreshes OAuth tokens and saves them (1:1 with Python verify_gsc_credentials)
-// This is used by GSC service for automatic 401 retry
-func (s *AuthService) RefreshAndSaveTokens(ctx context.Context, email, refreshToken string) (string, error) {
+// This is used by GSC service for automatic 401 retry, passing the access token Google rejected
+// as failedAccessToken; pass "" to refresh unconditionally
+func (s *AuthService) RefreshAndSaveTokens(ctx context.Context, email, refreshToken, failedAccessToken string) (string, error) {
 	if refreshToken == "" {
 		return "", fmt.Errorf("no refresh token available")
 	}
 
+	if failedAccessToken != "" {
+		// The rejected token may be a stale cached copy, so drop the cached credentials and
+		// check what is actually stored. If another request already rotated the token, use
+		// that one instead of refreshing again; otherwise the stored token is the one Google
+		// rejected, whatever its expiry says, so refresh it
+		s.repo.ClearCredentialsCache(email)
+		accessToken, _, expiresAt, err := s.repo.GetTokens(ctx, email)
+		if err == nil && accessToken != failedAccessToken && (expiresAt.IsZero() || time.Now().Before(expiresAt)) {
+			return accessToken, nil
+		}
+	}
+
 	// Refresh with Google
 	newTokens, err := s.oauthClient.RefreshToken(ctx, refreshToken)
 	if err != nil {
@@ -188,8 +246,7 @@ func (s *AuthService) getUserInfo(ctx context.Context, accessToken string) (*dom
 
 	req.Header.Set("Authorization", "Bearer "+accessToken)
 
-	client := &http.Client{Timeout: 10 * time.Second}
-	resp, err := client.Do(req)
+	resp, err := s.httpClient.Do(req)
 	if err != nil {
 		return nil, err
 	}
@@ -215,14 +272,15 @@ func (s *AuthService) getUserInfo(ctx context.Context, accessToken string) (*dom
 // generateJWT generates a JWT token (1:1 with Python - 30 minutes expiry)
 func (s *AuthService) generateJWT(email string) (string, int64, error) {
 	expiresIn := int64(30 * 60) // 30 minutes in seconds (1:1 with Python)
-	expiresAt := time.Now().Add(30 * time.Minute)
+	now := time.Now()
+	expiresAt := now.Add(30 * time.Minute)
 
 	// 1:1 with Python auth/utils.py:40-44 - include both 'email' and 'sub' claims
 	claims := jwt.MapClaims{
 		"sub":   email, // 1:1 with Python - 'sub' claim for backwards compatibility
 		"email": email, // 1:1 with Python - standard email claim
 		"exp":   expiresAt.Unix(),
-		"iat":   time.Now().Unix(),
+		"iat":   now.Unix(),
 	}
 
 	token := jwt.NewWithClaims(jwt.SigningMethodHS256, claims)
@@ -261,9 +319,10 @@ func (s *AuthService) IsDeviceTrusted(ctx context.Context, userEmail string, dev
 
 	// Check if device trust has expired
 	if device.IsDeviceExpired() {
-		// Remove expired device
-		_ = s.repo.DeleteTrustedDevice(ctx, device.ID)
+		// Cache the negative result right away so later checks don't read the stale row,
+		// then remove the expired device without holding up the login
 		domain.GlobalDeviceTrustCache.Set(userEmail, fingerprint, false)
+		s.deleteTrustedDeviceAsync(device.ID)
 		return false
 	}
 
@@ -272,17 +331,34 @@ func (s *AuthService) IsDeviceTrusted(ctx context.Context, userEmail string, dev
 	return true
 }
 
+// deviceCleanupTimeout bounds the background delete of an expired trusted device
+const deviceCleanupTimeout = 10 * time.Second
+
+// deleteTrustedDeviceAsync removes an expired trusted device record in the background.
+// It is best-effort cleanup, so it is detached from the request context.
+func (s *AuthService) deleteTrustedDeviceAsync(id int64) {
+	go func() {
+		ctx, cancel := context.WithTimeout(context.Background(), deviceCleanupTimeout)
+		defer cancel()
+
+		if err := s.repo.DeleteTrustedDevice(ctx, id); err != nil {
+			log.Warn().Err(err).Int64("device_id", id).Msg("[DEVICE TRUST] Failed to delete expired device")
+		}
+	}()
+}
+
 // MarkDeviceTrusted marks a device as trusted for 30 days (1:1 with Python)
 func (s *AuthService) MarkDeviceTrusted(ctx context.Context, userEmail string, deviceRequest *domain.DeviceTrustRequest) error {
 	fingerprint := deviceRequest.GenerateFingerprint()
 
 	// Create trusted device record
+	now := time.Now()
 	device := &domain.TrustedDevice{
 		UserEmail:         userEmail,
 		DeviceFingerprint: fingerprint,
 		UserAgent:         deviceRequest.UserAgent,
-		CreatedAt:         time.Now(),
-		ExpiresAt:         time.Now().Add(time.Duration(domain.DeviceTrustTimeout) * time.Second),
+		CreatedAt:         now,
+		ExpiresAt:         now.Add(time.Duration(domain.DeviceTrustTimeout) * time.Second),
 	}
 
 	// Save to database
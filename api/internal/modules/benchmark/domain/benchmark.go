@@ -9,12 +9,29 @@ type BenchmarkInsights struct {
 
 // VisibilityPerformance represents visibility assessment
 type VisibilityPerformance struct {
-	OverallAssessment string                 `json:"overall_assessment"`
-	Metrics           map[string]interface{} `json:"metrics"`
-	Score             float64                `json:"score,omitempty"`
-	Trend             string                 `json:"trend,omitempty"` // improving, declining, stable
+	OverallAssessment string             `json:"overall_assessment"`
+	Metrics           *VisibilityMetrics `json:"metrics"`
+	Score             float64            `json:"score,omitempty"`
+	Trend             string             `json:"trend,omitempty"` // improving, declining, stable
 }
 
+// VisibilityMetrics is the metrics block of a visibility assessment (1:1 with Python)
+type VisibilityMetrics struct {
+	Impressions       int     `json:"impressions"`
+	Clicks            int     `json:"clicks"`
+	CTR               float64 `json:"ctr"` // percentage
+	Position          float64 `json:"position"`
+	ImpressionsChange int     `json:"impressions_change"`
+	ClicksChange      int     `json:"clicks_change"`
+}
+
+// Trend values for VisibilityPerformance.Trend (1:1 with Python)
+const (
+	TrendImproving = "improving"
+	TrendStable    = "stable"
+	TrendDeclining = "declining"
+)
+
 // Analysis represents overall SEO analysis
 type Analysis struct {
 	Summary         string   `json:"summary"`
@@ -5,7 +5,6 @@ import (
 	"encoding/json"
 	"fmt"
 	"net/http"
-	"strings"
 	"time"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/gemini"
@@ -45,6 +44,7 @@ type BenchmarkService struct {
 	websiteGetter  WebsiteGetter
 	dashboardCache DashboardCacheGetter // For storing/retrieving ai_insights (1:1 with Python)
 	aiClient       BenchmarkAIClient    // For AI-powered insights (1:1 with Python)
+	insightsCache  *insightsCache       // AI insights keyed by prompt input hash
 }
 
 // NewBenchmarkService creates a new benchmark service
@@ -59,6 +59,7 @@ func NewBenchmarkService(
 		oauthClient:   oauthClient,
 		tokenGetter:   tokenGetter,
 		websiteGetter: websiteGetter,
+		insightsCache: newInsightsCache(),
 	}
 }
 
@@ -85,23 +86,18 @@ func (s *BenchmarkService) GetBenchmarkInsights(ctx context.Context, userEmail s
 	}
 
 	// Check cache if not explicit request (1:1 with Python)
-	if s.dashboardCache != nil {
-		cachedData, err := s.dashboardCache.GetCache(ctx, userEmail, websiteURL)
-		if err == nil && cachedData != nil {
-			// Check if ai_insights exists in cache (1:1 with Python)
-			if aiInsights, ok := cachedData["ai_insights"]; ok && aiInsights != nil {
-				if insightsMap, ok := aiInsights.(map[string]interface{}); ok {
-					// Return cached insights if not explicit request
-					if !explicit {
-						return s.convertCachedInsights(insightsMap), nil
-					}
+	if !explicit {
+		if s.dashboardCache != nil {
+			cachedData, err := s.dashboardCache.GetCache(ctx, userEmail, websiteURL)
+			if err == nil && cachedData != nil {
+				// Return cached insights if ai_insights exists in cache (1:1 with Python)
+				if insightsMap, ok := cachedData["ai_insights"].(map[string]interface{}); ok {
+					return s.convertCachedInsights(insightsMap), nil
 				}
 			}
 		}
-	}
 
-	// If not explicit and no cache, return 404 (1:1 with Python)
-	if !explicit {
+		// If not explicit and no cache, return 404 (1:1 with Python)
 		return nil, apperrors.New(apperrors.CodeNotFound, "No cached AI analysis available. Please generate AI analysis explicitly.", 404)
 	}
 
@@ -124,6 +120,8 @@ func (s *BenchmarkService) GetBenchmarkInsights(ctx context.Context, userEmail s
 	insights := s.generateInsights(ctx, websiteURL, metrics)
 
 	// Save to cache (1:1 with Python)
+	// SaveCache replaces the whole row, so it is read only now: dashboard data written while
+	// the GSC fetch and AI call ran must not be overwritten with an older copy
 	if s.dashboardCache != nil {
 		cachedData, _ := s.dashboardCache.GetCache(ctx, userEmail, websiteURL)
 		if cachedData == nil {
@@ -178,13 +176,23 @@ func (s *BenchmarkService) generateAIInsights(ctx context.Context, websiteURL st
 		PositionChange:    metrics.PositionChange,
 	}
 
-	// Build the benchmark prompt
-	benchmarkPrompt := gemini.BuildBenchmarkPrompt(websiteURL, promptMetrics, seoStage)
+	// The system prompt is static, so identical metrics produce the same request; reuse the
+	// earlier answer instead of building the prompt and calling the model again
+	cacheKey := insightsCacheKey(websiteURL, promptMetrics, seoStage)
+	if cached, ok := s.insightsCache.get(cacheKey); ok {
+		log.Debug().Str("website", websiteURL).Msg("Reusing cached AI benchmark insights")
+		return cached, nil
+	}
+
+	// Build the per-request metrics section of the benchmark prompt
+	metricsPrompt := gemini.BuildBenchmarkMetricsPrompt(websiteURL, promptMetrics, seoStage)
 
 	// Create messages for AI
+	// The static analysis instructions go first as the system instruction so the prompt prefix
+	// is identical on every call; only the user turn carries this site's metrics
 	messages := []gemini.Message{
-		{Role: "system", Content: benchmarkPrompt},
-		{Role: "user", Content: "Analyze these SEO metrics and provide comprehensive insights in JSON format."},
+		{Role: "system", Content: gemini.BenchmarkAnalysisPrompt},
+		{Role: "user", Content: metricsPrompt + "\n\nAnalyze these SEO metrics and provide comprehensive insights in JSON format."},
 	}
 
 	// Call AI
@@ -193,115 +201,88 @@ func (s *BenchmarkService) generateAIInsights(ctx context.Context, websiteURL st
 		return nil, fmt.Errorf("AI API error: %w", err)
 	}
 
+	if response.Content == "" {
+		return nil, fmt.Errorf("AI returned an empty response")
+	}
+
 	// Parse AI response
-	return s.parseAIResponse(response.Content, metrics, seoScore, seoStage)
+	// JSON mode should rule out malformed output, so a parse failure is surfaced as an error
+	// instead of being treated as a routine template fallback
+	insights, err := s.parseAIResponse(response.Content, metrics, seoScore, seoStage)
+	if err != nil {
+		log.Error().
+			Err(err).
+			Int("response_length", len(response.Content)).
+			Str("model", response.Model).
+			Msg("AI benchmark response was not valid JSON")
+		return nil, err
+	}
+
+	s.insightsCache.set(cacheKey, insights)
+
+	return insights, nil
 }
 
 // parseAIResponse parses the AI JSON response into BenchmarkInsights (1:1 with Python)
 func (s *BenchmarkService) parseAIResponse(content string, metrics *google.AggregatedMetrics, seoScore float64, seoStage string) (*domain.BenchmarkInsights, error) {
-	// Clean the response (remove markdown code blocks if present)
-	content = strings.TrimSpace(content)
-	content = strings.TrimPrefix(content, "```json")
-	content = strings.TrimPrefix(content, "```")
-	content = strings.TrimSuffix(content, "```")
-	content = strings.TrimSpace(content)
-
-	// Parse JSON response
-	var aiResponse struct {
-		VisibilityPerformance struct {
-			OverallAssessment string  `json:"overall_assessment"`
-			Score             float64 `json:"score"`
-			Trend             string  `json:"trend"`
-		} `json:"visibility_performance"`
-		Analysis struct {
-			Summary         string   `json:"summary"`
-			Strengths       []string `json:"strengths"`
-			Improvements    []string `json:"improvements"`
-			Recommendations []string `json:"recommendations"`
-		} `json:"analysis"`
-	}
-
-	if err := json.Unmarshal([]byte(content), &aiResponse); err != nil {
+	// ChatWithBenchmark requests structured JSON output matching BenchmarkResponseSchema, whose
+	// shape is the domain type itself, so the content is decoded straight into it (no markdown
+	// fence stripping or intermediate struct needed)
+	var insights domain.BenchmarkInsights
+	if err := json.Unmarshal([]byte(content), &insights); err != nil {
 		return nil, fmt.Errorf("failed to parse AI response: %w", err)
 	}
 
+	// Both sections are required by the schema; a response without them falls back to the template
+	vp := insights.VisibilityPerformance
+	if vp == nil || insights.Analysis == nil {
+		return nil, fmt.Errorf("AI response is missing required sections")
+	}
+
+	// Metrics always come from GSC, never from the model
+	vp.Metrics = visibilityMetrics(metrics, metrics.AverageCTR*100)
+
 	// Use AI score if valid, otherwise use calculated
-	score := aiResponse.VisibilityPerformance.Score
-	if score <= 0 || score > 100 {
-		score = seoScore
+	if vp.Score <= 0 || vp.Score > 100 {
+		vp.Score = seoScore
 	}
 
 	// Validate trend
-	trend := aiResponse.VisibilityPerformance.Trend
-	if trend != "improving" && trend != "stable" && trend != "declining" {
-		if metrics.ImpressionsChange > 10 {
-			trend = "improving"
-		} else if metrics.ImpressionsChange < -10 {
-			trend = "declining"
-		} else {
-			trend = "stable"
-		}
+	if vp.Trend != domain.TrendImproving && vp.Trend != domain.TrendStable && vp.Trend != domain.TrendDeclining {
+		vp.Trend = trendFromImpressionsChange(metrics.ImpressionsChange)
 	}
 
-	return &domain.BenchmarkInsights{
-		VisibilityPerformance: &domain.VisibilityPerformance{
-			OverallAssessment: aiResponse.VisibilityPerformance.OverallAssessment,
-			Metrics: map[string]interface{}{
-				"impressions":        metrics.TotalImpressions,
-				"clicks":             metrics.TotalClicks,
-				"ctr":                metrics.AverageCTR * 100,
-				"position":           metrics.AveragePosition,
-				"impressions_change": metrics.ImpressionsChange,
-				"clicks_change":      metrics.ClicksChange,
-			},
-			Score: score,
-			Trend: trend,
-		},
-		Analysis: &domain.Analysis{
-			Summary:         aiResponse.Analysis.Summary,
-			Strengths:       aiResponse.Analysis.Strengths,
-			Improvements:    aiResponse.Analysis.Improvements,
-			Recommendations: aiResponse.Analysis.Recommendations,
-		},
-		GeneratedAt: time.Now().Format(time.RFC3339),
-	}, nil
+	insights.GeneratedAt = time.Now().Format(time.RFC3339)
+
+	return &insights, nil
 }
 
 // generateTemplateInsights creates template-based insights (fallback)
 func (s *BenchmarkService) generateTemplateInsights(metrics *google.AggregatedMetrics, seoScore float64, seoStage string) *domain.BenchmarkInsights {
 	// Determine trend based on comparison data
-	trend := "stable"
-	if metrics.ImpressionsChange > 10 {
-		trend = "improving"
-	} else if metrics.ImpressionsChange < -10 {
-		trend = "declining"
-	}
+	trend := trendFromImpressionsChange(metrics.ImpressionsChange)
+
+	// CTR as a percentage is shared by every template section, so derive it once
+	ctrPercentage := metrics.AverageCTR * 100
 
 	// Generate overall assessment
 	assessment := s.generateAssessment(metrics, seoScore, seoStage)
 
 	// Generate strengths and improvements
-	strengths, improvements := s.analyzeStrengthsAndImprovements(metrics)
+	strengths, improvements := s.analyzeStrengthsAndImprovements(metrics, ctrPercentage)
 
 	// Generate recommendations
-	recommendations := s.generateRecommendations(metrics, seoStage)
+	recommendations := s.generateRecommendations(metrics, ctrPercentage, seoStage)
 
 	return &domain.BenchmarkInsights{
 		VisibilityPerformance: &domain.VisibilityPerformance{
 			OverallAssessment: assessment,
-			Metrics: map[string]interface{}{
-				"impressions":        metrics.TotalImpressions,
-				"clicks":             metrics.TotalClicks,
-				"ctr":                metrics.AverageCTR * 100, // Convert to percentage
-				"position":           metrics.AveragePosition,
-				"impressions_change": metrics.ImpressionsChange,
-				"clicks_change":      metrics.ClicksChange,
-			},
-			Score: seoScore,
-			Trend: trend,
+			Metrics:           visibilityMetrics(metrics, ctrPercentage),
+			Score:             seoScore,
+			Trend:             trend,
 		},
 		Analysis: &domain.Analysis{
-			Summary:         s.generateSummary(metrics, seoStage),
+			Summary:         s.generateSummary(metrics, ctrPercentage, seoStage),
 			Strengths:       strengths,
 			Improvements:    improvements,
 			Recommendations: recommendations,
@@ -310,22 +291,77 @@ func (s *BenchmarkService) generateTemplateInsights(metrics *google.AggregatedMe
 	}
 }
 
+// trendFromImpressionsChange derives the visibility trend from the period-over-period impressions change
+func trendFromImpressionsChange(change int) string {
+	if change > 10 {
+		return domain.TrendImproving
+	} else if change < -10 {
+		return domain.TrendDeclining
+	}
+	return domain.TrendStable
+}
+
+// visibilityMetrics builds the metrics block shared by AI and template insights (1:1 with Python)
+// ctrPercentage is the average CTR already converted to a percentage
+func visibilityMetrics(metrics *google.AggregatedMetrics, ctrPercentage float64) *domain.VisibilityMetrics {
+	return &domain.VisibilityMetrics{
+		Impressions:       metrics.TotalImpressions,
+		Clicks:            metrics.TotalClicks,
+		CTR:               ctrPercentage,
+		Position:          metrics.AveragePosition,
+		ImpressionsChange: metrics.ImpressionsChange,
+		ClicksChange:      metrics.ClicksChange,
+	}
+}
+
+// Static template text for the fallback insights, shared across requests so only
+// the metric-dependent parts are built per call
+var stageSummaryAdvice = map[string]string{
+	string(scoring.StageHidden):       "Your primary focus should be on increasing visibility through content creation and technical SEO improvements.",
+	string(scoring.StageEmerging):     "Continue building content and focus on keyword optimization to accelerate growth.",
+	string(scoring.StageDiscoverable): "Optimize your top-performing pages and work on improving click-through rates.",
+	string(scoring.StageTrusted):      "Maintain your strong position and explore new keyword opportunities.",
+}
+
+var stageRecommendations = map[string][]string{
+	string(scoring.StageHidden): {
+		"Submit your sitemap to Google Search Console",
+		"Create high-quality content targeting relevant keywords",
+		"Ensure your website is properly indexed",
+	},
+	string(scoring.StageEmerging): {
+		"Expand your content with targeted blog posts",
+		"Build internal links between related pages",
+	},
+	string(scoring.StageDiscoverable): {
+		"Optimize your top-performing pages for better rankings",
+		"Consider building quality backlinks",
+	},
+	string(scoring.StageTrusted): {
+		"Maintain content freshness with regular updates",
+		"Explore new keyword opportunities in your niche",
+	},
+}
+
+// maxTemplateRecommendations caps the template recommendations list
+const maxTemplateRecommendations = 5
+
 // generateAssessment creates an overall assessment string
 func (s *BenchmarkService) generateAssessment(metrics *google.AggregatedMetrics, score float64, stage string) string {
 	switch stage {
-	case "hidden":
+	case string(scoring.StageHidden):
 		return fmt.Sprintf("Your website is currently in the Hidden stage with %d impressions. "+
 			"Your SEO score is %.0f/100. Focus on creating quality content and improving indexing to increase visibility.",
 			metrics.TotalImpressions, score)
-	case "emerging":
+	case string(scoring.StageEmerging):
 		return fmt.Sprintf("Your website is in the Emerging stage with %d impressions. "+
 			"Your SEO score is %.0f/100. You're building visibility - keep creating content and optimizing for targeted keywords.",
 			metrics.TotalImpressions, score)
-	case "discoverable":
+	case string(scoring.StageDiscoverable):
 		return fmt.Sprintf("Your website is Discoverable with %d impressions. "+
 			"Your SEO score is %.0f/100. You're gaining visibility! Focus on improving CTR and moving up in rankings.",
 			metrics.TotalImpressions, score)
-	case "trusted":
+	case string(scoring.StageTrusted):
 		return fmt.Sprintf("Excellent! Your website is in the Trusted stage with %d impressions. "+
 			"Your SEO score is %.0f/100. Maintain quality and explore new growth opportunities.",
 			metrics.TotalImpressions, score)
@@ -336,9 +372,7 @@ func (s *BenchmarkService) generateAssessment(metrics *google.AggregatedMetrics,
 }
 
 // generateSummary creates a summary of the SEO performance
-func (s *BenchmarkService) generateSummary(metrics *google.AggregatedMetrics, stage string) string {
-	ctrPercentage := metrics.AverageCTR * 100
-
+func (s *BenchmarkService) generateSummary(metrics *google.AggregatedMetrics, ctrPercentage float64, stage string) string {
 	summary := fmt.Sprintf("Over the last 30 days, your website received %d impressions and %d clicks, "+
 		"with an average CTR of %.2f%% and average position of %.1f. ",
 		metrics.TotalImpressions, metrics.TotalClicks, ctrPercentage, metrics.AveragePosition)
@@ -351,24 +385,17 @@ func (s *BenchmarkService) generateSummary(metrics *google.AggregatedMetrics, st
 	}
 
 	// Add stage-specific advice
-	switch stage {
-	case "hidden":
-		summary += "Your primary focus should be on increasing visibility through content creation and technical SEO improvements."
-	case "emerging":
-		summary += "Continue building content and focus on keyword optimization to accelerate growth."
-	case "discoverable":
-		summary += "Optimize your top-performing pages and work on improving click-through rates."
-	case "trusted":
-		summary += "Maintain your strong position and explore new keyword opportunities."
-	}
+	summary += stageSummaryAdvice[stage]
 
 	return summary
 }
 
 // analyzeStrengthsAndImprovements identifies strengths and areas for improvement
-func (s *BenchmarkService) analyzeStrengthsAndImprovements(metrics *google.AggregatedMetrics) ([]string, []string) {
-	var strengths, improvements []string
-	ctrPercentage := metrics.AverageCTR * 100
+func (s *BenchmarkService) analyzeStrengthsAndImprovements(metrics *google.AggregatedMetrics, ctrPercentage float64) ([]string, []string) {
+	// Each of the four metric checks adds at most one entry to either list, so
+	// size both up front instead of growing them append by append
+	strengths := make([]string, 0, 4)
+	improvements := make([]string, 0, 4)
 
 	// Analyze CTR
 	if ctrPercentage >= 5 {
@@ -409,34 +436,11 @@ func (s *BenchmarkService) analyzeStrengthsAndImprovements(metrics *google.Aggre
 }
 
 // generateRecommendations creates actionable recommendations
-func (s *BenchmarkService) generateRecommendations(metrics *google.AggregatedMetrics, stage string) []string {
-	var recommendations []string
-	ctrPercentage := metrics.AverageCTR * 100
+func (s *BenchmarkService) generateRecommendations(metrics *google.AggregatedMetrics, ctrPercentage float64, stage string) []string {
+	recommendations := make([]string, 0, maxTemplateRecommendations)
 
 	// Stage-specific recommendations
-	switch stage {
-	case "hidden":
-		recommendations = append(recommendations,
-			"Submit your sitemap to Google Search Console",
-			"Create high-quality content targeting relevant keywords",
-			"Ensure your website is properly indexed",
-		)
-	case "emerging":
-		recommendations = append(recommendations,
-			"Expand your content with targeted blog posts",
-			"Build internal links between related pages",
-		)
-	case "discoverable":
-		recommendations = append(recommendations,
-			"Optimize your top-performing pages for better rankings",
-			"Consider building quality backlinks",
-		)
-	case "trusted":
-		recommendations = append(recommendations,
-			"Maintain content freshness with regular updates",
-			"Explore new keyword opportunities in your niche",
-		)
-	}
+	recommendations = append(recommendations, stageRecommendations[stage]...)
 
 	// CTR-based recommendations
 	if ctrPercentage < 2 {
@@ -449,8 +453,8 @@ func (s *BenchmarkService) generateRecommendations(metrics *google.AggregatedMet
 	}
 
 	// Limit to 5 recommendations
-	if len(recommendations) > 5 {
-		recommendations = recommendations[:5]
+	if len(recommendations) > maxTemplateRecommendations {
+		recommendations = recommendations[:maxTemplateRecommendations]
 	}
 
 	return recommendations
@@ -463,7 +467,7 @@ func (s *BenchmarkService) getHTTPClient(ctx context.Context, userEmail string)
 		return nil, apperrors.New(apperrors.CodeUnauthorized, "Failed to get user tokens", 401)
 	}
 
-	return s.oauthClient.GetHTTPClient(ctx, accessToken, refreshToken), nil
+	return s.oauthClient.GetHTTPClient(ctx, userEmail, accessToken, refreshToken), nil
 }
 
 // convertCachedInsights converts cached map to BenchmarkInsights (1:1 with Python)
@@ -474,7 +478,7 @@ func (s *BenchmarkService) convertCachedInsights(data map[string]interface{}) *d
 	if vp, ok := data["visibility_performance"].(map[string]interface{}); ok {
 		insights.VisibilityPerformance = &domain.VisibilityPerformance{
 			OverallAssessment: getStringValue(vp, "overall_assessment"),
-			Metrics:           getMapValue(vp, "metrics"),
+			Metrics:           getVisibilityMetrics(vp, "metrics"),
 			Score:             getFloatValue(vp, "score"),
 			Trend:             getStringValue(vp, "trend"),
 		}
@@ -545,15 +549,28 @@ func getFloatValue(m map[string]interface{}, key string) float64 {
 	return 0
 }
 
-func getMapValue(m map[string]interface{}, key string) map[string]interface{} {
-	if v, ok := m[key].(map[string]interface{}); ok {
+func getVisibilityMetrics(m map[string]interface{}, key string) *domain.VisibilityMetrics {
+	// A map after a JSON round-trip, or the typed block when cached in-process
+	switch v := m[key].(type) {
+	case map[string]interface{}:
+		return &domain.VisibilityMetrics{
+			Impressions:       int(getFloatValue(v, "impressions")),
+			Clicks:            int(getFloatValue(v, "clicks")),
+			CTR:               getFloatValue(v, "ctr"),
+			Position:          getFloatValue(v, "position"),
+			ImpressionsChange: int(getFloatValue(v, "impressions_change")),
+			ClicksChange:      int(getFloatValue(v, "clicks_change")),
+		}
+	case *domain.VisibilityMetrics:
 		return v
 	}
 	return nil
 }
 
 func getStringSlice(m map[string]interface{}, key string) []string {
-	if v, ok := m[key].([]interface{}); ok {
+	// Single lookup; the value is a []interface{} after a JSON round-trip or a []string when cached in-process
+	switch v := m[key].(type) {
+	case []interface{}:
 		result := make([]string, 0, len(v))
 		for _, item := range v {
 			if str, ok := item.(string); ok {
@@ -561,8 +578,7 @@ func getStringSlice(m map[string]interface{}, key string) []string {
 			}
 		}
 		return result
-	}
-	if v, ok := m[key].([]string); ok {
+	case []string:
 		return v
 	}
 	return nil
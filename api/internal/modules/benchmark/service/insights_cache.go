@@ -0,0 +1,106 @@
+package service
+
+import (
+	"time"
+
+	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/gemini"
+	"github.com/petpeevephobia/solvia-v2/api/internal/modules/benchmark/domain"
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
+)
+
+const (
+	// AIInsightsCacheTTL is how long generated AI insights are reused for identical metrics
+	AIInsightsCacheTTL = time.Hour
+
+	// aiInsightsCacheMaxEntries bounds the in-process cache size
+	aiInsightsCacheMaxEntries = 1000
+)
+
+// insightsKey is the fingerprint of everything the benchmark prompt is built from.
+// The prompt quotes these values verbatim, so insights can only be shared between
+// requests whose inputs match exactly
+type insightsKey struct {
+	websiteURL        string
+	seoStage          string
+	impressions       int
+	clicks            int
+	ctr               float64
+	position          float64
+	seoScore          float64
+	impressionsChange float64
+	clicksChange      float64
+	ctrChange         float64
+	positionChange    float64
+}
+
+// insightsCache provides thread-safe caching of AI insights keyed by the prompt
+// inputs, so identical metrics don't pay for another model call. It holds at most
+// aiInsightsCacheMaxEntries results and evicts the least recently used one when full
+type insightsCache struct {
+	cache *lru.Cache[insightsKey, *domain.BenchmarkInsights]
+}
+
+// newInsightsCache creates a new insights cache
+func newInsightsCache() *insightsCache {
+	return &insightsCache{
+		cache: lru.New[insightsKey, *domain.BenchmarkInsights](aiInsightsCacheMaxEntries, AIInsightsCacheTTL),
+	}
+}
+
+// insightsCacheKey builds the cache key from the prompt inputs, so a hit is detected
+// before the prompt is formatted
+func insightsCacheKey(websiteURL string, metrics *gemini.WebsiteMetrics, seoStage string) insightsKey {
+	return insightsKey{
+		websiteURL:        websiteURL,
+		seoStage:          seoStage,
+		impressions:       metrics.Impressions,
+		clicks:            metrics.Clicks,
+		ctr:               metrics.CTR,
+		position:          metrics.Position,
+		seoScore:          metrics.SEOScore,
+		impressionsChange: metrics.ImpressionsChange,
+		clicksChange:      metrics.ClicksChange,
+		ctrChange:         metrics.CTRChange,
+		positionChange:    metrics.PositionChange,
+	}
+}
+
+// get retrieves a copy of the cached insights if not expired. GeneratedAt keeps the
+// time the model produced them, which is at most AIInsightsCacheTTL ago
+func (c *insightsCache) get(key insightsKey) (*domain.BenchmarkInsights, bool) {
+	insights, ok := c.cache.Get(key)
+	if !ok {
+		return nil, false
+	}
+	return copyInsights(insights), true
+}
+
+// set stores a copy of insights in cache, evicting the least recently used entry when full
+func (c *insightsCache) set(key insightsKey, insights *domain.BenchmarkInsights) {
+	c.cache.Set(key, copyInsights(insights))
+}
+
+// copyInsights deep-copies insights so callers can't modify the cached value
+func copyInsights(insights *domain.BenchmarkInsights) *domain.BenchmarkInsights {
+	if insights == nil {
+		return nil
+	}
+
+	out := *insights
+	if vp := insights.VisibilityPerformance; vp != nil {
+		vpCopy := *vp
+		if vp.Metrics != nil {
+			metrics := *vp.Metrics
+			vpCopy.Metrics = &metrics
+		}
+		out.VisibilityPerformance = &vpCopy
+	}
+	if a := insights.Analysis; a != nil {
+		analysis := *a
+		analysis.Strengths = append([]string(nil), a.Strengths...)
+		analysis.Improvements = append([]string(nil), a.Improvements...)
+		analysis.Recommendations = append([]string(nil), a.Recommendations...)
+		out.Analysis = &analysis
+	}
+	return &out
+}
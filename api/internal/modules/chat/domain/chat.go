@@ -2,7 +2,6 @@ package domain
 
 import (
 	"context"
-	"fmt"
 	"time"
 )
 
@@ -30,6 +29,13 @@ type AIClient interface {
 
 	// ChatWithRAG generates a chat response with RAG-optimized settings
 	ChatWithRAG(ctx context.Context, messages []AIMessage) (*AIResponse, error)
+
+	// ChatStream generates a chat response with default settings, passing each piece
+	// of text to onChunk as it arrives
+	ChatStream(ctx context.Context, messages []AIMessage, onChunk func(text string) error) (*AIResponse, error)
+
+	// ChatStreamWithRAG streams a chat response with RAG-optimized settings
+	ChatStreamWithRAG(ctx context.Context, messages []AIMessage, onChunk func(text string) error) (*AIResponse, error)
 }
 
 // MessageRole represents the role of a message sender
@@ -79,6 +85,15 @@ type ChatResponse struct {
 	ActionButtons  []string `json:"action_buttons,omitempty"`  // 1:1 with Python - suggested follow-up actions
 }
 
+// ChatStreamEvent is a single Server-Sent Event on the streaming chat endpoint.
+// Partial text arrives as Delta; the final event carries the full Response with Done set
+type ChatStreamEvent struct {
+	Delta    string        `json:"delta,omitempty"`
+	Done     bool          `json:"done,omitempty"`
+	Response *ChatResponse `json:"response,omitempty"`
+	Error    string        `json:"error,omitempty"`
+}
+
 // ConversationWithMessages includes conversation with its messages
 type ConversationWithMessages struct {
 	Conversation *Conversation `json:"conversation"`
@@ -157,11 +172,3 @@ var DefaultActionButtons = []string{
 	"What are my top issues?",
 	"Show me traffic trends",
 }
-
-func formatInt(n int) string {
-	return fmt.Sprintf("%d", n)
-}
-
-func formatFloat(f float64) string {
-	return fmt.Sprintf("%.2f", f)
-}
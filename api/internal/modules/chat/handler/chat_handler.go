@@ -45,6 +45,48 @@ func (h *ChatHandler) Chat(c *gin.Context) {
 	response.Success(c, http.StatusOK, resp)
 }
 
+// ChatStream processes a chat message and streams the reply as Server-Sent Events.
+// Errors raised before the first chunk use the normal JSON error response
+func (h *ChatHandler) ChatStream(c *gin.Context) {
+	userEmail := c.GetString("user_email")
+	if userEmail == "" {
+		response.Error(c, http.StatusUnauthorized, "UNAUTHORIZED", "User not authenticated")
+		return
+	}
+
+	var req domain.ChatRequest
+	if err := c.ShouldBindJSON(&req); err != nil {
+		response.Error(c, http.StatusBadRequest, "BAD_REQUEST", "Message is required")
+		return
+	}
+
+	streaming := false
+	resp, err := h.chatService.ChatStream(c.Request.Context(), userEmail, &req, func(text string) error {
+		if !streaming {
+			response.SetSSEHeaders(c)
+			streaming = true
+		}
+		return response.SSEEvent(c.Writer, domain.ChatStreamEvent{Delta: text})
+	})
+	if err != nil {
+		if !streaming {
+			handleError(c, err)
+			return
+		}
+		message := "An unexpected error occurred"
+		if appErr := apperrors.GetAppError(err); appErr != nil {
+			message = appErr.Message
+		}
+		_ = response.SSEEvent(c.Writer, domain.ChatStreamEvent{Error: message})
+		return
+	}
+
+	if !streaming {
+		response.SetSSEHeaders(c)
+	}
+	_ = response.SSEEvent(c.Writer, domain.ChatStreamEvent{Done: true, Response: resp})
+}
+
 // GetConversation retrieves a conversation with messages
 func (h *ChatHandler) GetConversation(c *gin.Context) {
 	userEmail := c.GetString("user_email")
@@ -4,7 +4,7 @@ import (
 	"context"
 	"fmt"
 	"strings"
-	"time"
+	"sync"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/gemini"
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/chat/domain"
@@ -80,10 +80,11 @@ var auditTriggerKeywords = []string{
 }
 
 // Exact match keywords (when message is exactly one of these)
-var auditTriggerExact = []string{
-	"audit",
-	"run",
-	"analyze",
+// Stored lowercased as a set so the check is a single lookup
+var auditTriggerExact = map[string]struct{}{
+	"audit":   {},
+	"run":     {},
+	"analyze": {},
 }
 
 // detectAuditTrigger checks if message contains audit trigger keywords (matching Python exactly)
@@ -91,10 +92,8 @@ func detectAuditTrigger(message string) bool {
 	lowerMessage := strings.ToLower(strings.TrimSpace(message))
 
 	// Check for exact matches first
-	for _, exact := range auditTriggerExact {
-		if lowerMessage == exact {
-			return true
-		}
+	if _, ok := auditTriggerExact[lowerMessage]; ok {
+		return true
 	}
 
 	// Check for keyword phrases
@@ -108,6 +107,17 @@ func detectAuditTrigger(message string) bool {
 
 // Chat processes a chat message and returns a response (1:1 with Python)
 func (s *ChatService) Chat(ctx context.Context, userEmail string, req *domain.ChatRequest) (*domain.ChatResponse, error) {
+	return s.chat(ctx, userEmail, req, nil)
+}
+
+// ChatStream processes a chat message like Chat, but passes the assistant's reply to
+// onChunk as it is generated. The returned response holds the complete message
+func (s *ChatService) ChatStream(ctx context.Context, userEmail string, req *domain.ChatRequest, onChunk func(text string) error) (*domain.ChatResponse, error) {
+	return s.chat(ctx, userEmail, req, onChunk)
+}
+
+// chat handles both the buffered and streaming paths; onChunk is nil when not streaming
+func (s *ChatService) chat(ctx context.Context, userEmail string, req *domain.ChatRequest, onChunk func(text string) error) (*domain.ChatResponse, error) {
 	var conv *domain.Conversation
 	var err error
 
@@ -126,8 +136,6 @@ func (s *ChatService) Chat(ctx context.Context, userEmail string, req *domain.Ch
 			UserEmail:  userEmail,
 			WebsiteURL: req.WebsiteURL,
 			Title:      generateTitle(req.Message),
-			CreatedAt:  time.Now(),
-			UpdatedAt:  time.Now(),
 		}
 		if err := s.repo.CreateConversation(ctx, conv); err != nil {
 			return nil, apperrors.DatabaseError(err)
@@ -162,7 +170,6 @@ func (s *ChatService) Chat(ctx context.Context, userEmail string, req *domain.Ch
 		ConversationID: conv.ID,
 		Role:           domain.RoleUser,
 		Content:        req.Message,
-		CreatedAt:      time.Now(),
 	}
 	if err := s.repo.SaveMessage(ctx, userMsg); err != nil {
 		return nil, apperrors.DatabaseError(err)
@@ -175,10 +182,16 @@ func (s *ChatService) Chat(ctx context.Context, userEmail string, req *domain.Ch
 	// 1:1 with Python: RAG uses lower temperature for deterministic responses
 	var response *domain.AIResponse
 	var aiErr error
-	if s.ragProvider != nil && req.IncludeMetrics {
+	useRAG := s.ragProvider != nil && req.IncludeMetrics
+	switch {
+	case onChunk != nil && useRAG:
+		response, aiErr = s.aiClient.ChatStreamWithRAG(ctx, messages, onChunk)
+	case onChunk != nil:
+		response, aiErr = s.aiClient.ChatStream(ctx, messages, onChunk)
+	case useRAG:
 		// Use ChatWithRAG for lower temperature and higher tokens
 		response, aiErr = s.aiClient.ChatWithRAG(ctx, messages)
-	} else {
+	default:
 		// Use standard Chat for regular conversations
 		response, aiErr = s.aiClient.Chat(ctx, messages)
 	}
@@ -194,7 +207,6 @@ func (s *ChatService) Chat(ctx context.Context, userEmail string, req *domain.Ch
 		Role:           domain.RoleAssistant,
 		Content:        assistantContent,
 		TokensUsed:     response.TokensUsed,
-		CreatedAt:      time.Now(),
 	}
 	if err := s.repo.SaveMessage(ctx, assistantMsg); err != nil {
 		return nil, apperrors.DatabaseError(err)
@@ -223,87 +235,119 @@ func (s *ChatService) buildEnhancedSystemPrompt(ctx context.Context, userEmail,
 		return gemini.SEOSystemPrompt
 	}
 
-	// Fetch GSC metrics for context injection (now includes weekly and daily data)
-	var metricsData *gemini.WebsiteMetrics
+	// GSC metrics, audit context and RAG context are independent lookups (GSC API, database,
+	// embeddings + vector search), so fetch them concurrently instead of one after another
+	var (
+		wg         sync.WaitGroup
+		websiteCtx *domain.WebsiteContext
+		auditCtx   *domain.AuditContext
+		ragContext string
+	)
+
 	if s.metricsProvider != nil {
-		websiteCtx, err := s.metricsProvider.GetWebsiteContext(ctx, userEmail, websiteURL)
-		if err == nil && websiteCtx != nil {
-			metricsData = &gemini.WebsiteMetrics{
-				Impressions:       websiteCtx.Impressions,
-				Clicks:            websiteCtx.Clicks,
-				CTR:               websiteCtx.CTR,
-				Position:          websiteCtx.Position,
-				SEOScore:          websiteCtx.SEOScore,
-				ImpressionsChange: websiteCtx.ImpressionsChange,
-				ClicksChange:      websiteCtx.ClicksChange,
-				CTRChange:         websiteCtx.CTRChange,
-				PositionChange:    websiteCtx.PositionChange,
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if c, err := s.metricsProvider.GetWebsiteContext(ctx, userEmail, websiteURL); err == nil {
+				websiteCtx = c
 			}
+		}()
+	}
 
-			// Add weekly data for "last week" queries
-			if websiteCtx.WeeklyMetrics != nil {
-				wm := websiteCtx.WeeklyMetrics
-				metricsData.WeeklyData = &gemini.WeeklyData{
-					LastWeekImpressions: wm.LastWeekImpressions,
-					LastWeekClicks:      wm.LastWeekClicks,
-					LastWeekCTR:         wm.LastWeekCTR,
-					LastWeekPosition:    wm.LastWeekPosition,
-					PrevWeekImpressions: wm.PrevWeekImpressions,
-					PrevWeekClicks:      wm.PrevWeekClicks,
-					PrevWeekCTR:         wm.PrevWeekCTR,
-					PrevWeekPosition:    wm.PrevWeekPosition,
-					ImpressionsChange:   wm.ImpressionsChange,
-					ClicksChange:        wm.ClicksChange,
-					CTRChange:           wm.CTRChange,
-					PositionChange:      wm.PositionChange,
-				}
+	if s.auditProvider != nil {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if c, err := s.auditProvider.GetLatestAuditContext(ctx, userEmail, websiteURL); err == nil {
+				auditCtx = c
 			}
+		}()
+	}
 
-			// Add daily trend data for "show trends" queries
-			if len(websiteCtx.DailyTrend) > 0 {
-				for _, day := range websiteCtx.DailyTrend {
-					metricsData.DailyTrend = append(metricsData.DailyTrend, gemini.DailyPoint{
-						Date:        day.Date,
-						Impressions: day.Impressions,
-						Clicks:      day.Clicks,
-						CTR:         day.CTR,
-						Position:    day.Position,
-					})
-				}
+	if s.ragProvider != nil && userQuery != "" {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if c, err := s.ragProvider.GetRAGContext(ctx, userEmail, userQuery, websiteURL); err == nil {
+				ragContext = c
 			}
-		}
+		}()
 	}
 
-	// Fetch audit context for injection
-	var auditData *gemini.AuditContext
-	if s.auditProvider != nil {
-		auditCtx, err := s.auditProvider.GetLatestAuditContext(ctx, userEmail, websiteURL)
-		if err == nil && auditCtx != nil {
-			auditData = &gemini.AuditContext{
-				AuditDate: auditCtx.AuditDate,
-				SEOScore:  auditCtx.SEOScore,
-				SEOStage:  auditCtx.SEOStage,
+	wg.Wait()
+
+	// Convert GSC metrics for context injection (now includes weekly and daily data)
+	var metricsData *gemini.WebsiteMetrics
+	if websiteCtx != nil {
+		metricsData = &gemini.WebsiteMetrics{
+			Impressions:       websiteCtx.Impressions,
+			Clicks:            websiteCtx.Clicks,
+			CTR:               websiteCtx.CTR,
+			Position:          websiteCtx.Position,
+			SEOScore:          websiteCtx.SEOScore,
+			ImpressionsChange: websiteCtx.ImpressionsChange,
+			ClicksChange:      websiteCtx.ClicksChange,
+			CTRChange:         websiteCtx.CTRChange,
+			PositionChange:    websiteCtx.PositionChange,
+		}
+
+		// Add weekly data for "last week" queries
+		if websiteCtx.WeeklyMetrics != nil {
+			wm := websiteCtx.WeeklyMetrics
+			metricsData.WeeklyData = &gemini.WeeklyData{
+				LastWeekImpressions: wm.LastWeekImpressions,
+				LastWeekClicks:      wm.LastWeekClicks,
+				LastWeekCTR:         wm.LastWeekCTR,
+				LastWeekPosition:    wm.LastWeekPosition,
+				PrevWeekImpressions: wm.PrevWeekImpressions,
+				PrevWeekClicks:      wm.PrevWeekClicks,
+				PrevWeekCTR:         wm.PrevWeekCTR,
+				PrevWeekPosition:    wm.PrevWeekPosition,
+				ImpressionsChange:   wm.ImpressionsChange,
+				ClicksChange:        wm.ClicksChange,
+				CTRChange:           wm.CTRChange,
+				PositionChange:      wm.PositionChange,
 			}
-			// Convert issues
-			for _, issue := range auditCtx.Issues {
-				auditData.Issues = append(auditData.Issues, gemini.AuditIssue{
-					Severity:    issue.Severity,
-					Title:       issue.Title,
-					Description: issue.Description,
+		}
+
+		// Add daily trend data for "show trends" queries
+		if len(websiteCtx.DailyTrend) > 0 {
+			for _, day := range websiteCtx.DailyTrend {
+				metricsData.DailyTrend = append(metricsData.DailyTrend, gemini.DailyPoint{
+					Date:        day.Date,
+					Impressions: day.Impressions,
+					Clicks:      day.Clicks,
+					CTR:         day.CTR,
+					Position:    day.Position,
 				})
 			}
 		}
 	}
 
+	// Convert audit context for injection
+	var auditData *gemini.AuditContext
+	if auditCtx != nil {
+		auditData = &gemini.AuditContext{
+			AuditDate: auditCtx.AuditDate,
+			SEOScore:  auditCtx.SEOScore,
+			SEOStage:  auditCtx.SEOStage,
+		}
+		// Convert issues
+		for _, issue := range auditCtx.Issues {
+			auditData.Issues = append(auditData.Issues, gemini.AuditIssue{
+				Severity:    issue.Severity,
+				Title:       issue.Title,
+				Description: issue.Description,
+			})
+		}
+	}
+
 	// Build base enhanced prompt
 	basePrompt := gemini.BuildEnhancedSystemPrompt(websiteURL, metricsData, auditData)
 
 	// Add RAG context if available (1:1 with Python)
-	if s.ragProvider != nil && userQuery != "" {
-		ragContext, err := s.ragProvider.GetRAGContext(ctx, userEmail, userQuery, websiteURL)
-		if err == nil && ragContext != "" {
-			basePrompt += "\n\n## RELEVANT KNOWLEDGE BASE CONTEXT:\n" + ragContext
-		}
+	if ragContext != "" {
+		basePrompt += "\n\n## RELEVANT KNOWLEDGE BASE CONTEXT:\n" + ragContext
 	}
 
 	return basePrompt
@@ -215,38 +215,28 @@ func GetDatePreset(presetName string) (*DateRangePreset, error) {
 	now := time.Now()
 	endDate := now.AddDate(0, 0, -1) // GSC data available until yesterday
 
-	presets := map[string]*DateRangePreset{
-		"24h": {
-			StartDate: endDate.Format("2006-01-02"),
-			EndDate:   endDate.Format("2006-01-02"),
-			Days:      1,
-			Name:      "Last 24 hours",
-		},
-		"7d": {
-			StartDate: endDate.AddDate(0, 0, -6).Format("2006-01-02"),
-			EndDate:   endDate.Format("2006-01-02"),
-			Days:      7,
-			Name:      "Last 7 days",
-		},
-		"28d": {
-			StartDate: endDate.AddDate(0, 0, -27).Format("2006-01-02"),
-			EndDate:   endDate.Format("2006-01-02"),
-			Days:      28,
-			Name:      "Last 28 days",
-		},
-		"3mo": {
-			StartDate: endDate.AddDate(0, 0, -89).Format("2006-01-02"),
-			EndDate:   endDate.Format("2006-01-02"),
-			Days:      90,
-			Name:      "Last 3 months",
-		},
+	// Only the requested preset is built, and the shared end date is formatted once
+	var days int
+	var name string
+	switch presetName {
+	case "24h":
+		days, name = 1, "Last 24 hours"
+	case "7d":
+		days, name = 7, "Last 7 days"
+	case "28d":
+		days, name = 28, "Last 28 days"
+	case "3mo":
+		days, name = 90, "Last 3 months"
+	default:
+		return nil, nil // Will be handled as error in handler
 	}
 
-	if preset, ok := presets[presetName]; ok {
-		return preset, nil
-	}
-
-	return nil, nil // Will be handled as error in handler
+	return &DateRangePreset{
+		StartDate: endDate.AddDate(0, 0, -(days - 1)).Format("2006-01-02"),
+		EndDate:   endDate.Format("2006-01-02"),
+		Days:      days,
+		Name:      name,
+	}, nil
 }
 
 // GetAvailablePresets returns all available preset names
@@ -12,6 +12,7 @@ type GSCRepository interface {
 	// Website operations
 	GetWebsites(ctx context.Context, userEmail string) ([]domain.Website, error)
 	SaveWebsite(ctx context.Context, website *domain.Website) error
+	SaveWebsites(ctx context.Context, websites []domain.Website) error
 	UpdateLastSync(ctx context.Context, userEmail, siteURL string) error
 
 	// Selected website operations (1:1 parity with original Python)
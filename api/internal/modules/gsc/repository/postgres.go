@@ -9,16 +9,32 @@ import (
 	"github.com/jackc/pgx/v5/pgxpool"
 
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/gsc/domain"
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
 )
 
+// SelectedWebsiteCacheTimeout is how long a user's selected website is served from memory.
+// Kept short since a selection made on another instance only shows up once the entry expires.
+const SelectedWebsiteCacheTimeout = 1 * time.Minute
+
+// SelectedWebsiteCacheMaxEntries bounds how many users' selections are kept in memory
+const SelectedWebsiteCacheMaxEntries = 10000
+
 // PostgresGSCRepository implements GSCRepository with PostgreSQL
 type PostgresGSCRepository struct {
 	pool *pgxpool.Pool
+
+	// The selected website is looked up by nearly every dashboard, benchmark and
+	// website request, but only changes when the user picks another property.
+	// Bounded to SelectedWebsiteCacheMaxEntries, evicting the least recently used user
+	selected *lru.Cache[string, string] // email -> website URL
 }
 
 // NewPostgresGSCRepository creates a new PostgreSQL GSC repository
 func NewPostgresGSCRepository(pool *pgxpool.Pool) *PostgresGSCRepository {
-	return &PostgresGSCRepository{pool: pool}
+	return &PostgresGSCRepository{
+		pool:     pool,
+		selected: lru.New[string, string](SelectedWebsiteCacheMaxEntries, SelectedWebsiteCacheTimeout),
+	}
 }
 
 // GetWebsites returns all connected websites for a user
@@ -70,6 +86,42 @@ func (r *PostgresGSCRepository) SaveWebsite(ctx context.Context, website *domain
 	).Scan(&website.ID)
 }
 
+// SaveWebsites saves or updates several website connections in a single round trip,
+// filling in each website's ID
+func (r *PostgresGSCRepository) SaveWebsites(ctx context.Context, websites []domain.Website) error {
+	if len(websites) == 0 {
+		return nil
+	}
+
+	query := `
+		INSERT INTO gsc_connections (user_email, website_url, permission_level, connected_at)
+		VALUES ($1, $2, $3, $4)
+		ON CONFLICT (user_email, website_url)
+		DO UPDATE SET permission_level = EXCLUDED.permission_level
+		RETURNING id
+	`
+
+	now := time.Now()
+	batch := &pgx.Batch{}
+	for i := range websites {
+		website := &websites[i]
+		connectedAt := website.ConnectedAt
+		if connectedAt.IsZero() {
+			connectedAt = now
+		}
+		batch.Queue(query,
+			website.UserEmail,
+			website.SiteURL,
+			website.PermissionLevel,
+			connectedAt,
+		).QueryRow(func(row pgx.Row) error {
+			return row.Scan(&website.ID)
+		})
+	}
+
+	return r.pool.SendBatch(ctx, batch).Close()
+}
+
 // UpdateLastSync updates the last sync timestamp
 func (r *PostgresGSCRepository) UpdateLastSync(ctx context.Context, userEmail, siteURL string) error {
 	query := `UPDATE gsc_connections SET last_sync_at = NOW() WHERE user_email = $1 AND website_url = $2`
@@ -79,18 +131,22 @@ func (r *PostgresGSCRepository) UpdateLastSync(ctx context.Context, userEmail, s
 
 // GetSelectedWebsite returns the user's selected website URL (1:1 parity with original Python)
 func (r *PostgresGSCRepository) GetSelectedWebsite(ctx context.Context, userEmail string) (string, error) {
+	if websiteURL, ok := r.selected.Get(userEmail); ok {
+		return websiteURL, nil
+	}
+
 	query := `SELECT website_url FROM user_websites WHERE user_email = $1`
 
 	var websiteURL string
 	err := r.pool.QueryRow(ctx, query, userEmail).Scan(&websiteURL)
 
-	if errors.Is(err, pgx.ErrNoRows) {
-		return "", nil // No website selected, return empty string
-	}
-	if err != nil {
+	if err != nil && !errors.Is(err, pgx.ErrNoRows) {
 		return "", err
 	}
 
+	// No row means no website selected; cache the empty string too
+	r.selected.Set(userEmail, websiteURL)
+
 	return websiteURL, nil
 }
 
@@ -103,8 +159,13 @@ func (r *PostgresGSCRepository) SetSelectedWebsite(ctx context.Context, userEmai
 		DO UPDATE SET website_url = EXCLUDED.website_url, updated_at = NOW()
 	`
 
-	_, err := r.pool.Exec(ctx, query, userEmail, websiteURL)
-	return err
+	if _, err := r.pool.Exec(ctx, query, userEmail, websiteURL); err != nil {
+		return err
+	}
+
+	r.selected.Set(userEmail, websiteURL)
+
+	return nil
 }
 
 // GetCachedMetrics retrieves cached metrics if available
@@ -131,16 +192,16 @@ func (r *PostgresGSCRepository) GetCachedMetrics(ctx context.Context, userEmail,
 	return &m, nil
 }
 
-// SaveMetrics caches metrics
+// SaveMetrics caches metrics and records the sync on the website connection.
+// Both writes go out as one batch, so a refresh costs a single round trip.
 func (r *PostgresGSCRepository) SaveMetrics(ctx context.Context, metrics *domain.Metrics) error {
-	query := `
+	batch := &pgx.Batch{}
+	batch.Queue(`
 		INSERT INTO gsc_metrics_cache (user_email, website_url, start_date, end_date, seo_score, impressions, clicks, ctr, avg_position, cache_date)
 		VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, CURRENT_DATE)
 		ON CONFLICT (user_email, website_url, start_date, end_date, cache_date)
 		DO UPDATE SET seo_score = EXCLUDED.seo_score, impressions = EXCLUDED.impressions, clicks = EXCLUDED.clicks, ctr = EXCLUDED.ctr, avg_position = EXCLUDED.avg_position
-	`
-
-	_, err := r.pool.Exec(ctx, query,
+	`,
 		metrics.UserEmail,
 		metrics.WebsiteURL,
 		metrics.StartDate.Format("2006-01-02"),
@@ -151,8 +212,10 @@ func (r *PostgresGSCRepository) SaveMetrics(ctx context.Context, metrics *domain
 		metrics.CTR,
 		metrics.Position,
 	)
+	batch.Queue(`UPDATE gsc_connections SET last_sync_at = NOW() WHERE user_email = $1 AND website_url = $2`,
+		metrics.UserEmail, metrics.WebsiteURL)
 
-	return err
+	return r.pool.SendBatch(ctx, batch).Close()
 }
 
 // InvalidateMetricsCache removes cached metrics for a user/website (for refresh)
@@ -189,20 +252,23 @@ func (r *PostgresGSCRepository) GetDailySummary(ctx context.Context, userEmail,
 	return metrics, rows.Err()
 }
 
-// SaveDailySummary saves daily metrics
+// SaveDailySummary saves daily metrics, sending all rows in a single batch
 func (r *PostgresGSCRepository) SaveDailySummary(ctx context.Context, userEmail, websiteURL string, metrics []domain.DailyMetric) error {
+	if len(metrics) == 0 {
+		return nil
+	}
+
+	query := `
+		INSERT INTO gsc_daily_summary (user_email, website_url, date, impressions, clicks, ctr, avg_position)
+		VALUES ($1, $2, $3, $4, $5, $6, $7)
+		ON CONFLICT (user_email, website_url, date)
+		DO UPDATE SET impressions = EXCLUDED.impressions, clicks = EXCLUDED.clicks, ctr = EXCLUDED.ctr, avg_position = EXCLUDED.avg_position
+	`
+
+	batch := &pgx.Batch{}
 	for _, m := range metrics {
-		query := `
-			INSERT INTO gsc_daily_summary (user_email, website_url, date, impressions, clicks, ctr, avg_position)
-			VALUES ($1, $2, $3, $4, $5, $6, $7)
-			ON CONFLICT (user_email, website_url, date)
-			DO UPDATE SET impressions = EXCLUDED.impressions, clicks = EXCLUDED.clicks, ctr = EXCLUDED.ctr, avg_position = EXCLUDED.avg_position
-		`
-
-		if _, err := r.pool.Exec(ctx, query, userEmail, websiteURL, m.Date, m.Impressions, m.Clicks, m.CTR, m.Position); err != nil {
-			return err
-		}
+		batch.Queue(query, userEmail, websiteURL, m.Date, m.Impressions, m.Clicks, m.CTR, m.Position)
 	}
 
-	return nil
+	return r.pool.SendBatch(ctx, batch).Close()
 }
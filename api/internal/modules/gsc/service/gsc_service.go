@@ -4,6 +4,7 @@ import (
 	"context"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/rs/zerolog/log"
@@ -13,6 +14,7 @@ import (
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/gsc/domain"
 	"github.com/petpeevephobia/solvia-v2/api/internal/modules/gsc/repository"
 	apperrors "github.com/petpeevephobia/solvia-v2/api/internal/shared/errors"
+	"github.com/petpeevephobia/solvia-v2/api/internal/shared/lru"
 	"github.com/petpeevephobia/solvia-v2/api/internal/shared/scoring"
 )
 
@@ -33,8 +35,18 @@ type GSCService struct {
 	oauthClient       *google.OAuthClient
 	tokenGetter       UserTokenGetter
 	credentialDeleter CredentialDeleter // For clearing credentials (1:1 with Python)
+
+	// The GSC property list is requested on every properties page load but rarely changes.
+	// Bounded to SitesCacheMaxEntries, evicting the least recently used user
+	sites *lru.Cache[string, []google.Site] // email -> property list
 }
 
+// SitesCacheTimeout is how long a user's GSC property list is reused before asking GSC again
+const SitesCacheTimeout = 5 * time.Minute
+
+// SitesCacheMaxEntries bounds how many users' property lists are kept in memory
+const SitesCacheMaxEntries = 10000
+
 // NewGSCService creates a new GSC service
 func NewGSCService(
 	repo repository.GSCRepository,
@@ -49,6 +61,7 @@ func NewGSCService(
 		oauthClient:       oauthClient,
 		tokenGetter:       tokenGetter,
 		credentialDeleter: credentialDeleter,
+		sites:             lru.New[string, []google.Site](SitesCacheMaxEntries, SitesCacheTimeout),
 	}
 }
 
@@ -89,27 +102,27 @@ func (s *GSCService) SyncWebsites(ctx context.Context, userEmail string) ([]doma
 		return nil, err
 	}
 
-	// Fetch from GSC API
+	// Fetch from GSC API (always live for an explicit sync; refreshes the cached list too)
 	sites, err := s.gscClient.GetSites(ctx, client)
 	if err != nil {
 		return nil, apperrors.ExternalServiceError("Google Search Console", err)
 	}
+	s.sites.Set(userEmail, sites)
 
-	// Save to database
-	var websites []domain.Website
+	// Save to database (one batched round trip for all sites)
+	websites := make([]domain.Website, 0, len(sites))
+	now := time.Now()
 	for _, site := range sites {
-		website := &domain.Website{
+		websites = append(websites, domain.Website{
 			UserEmail:       userEmail,
 			SiteURL:         site.SiteURL,
 			PermissionLevel: site.PermissionLevel,
-			ConnectedAt:     time.Now(),
-		}
-
-		if err := s.repo.SaveWebsite(ctx, website); err != nil {
-			return nil, apperrors.DatabaseError(err)
-		}
+			ConnectedAt:     now,
+		})
+	}
 
-		websites = append(websites, *website)
+	if err := s.repo.SaveWebsites(ctx, websites); err != nil {
+		return nil, apperrors.DatabaseError(err)
 	}
 
 	return websites, nil
@@ -207,17 +220,30 @@ func (s *GSCService) GetMetrics(ctx context.Context, userEmail, websiteURL strin
 		Source: "live",
 	}
 
-	// Cache metrics
-	if err := s.repo.SaveMetrics(ctx, metrics); err != nil {
-		// Log but don't fail on cache error
-	}
-
-	// Update last sync
-	_ = s.repo.UpdateLastSync(ctx, userEmail, websiteURL)
+	// Cache metrics and update last sync (one round trip) without holding up the response
+	s.saveMetricsAsync(metrics)
 
 	return metrics, nil
 }
 
+// metricsCacheWriteTimeout bounds the background metrics cache write
+const metricsCacheWriteTimeout = 10 * time.Second
+
+// saveMetricsAsync writes the metrics cache in the background. The write is
+// best-effort, so it is detached from the request context and only logged on failure.
+// A copy is written so callers are free to modify the returned metrics.
+func (s *GSCService) saveMetricsAsync(m *domain.Metrics) {
+	metrics := *m
+	go func() {
+		ctx, cancel := context.WithTimeout(context.Background(), metricsCacheWriteTimeout)
+		defer cancel()
+
+		if err := s.repo.SaveMetrics(ctx, &metrics); err != nil {
+			log.Warn().Err(err).Str("website", metrics.WebsiteURL).Msg("[GSC] Failed to cache metrics")
+		}
+	}()
+}
+
 // GetQueries returns top queries for a website
 func (s *GSCService) GetQueries(ctx context.Context, userEmail, websiteURL string, filter domain.MetricsFilter) ([]domain.Query, error) {
 	client, err := s.getHTTPClient(ctx, userEmail)
@@ -286,7 +312,7 @@ func (s *GSCService) GetDailyMetrics(ctx context.Context, userEmail, websiteURL
 		return nil, apperrors.ExternalServiceError("Google Search Console", err)
 	}
 
-	var metrics []domain.DailyMetric
+	metrics := make([]domain.DailyMetric, 0, len(rows))
 	for _, row := range rows {
 		if len(row.Keys) > 0 {
 			date, _ := time.Parse("2006-01-02", row.Keys[0])
@@ -353,8 +379,15 @@ func (s *GSCService) GetWebsiteMetricsForChat(ctx context.Context, userEmail, we
 		PositionChange:    wsCtx.PositionChange,
 	}
 
+	// Both the weekly and daily fetches share one authenticated client
+	client, err := s.getHTTPClient(ctx, userEmail)
+	if err != nil {
+		log.Error().Err(err).Msg("[GSC] GetWebsiteMetricsForChat failed to get HTTP client")
+		return result, nil
+	}
+
 	// Fetch weekly data for "last week" queries (last 7 days vs previous 7 days)
-	weeklyData, err := s.getWeeklyComparison(ctx, userEmail, websiteURL)
+	weeklyData, err := s.getWeeklyComparison(ctx, client, websiteURL)
 	if err == nil && weeklyData != nil {
 		result.WeeklyMetrics = weeklyData
 		log.Debug().
@@ -365,7 +398,7 @@ func (s *GSCService) GetWebsiteMetricsForChat(ctx context.Context, userEmail, we
 	}
 
 	// Fetch daily trend data for "show trends" queries (last 7 days)
-	dailyTrend, err := s.getDailyTrendData(ctx, userEmail, websiteURL)
+	dailyTrend, err := s.getDailyTrendData(ctx, client, websiteURL)
 	if err == nil && dailyTrend != nil {
 		result.DailyTrend = dailyTrend
 		log.Debug().
@@ -384,12 +417,7 @@ func (s *GSCService) GetWebsiteMetricsForChat(ctx context.Context, userEmail, we
 }
 
 // getWeeklyComparison fetches last 7 days vs previous 7 days for "last week" queries
-func (s *GSCService) getWeeklyComparison(ctx context.Context, userEmail, websiteURL string) (*chatDomain.WeeklyMetrics, error) {
-	client, err := s.getHTTPClient(ctx, userEmail)
-	if err != nil {
-		return nil, err
-	}
-
+func (s *GSCService) getWeeklyComparison(ctx context.Context, client *http.Client, websiteURL string) (*chatDomain.WeeklyMetrics, error) {
 	// Calculate date ranges (accounting for 1-day GSC data delay)
 	now := time.Now()
 	endDate := now.AddDate(0, 0, -1)                          // Yesterday (GSC data delay)
@@ -397,16 +425,24 @@ func (s *GSCService) getWeeklyComparison(ctx context.Context, userEmail, website
 	prevEndDate := startDate.AddDate(0, 0, -1)                // Day before last week
 	prevStartDate := prevEndDate.AddDate(0, 0, -6)            // Previous 7 days
 
+	// Fetch previous week metrics concurrently with last week's
+	var prevWeekMetrics *google.AggregatedMetrics
+	var prevErr error
+	var prevWG sync.WaitGroup
+	prevWG.Add(1)
+	go func() {
+		defer prevWG.Done()
+		prevWeekMetrics, prevErr = s.gscClient.GetAggregatedMetrics(ctx, client, websiteURL, prevStartDate, prevEndDate, false)
+	}()
+
 	// Fetch last week metrics
 	lastWeekMetrics, err := s.gscClient.GetAggregatedMetrics(ctx, client, websiteURL, startDate, endDate, false)
+	prevWG.Wait()
 	if err != nil {
 		return nil, err
 	}
-
-	// Fetch previous week metrics
-	prevWeekMetrics, err := s.gscClient.GetAggregatedMetrics(ctx, client, websiteURL, prevStartDate, prevEndDate, false)
-	if err != nil {
-		return nil, err
+	if prevErr != nil {
+		return nil, prevErr
 	}
 
 	// Calculate week-over-week changes
@@ -432,18 +468,11 @@ func (s *GSCService) getWeeklyComparison(ctx context.Context, userEmail, website
 }
 
 // getDailyTrendData fetches daily metrics for the last 7 days for trend visualization
-func (s *GSCService) getDailyTrendData(ctx context.Context, userEmail, websiteURL string) ([]chatDomain.DailyPoint, error) {
+func (s *GSCService) getDailyTrendData(ctx context.Context, client *http.Client, websiteURL string) ([]chatDomain.DailyPoint, error) {
 	log.Debug().
-		Str("user", userEmail).
 		Str("website", websiteURL).
 		Msg("[GSC] getDailyTrendData called")
 
-	client, err := s.getHTTPClient(ctx, userEmail)
-	if err != nil {
-		log.Error().Err(err).Msg("[GSC] getDailyTrendData failed to get HTTP client")
-		return nil, err
-	}
-
 	// Calculate date range (last 7 days, accounting for 1-day GSC data delay)
 	now := time.Now()
 	endDate := now.AddDate(0, 0, -1)      // Yesterday
@@ -463,7 +492,7 @@ func (s *GSCService) getDailyTrendData(ctx context.Context, userEmail, websiteUR
 
 	log.Debug().Int("rows_returned", len(rows)).Msg("[GSC] getDailyTrendData raw rows from GSC")
 
-	var dailyPoints []chatDomain.DailyPoint
+	dailyPoints := make([]chatDomain.DailyPoint, 0, len(rows))
 	for _, row := range rows {
 		if len(row.Keys) > 0 {
 			dailyPoints = append(dailyPoints, chatDomain.DailyPoint{
@@ -497,7 +526,7 @@ type WebsiteContext struct {
 
 // TokenRefresher interface for refreshing and saving tokens
 type TokenRefresher interface {
-	RefreshAndSaveTokens(ctx context.Context, email, refreshToken string) (newAccessToken string, err error)
+	RefreshAndSaveTokens(ctx context.Context, email, refreshToken, failedAccessToken string) (newAccessToken string, err error)
 }
 
 // tokenRefresherImpl implements token refresh (set via SetTokenRefresher)
@@ -515,23 +544,23 @@ func (s *GSCService) getHTTPClient(ctx context.Context, userEmail string) (*http
 		return nil, apperrors.New(apperrors.CodeUnauthorized, "Failed to get user tokens", 401)
 	}
 
-	return s.oauthClient.GetHTTPClient(ctx, accessToken, refreshToken), nil
+	return s.oauthClient.GetHTTPClient(ctx, userEmail, accessToken, refreshToken), nil
 }
 
 // getHTTPClientWithRetry gets an HTTP client, and if the operation fails with 401, refreshes token and retries
 // This is 1:1 with Python's ULTRATHINK AUTOMATIC RETRY logic
-func (s *GSCService) getHTTPClientWithRetry(ctx context.Context, userEmail string) (*http.Client, string, error) {
-	accessToken, refreshToken, err := s.tokenGetter.GetUserTokens(ctx, userEmail)
+func (s *GSCService) getHTTPClientWithRetry(ctx context.Context, userEmail string) (client *http.Client, accessToken, refreshToken string, err error) {
+	accessToken, refreshToken, err = s.tokenGetter.GetUserTokens(ctx, userEmail)
 	if err != nil {
-		return nil, "", apperrors.New(apperrors.CodeUnauthorized, "Failed to get user tokens", 401)
+		return nil, "", "", apperrors.New(apperrors.CodeUnauthorized, "Failed to get user tokens", 401)
 	}
 
-	return s.oauthClient.GetHTTPClient(ctx, accessToken, refreshToken), refreshToken, nil
+	return s.oauthClient.GetHTTPClient(ctx, userEmail, accessToken, refreshToken), accessToken, refreshToken, nil
 }
 
 // executeWithAutoRefresh executes a GSC operation with automatic 401 retry (1:1 with Python)
 func (s *GSCService) executeWithAutoRefresh(ctx context.Context, userEmail string, operation func(*http.Client) error) error {
-	client, refreshToken, err := s.getHTTPClientWithRetry(ctx, userEmail)
+	client, accessToken, refreshToken, err := s.getHTTPClientWithRetry(ctx, userEmail)
 	if err != nil {
 		log.Error().Err(err).Msg("[GSC] executeWithAutoRefresh failed to get HTTP client")
 		return err
@@ -573,7 +602,7 @@ func (s *GSCService) executeWithAutoRefresh(ctx context.Context, userEmail strin
 	log.Info().Str("user", userEmail).Msg("[GSC] executeWithAutoRefresh: attempting token refresh")
 
 	// Refresh token
-	newAccessToken, refreshErr := gscTokenRefresher.RefreshAndSaveTokens(ctx, userEmail, refreshToken)
+	newAccessToken, refreshErr := gscTokenRefresher.RefreshAndSaveTokens(ctx, userEmail, refreshToken, accessToken)
 	if refreshErr != nil {
 		log.Error().Err(refreshErr).Msg("[GSC] executeWithAutoRefresh: token refresh failed")
 		return err // Return original error if refresh fails
@@ -582,7 +611,7 @@ func (s *GSCService) executeWithAutoRefresh(ctx context.Context, userEmail strin
 	log.Info().Msg("[GSC] executeWithAutoRefresh: token refreshed successfully, retrying operation")
 
 	// Retry with new token
-	newClient := s.oauthClient.GetHTTPClient(ctx, newAccessToken, refreshToken)
+	newClient := s.oauthClient.GetHTTPClient(ctx, userEmail, newAccessToken, refreshToken)
 	return operation(newClient)
 }
 
@@ -811,16 +840,20 @@ func (s *GSCService) RefreshMetrics(ctx context.Context, userEmail string) (*dom
 
 // GetProperties returns GSC properties (alias for GetWebsites) (1:1 with Python /gsc/properties)
 func (s *GSCService) GetProperties(ctx context.Context, userEmail string) ([]domain.Website, error) {
-	// Get HTTP client
-	client, err := s.getHTTPClient(ctx, userEmail)
-	if err != nil {
-		return nil, err
-	}
+	sites, ok := s.sites.Get(userEmail)
+	if !ok {
+		// Get HTTP client
+		client, err := s.getHTTPClient(ctx, userEmail)
+		if err != nil {
+			return nil, err
+		}
 
-	// Fetch from GSC API
-	sites, err := s.gscClient.GetSites(ctx, client)
-	if err != nil {
-		return nil, apperrors.ExternalServiceError("Google Search Console", err)
+		// Fetch from GSC API
+		sites, err = s.gscClient.GetSites(ctx, client)
+		if err != nil {
+			return nil, apperrors.ExternalServiceError("Google Search Console", err)
+		}
+		s.sites.Set(userEmail, sites)
 	}
 
 	// Convert to Website domain objects
@@ -847,6 +880,8 @@ func (s *GSCService) ClearCredentials(ctx context.Context, userEmail string) err
 	if err := s.credentialDeleter.DeleteTokens(ctx, userEmail); err != nil {
 		return apperrors.DatabaseError(err)
 	}
+	s.sites.Delete(userEmail)
+	s.oauthClient.ForgetHTTPClient(userEmail)
 
 	return nil
 }
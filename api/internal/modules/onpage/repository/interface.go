@@ -11,6 +11,7 @@ type OnPageRepository interface {
 	// Analysis operations
 	CreateAnalysis(ctx context.Context, analysis *domain.PageAnalysis) error
 	GetAnalysis(ctx context.Context, id int64) (*domain.PageAnalysis, error)
+	GetAnalysisResult(ctx context.Context, id int64) (*domain.PageAnalysis, *domain.PageData, []domain.SEOIssue, error)
 	GetAnalysesByUser(ctx context.Context, userEmail string, limit int) ([]domain.PageAnalysis, error)
 	GetLatestAnalysis(ctx context.Context, userEmail, url string) (*domain.PageAnalysis, error)
 	UpdateAnalysisStatus(ctx context.Context, id int64, status domain.AnalysisStatus) error
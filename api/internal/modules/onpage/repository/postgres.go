@@ -38,18 +38,55 @@ func (r *PostgresOnPageRepository) CreateAnalysis(ctx context.Context, analysis
 	).Scan(&analysis.ID)
 }
 
+const getAnalysisQuery = `
+	SELECT id, user_email, url, status, score, created_at, completed_at, error
+	FROM page_analyses
+	WHERE id = $1
+`
+
 // GetAnalysis retrieves an analysis by ID
 func (r *PostgresOnPageRepository) GetAnalysis(ctx context.Context, id int64) (*domain.PageAnalysis, error) {
-	query := `
-		SELECT id, user_email, url, status, score, created_at, completed_at, error
-		FROM page_analyses
-		WHERE id = $1
-	`
+	return scanAnalysis(r.pool.QueryRow(ctx, getAnalysisQuery, id))
+}
+
+// GetAnalysisResult retrieves an analysis with its page data and issues in one round trip
+func (r *PostgresOnPageRepository) GetAnalysisResult(ctx context.Context, id int64) (*domain.PageAnalysis, *domain.PageData, []domain.SEOIssue, error) {
+	batch := &pgx.Batch{}
+	batch.Queue(getAnalysisQuery, id)
+	batch.Queue(getPageDataQuery, id)
+	batch.Queue(getIssuesByAnalysisQuery, id)
+
+	results := r.pool.SendBatch(ctx, batch)
+	defer results.Close()
+
+	analysis, err := scanAnalysis(results.QueryRow())
+	if err != nil || analysis == nil {
+		return nil, nil, nil, err
+	}
+
+	pageData, err := scanPageData(results.QueryRow())
+	if err != nil {
+		return nil, nil, nil, err
+	}
+
+	rows, err := results.Query()
+	if err != nil {
+		return nil, nil, nil, err
+	}
+	issues, err := scanIssues(rows)
+	if err != nil {
+		return nil, nil, nil, err
+	}
+
+	return analysis, pageData, issues, nil
+}
 
+// scanAnalysis scans a page_analyses row, returning nil if there is none
+func scanAnalysis(row pgx.Row) (*domain.PageAnalysis, error) {
 	var analysis domain.PageAnalysis
 	var errMsg *string
 
-	err := r.pool.QueryRow(ctx, query, id).Scan(
+	err := row.Scan(
 		&analysis.ID,
 		&analysis.UserEmail,
 		&analysis.URL,
@@ -233,18 +270,23 @@ func (r *PostgresOnPageRepository) SavePageData(ctx context.Context, analysisID
 	return err
 }
 
+const getPageDataQuery = `
+	SELECT title, description, h1, h2_count, h3_count,
+		   word_count, image_count, images_with_alt, internal_links, external_links,
+		   has_canonical, has_robots, has_open_graph, has_schema, load_time_ms, content_hash
+	FROM page_data
+	WHERE analysis_id = $1
+`
+
 // GetPageData retrieves page data for an analysis
 func (r *PostgresOnPageRepository) GetPageData(ctx context.Context, analysisID int64) (*domain.PageData, error) {
-	query := `
-		SELECT title, description, h1, h2_count, h3_count,
-			   word_count, image_count, images_with_alt, internal_links, external_links,
-			   has_canonical, has_robots, has_open_graph, has_schema, load_time_ms, content_hash
-		FROM page_data
-		WHERE analysis_id = $1
-	`
+	return scanPageData(r.pool.QueryRow(ctx, getPageDataQuery, analysisID))
+}
 
+// scanPageData scans a page_data row, returning nil if there is none
+func scanPageData(row pgx.Row) (*domain.PageData, error) {
 	var data domain.PageData
-	err := r.pool.QueryRow(ctx, query, analysisID).Scan(
+	err := row.Scan(
 		&data.Title,
 		&data.Description,
 		&data.H1,
@@ -273,15 +315,20 @@ func (r *PostgresOnPageRepository) GetPageData(ctx context.Context, analysisID i
 	return &data, nil
 }
 
-// SaveIssues saves SEO issues
+// SaveIssues saves SEO issues, sending all inserts in a single batch
 func (r *PostgresOnPageRepository) SaveIssues(ctx context.Context, issues []domain.SEOIssue) error {
-	for _, issue := range issues {
-		query := `
-			INSERT INTO onpage_issues (analysis_id, severity, category, title, description, current_value, suggestion, created_at)
-			VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
-		`
+	if len(issues) == 0 {
+		return nil
+	}
+
+	query := `
+		INSERT INTO onpage_issues (analysis_id, severity, category, title, description, current_value, suggestion, created_at)
+		VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
+	`
 
-		if _, err := r.pool.Exec(ctx, query,
+	batch := &pgx.Batch{}
+	for _, issue := range issues {
+		batch.Queue(query,
 			issue.AnalysisID,
 			issue.Severity,
 			issue.Category,
@@ -289,32 +336,35 @@ func (r *PostgresOnPageRepository) SaveIssues(ctx context.Context, issues []doma
 			issue.Description,
 			issue.CurrentValue,
 			issue.Suggestion,
-		); err != nil {
-			return err
-		}
+		)
 	}
 
-	return nil
+	return r.pool.SendBatch(ctx, batch).Close()
 }
 
+const getIssuesByAnalysisQuery = `
+	SELECT id, analysis_id, severity, category, title, description, current_value, suggestion, created_at
+	FROM onpage_issues
+	WHERE analysis_id = $1
+	ORDER BY
+		CASE severity
+			WHEN 'critical' THEN 1
+			WHEN 'warning' THEN 2
+			WHEN 'info' THEN 3
+		END
+`
+
 // GetIssuesByAnalysis retrieves issues for an analysis
 func (r *PostgresOnPageRepository) GetIssuesByAnalysis(ctx context.Context, analysisID int64) ([]domain.SEOIssue, error) {
-	query := `
-		SELECT id, analysis_id, severity, category, title, description, current_value, suggestion, created_at
-		FROM onpage_issues
-		WHERE analysis_id = $1
-		ORDER BY
-			CASE severity
-				WHEN 'critical' THEN 1
-				WHEN 'warning' THEN 2
-				WHEN 'info' THEN 3
-			END
-	`
-
-	rows, err := r.pool.Query(ctx, query, analysisID)
+	rows, err := r.pool.Query(ctx, getIssuesByAnalysisQuery, analysisID)
 	if err != nil {
 		return nil, err
 	}
+	return scanIssues(rows)
+}
+
+// scanIssues scans onpage_issues rows and closes them
+func scanIssues(rows pgx.Rows) ([]domain.SEOIssue, error) {
 	defer rows.Close()
 
 	var issues []domain.SEOIssue
@@ -148,11 +148,13 @@ func (a *ContentAnalyzer) detectBusinessType(content string, url string) string
 	return "general_business"
 }
 
+// wordRegex matches lowercase words for keyword extraction
+var wordRegex = regexp.MustCompile(`\b[a-z]+\b`)
+
 // extractKeywords extracts important keywords from content
 // 1:1 with Python's _extract_keywords
 func (a *ContentAnalyzer) extractKeywords(content string) []string {
 	// Extract words
-	wordRegex := regexp.MustCompile(`\b[a-z]+\b`)
 	words := wordRegex.FindAllString(content, -1)
 
 	// Count word frequency
@@ -191,6 +193,9 @@ func (a *ContentAnalyzer) extractKeywords(content string) []string {
 	return keywords
 }
 
+// sentenceSplitRegex splits content on sentence-ending punctuation
+var sentenceSplitRegex = regexp.MustCompile(`[.!?]+`)
+
 // extractServices extracts services or offerings from content
 // 1:1 with Python's _extract_services
 func (a *ContentAnalyzer) extractServices(content string) []string {
@@ -198,7 +203,7 @@ func (a *ContentAnalyzer) extractServices(content string) []string {
 	serviceKeywords := []string{"service", "offer", "provide", "solution", "help"}
 
 	// Split content into sentences
-	sentences := regexp.MustCompile(`[.!?]+`).Split(content, -1)
+	sentences := sentenceSplitRegex.Split(content, -1)
 
 	for _, sentence := range sentences {
 		sentence = strings.TrimSpace(sentence)
@@ -223,6 +228,9 @@ func (a *ContentAnalyzer) extractServices(content string) []string {
 	return services
 }
 
+// addressRegex detects street addresses in page content
+var addressRegex = regexp.MustCompile(`(?i)\b\d{1,5}\s+\w+\s+(street|road|avenue|lane|drive|place|boulevard)\b`)
+
 // extractLocation extracts location information
 // 1:1 with Python's _extract_location
 func (a *ContentAnalyzer) extractLocation(content string) string {
@@ -247,7 +255,6 @@ func (a *ContentAnalyzer) extractLocation(content string) string {
 	}
 
 	// Check for address patterns
-	addressRegex := regexp.MustCompile(`(?i)\b\d{1,5}\s+\w+\s+(street|road|avenue|lane|drive|place|boulevard)\b`)
 	if addressRegex.MatchString(content) {
 		locations = append(locations, "Address found")
 	}
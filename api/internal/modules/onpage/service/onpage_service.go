@@ -103,6 +103,13 @@ func (s *OnPageService) processAnalysis(ctx context.Context, analysisID int64, u
 	_ = s.repo.DeleteOldAnalyses(ctx, userEmail, 50)
 }
 
+// Markdown patterns used when analysing scraped page content, compiled once
+var (
+	markdownImageRegex = regexp.MustCompile(`!\[([^\]]*)\]\([^)]+\)`)
+	markdownLinkRegex  = regexp.MustCompile(`\[([^\]]+)\]\(([^)]+)\)`)
+	markdownH1Regex    = regexp.MustCompile(`(?m)^# (.+)$`)
+)
+
 // extractPageData extracts SEO-relevant data from scraped content
 func (s *OnPageService) extractPageData(resp *firecrawl.ScrapeResponse, loadTime int) *domain.PageData {
 	meta := resp.Data.Metadata
@@ -117,8 +124,7 @@ func (s *OnPageService) extractPageData(resp *firecrawl.ScrapeResponse, loadTime
 	h3Count := strings.Count(content, "\n### ")
 
 	// Count images (from markdown ![...](...)
-	imgRegex := regexp.MustCompile(`!\[([^\]]*)\]\([^)]+\)`)
-	images := imgRegex.FindAllStringSubmatch(content, -1)
+	images := markdownImageRegex.FindAllStringSubmatch(content, -1)
 	imageCount := len(images)
 	imagesWithAlt := 0
 	for _, img := range images {
@@ -128,8 +134,7 @@ func (s *OnPageService) extractPageData(resp *firecrawl.ScrapeResponse, loadTime
 	}
 
 	// Count links (from markdown [...](...)
-	linkRegex := regexp.MustCompile(`\[([^\]]+)\]\(([^)]+)\)`)
-	links := linkRegex.FindAllStringSubmatch(content, -1)
+	links := markdownLinkRegex.FindAllStringSubmatch(content, -1)
 	internalLinks := 0
 	externalLinks := 0
 	for _, link := range links {
@@ -145,8 +150,7 @@ func (s *OnPageService) extractPageData(resp *firecrawl.ScrapeResponse, loadTime
 
 	// Extract H1 (first # heading in markdown)
 	h1 := ""
-	h1Regex := regexp.MustCompile(`(?m)^# (.+)$`)
-	if match := h1Regex.FindStringSubmatch(content); len(match) > 1 {
+	if match := markdownH1Regex.FindStringSubmatch(content); len(match) > 1 {
 		h1 = match[1]
 	}
 
@@ -371,7 +375,8 @@ func (s *OnPageService) calculateScore(data *domain.PageData, issues []domain.SE
 
 // GetAnalysis retrieves an analysis by ID
 func (s *OnPageService) GetAnalysis(ctx context.Context, id int64, userEmail string) (*domain.AnalysisResult, error) {
-	analysis, err := s.repo.GetAnalysis(ctx, id)
+	// Analysis, page data and issues are loaded in a single round trip
+	analysis, pageData, issues, err := s.repo.GetAnalysisResult(ctx, id)
 	if err != nil {
 		return nil, apperrors.DatabaseError(err)
 	}
@@ -384,9 +389,6 @@ func (s *OnPageService) GetAnalysis(ctx context.Context, id int64, userEmail str
 		return nil, apperrors.ForbiddenError("Access denied")
 	}
 
-	pageData, _ := s.repo.GetPageData(ctx, id)
-	issues, _ := s.repo.GetIssuesByAnalysis(ctx, id)
-
 	return &domain.AnalysisResult{
 		Analysis: analysis,
 		PageData: pageData,
@@ -488,11 +490,8 @@ func (s *OnPageService) CrawlWebsite(ctx context.Context, websiteURL string) (*d
 func (s *OnPageService) getFallbackAnalysis(websiteURL string) *domain.WebsiteAnalysis {
 	// Extract hostname for basic analysis
 	hostname := websiteURL
-	if strings.Contains(websiteURL, "://") {
-		parts := strings.Split(websiteURL, "://")
-		if len(parts) > 1 {
-			hostname = strings.Split(parts[1], "/")[0]
-		}
+	if _, rest, ok := strings.Cut(websiteURL, "://"); ok {
+		hostname, _, _ = strings.Cut(rest, "/")
 	}
 
 	// Estimate business type from domain
@@ -535,101 +534,105 @@ func (s *OnPageService) extractContentSummary(content string) string {
 	return strings.Join(words, " ")
 }
 
+// techIndicators maps content markers to the technology they indicate
+var techIndicators = map[string]string{
+	"wp-content":  "WordPress",
+	"wordpress":   "WordPress",
+	"react":       "React",
+	"vue":         "Vue.js",
+	"angular":     "Angular",
+	"bootstrap":   "Bootstrap",
+	"tailwind":    "Tailwind CSS",
+	"next.js":     "Next.js",
+	"gatsby":      "Gatsby",
+	"shopify":     "Shopify",
+	"woocommerce": "WooCommerce",
+}
+
 // detectTechStack detects technology stack from content
 func (s *OnPageService) detectTechStack(content string) []string {
-	var techStack []string
 	contentLower := strings.ToLower(content)
 
-	techIndicators := map[string]string{
-		"wp-content":  "WordPress",
-		"wordpress":   "WordPress",
-		"react":       "React",
-		"vue":         "Vue.js",
-		"angular":     "Angular",
-		"bootstrap":   "Bootstrap",
-		"tailwind":    "Tailwind CSS",
-		"next.js":     "Next.js",
-		"gatsby":      "Gatsby",
-		"shopify":     "Shopify",
-		"woocommerce": "WooCommerce",
-	}
-
-	for indicator, tech := range techIndicators {
-		if strings.Contains(contentLower, indicator) {
-			techStack = append(techStack, tech)
-		}
-	}
-
-	// Deduplicate
+	// Deduplicate and limit in the same pass; an already detected technology skips its
+	// content scan and detection stops once the limit is reached
 	seen := make(map[string]bool)
 	unique := make([]string, 0)
-	for _, tech := range techStack {
-		if !seen[tech] {
-			seen[tech] = true
-			unique = append(unique, tech)
+	for indicator, tech := range techIndicators {
+		if seen[tech] || !strings.Contains(contentLower, indicator) {
+			continue
+		}
+		seen[tech] = true
+		unique = append(unique, tech)
+		if len(unique) == 5 {
+			break
 		}
 	}
 
-	if len(unique) > 5 {
-		unique = unique[:5]
-	}
 	return unique
 }
 
+// urlRegex matches absolute http(s) URLs in page content
+var urlRegex = regexp.MustCompile(`https?://[^\s\)]+`)
+
+// socialDomains lists the social networks recognised in page links
+var socialDomains = []string{
+	"facebook.com", "twitter.com", "linkedin.com",
+	"instagram.com", "youtube.com", "github.com",
+}
+
 // extractSocialLinks extracts social media links from content
 func (s *OnPageService) extractSocialLinks(content string) []string {
-	socialDomains := []string{
-		"facebook.com", "twitter.com", "linkedin.com",
-		"instagram.com", "youtube.com", "github.com",
-	}
+	links := urlRegex.FindAllString(content, -1)
 
-	linkRegex := regexp.MustCompile(`https?://[^\s\)]+`)
-	links := linkRegex.FindAllString(content, -1)
-
-	var socialLinks []string
+	// Deduplicate and limit in the same pass as the domain match, stopping at the limit
+	seen := make(map[string]bool)
+	unique := make([]string, 0)
 	for _, link := range links {
+		if seen[link] {
+			continue
+		}
 		for _, domain := range socialDomains {
 			if strings.Contains(link, domain) {
-				socialLinks = append(socialLinks, link)
+				seen[link] = true
+				unique = append(unique, link)
 				break
 			}
 		}
-	}
-
-	// Deduplicate and limit
-	seen := make(map[string]bool)
-	unique := make([]string, 0)
-	for _, link := range socialLinks {
-		if !seen[link] {
-			seen[link] = true
-			unique = append(unique, link)
+		if len(unique) == 5 {
+			break
 		}
 	}
 
-	if len(unique) > 5 {
-		unique = unique[:5]
-	}
 	return unique
 }
 
+// Contact detail patterns for extractContactInfo, compiled once
+var (
+	emailRegex = regexp.MustCompile(`\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b`)
+	phoneRegex = regexp.MustCompile(`[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}`)
+)
+
 // extractContactInfo extracts contact information from content
 func (s *OnPageService) extractContactInfo(content string) map[string]string {
 	contact := make(map[string]string)
 
 	// Extract email
-	emailRegex := regexp.MustCompile(`\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b`)
 	emails := emailRegex.FindAllString(content, -1)
 	if len(emails) > 0 {
 		contact["email"] = emails[0]
 	}
 
 	// Extract phone (simplified pattern)
-	phoneRegex := regexp.MustCompile(`[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}`)
 	phones := phoneRegex.FindAllString(content, -1)
 	for _, phone := range phones {
 		// Only include if it looks like a real phone number (at least 8 digits)
-		digits := regexp.MustCompile(`\d`).FindAllString(phone, -1)
-		if len(digits) >= 8 {
+		digits := 0
+		for i := 0; i < len(phone); i++ {
+			if phone[i] >= '0' && phone[i] <= '9' {
+				digits++
+			}
+		}
+		if digits >= 8 {
 			contact["phone"] = phone
 			break
 		}
@@ -193,10 +193,9 @@ func (s *WebsiteService) extractContent(doc *html.Node, baseURL string) *domain.
 				text := strings.TrimSpace(getTextContent(n))
 				if text != "" && href != "" && len(text) > 1 {
 					// Skip common navigation/footer links
-					skipKeywords := []string{"privacy", "terms", "cookie", "login", "sign up"}
 					skip := false
 					textLower := strings.ToLower(text)
-					for _, kw := range skipKeywords {
+					for _, kw := range skipLinkKeywords {
 						if strings.Contains(textLower, kw) {
 							skip = true
 							break
@@ -292,50 +291,55 @@ func (s *WebsiteService) extractContent(doc *html.Node, baseURL string) *domain.
 	return content
 }
 
+// skipLinkKeywords marks navigation/footer links that are left out of extracted content
+var skipLinkKeywords = []string{"privacy", "terms", "cookie", "login", "sign up"}
+
+// whitespaceRegex collapses runs of whitespace in extracted text
+var whitespaceRegex = regexp.MustCompile(`\s+`)
+
 // getTextContent extracts all text from a node and its children
 func getTextContent(n *html.Node) string {
 	var sb strings.Builder
-	var extract func(*html.Node)
-	extract = func(node *html.Node) {
-		if node.Type == html.TextNode {
-			sb.WriteString(node.Data)
-		}
-		for c := node.FirstChild; c != nil; c = c.NextSibling {
-			extract(c)
-		}
-	}
-	extract(n)
+	writeTextContent(&sb, n)
 	return sb.String()
 }
 
+// writeTextContent appends the text of node and its children to sb
+func writeTextContent(sb *strings.Builder, node *html.Node) {
+	if node.Type == html.TextNode {
+		sb.WriteString(node.Data)
+	}
+	for c := node.FirstChild; c != nil; c = c.NextSibling {
+		writeTextContent(sb, c)
+	}
+}
+
 // extractCleanText extracts clean text, removing scripts and styles
 func extractCleanText(n *html.Node) string {
 	var sb strings.Builder
-	var extract func(*html.Node)
-	extract = func(node *html.Node) {
-		// Skip script, style, nav, header, footer
-		if node.Type == html.ElementNode {
-			switch node.Data {
-			case "script", "style", "nav", "header", "footer":
-				return
-			}
-		}
-		if node.Type == html.TextNode {
-			text := strings.TrimSpace(node.Data)
-			if text != "" {
-				sb.WriteString(text)
-				sb.WriteString(" ")
-			}
+	writeCleanText(&sb, n)
+
+	// Clean up whitespace
+	return strings.TrimSpace(whitespaceRegex.ReplaceAllString(sb.String(), " "))
+}
+
+// writeCleanText appends the trimmed text of node and its children to sb,
+// skipping script, style, nav, header and footer subtrees
+func writeCleanText(sb *strings.Builder, node *html.Node) {
+	if node.Type == html.ElementNode {
+		switch node.Data {
+		case "script", "style", "nav", "header", "footer":
+			return
 		}
-		for c := node.FirstChild; c != nil; c = c.NextSibling {
-			extract(c)
+	}
+	if node.Type == html.TextNode {
+		text := strings.TrimSpace(node.Data)
+		if text != "" {
+			sb.WriteString(text)
+			sb.WriteString(" ")
 		}
 	}
-	extract(n)
-
-	// Clean up whitespace
-	result := sb.String()
-	spaceRegex := regexp.MustCompile(`\s+`)
-	result = spaceRegex.ReplaceAllString(result, " ")
-	return strings.TrimSpace(result)
+	for c := node.FirstChild; c != nil; c = c.NextSibling {
+		writeCleanText(sb, c)
+	}
 }
@@ -162,6 +162,7 @@ func New(handlers *Handlers, config *Config) *gin.Engine {
 			chat := protected.Group("/chat")
 			{
 				chat.POST("", handlers.Chat.Chat)
+				chat.POST("/stream", handlers.Chat.ChatStream)
 				chat.GET("/conversations", handlers.Chat.GetConversations)
 				chat.GET("/conversations/:id", handlers.Chat.GetConversation)
 				chat.DELETE("/conversations/:id", handlers.Chat.DeleteConversation)
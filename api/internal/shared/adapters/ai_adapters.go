@@ -68,6 +68,37 @@ func (a *GeminiClientAdapter) ChatWithRAG(ctx context.Context, messages []domain
 	}, nil
 }
 
+// ChatStream implements domain.AIClient.ChatStream
+func (a *GeminiClientAdapter) ChatStream(ctx context.Context, messages []domain.AIMessage, onChunk func(text string) error) (*domain.AIResponse, error) {
+	return a.chatStream(ctx, messages, gemini.ChatMaxTokens, gemini.ChatTemperature, onChunk)
+}
+
+// ChatStreamWithRAG implements domain.AIClient.ChatStreamWithRAG
+func (a *GeminiClientAdapter) ChatStreamWithRAG(ctx context.Context, messages []domain.AIMessage, onChunk func(text string) error) (*domain.AIResponse, error) {
+	return a.chatStream(ctx, messages, gemini.RAGMaxTokens, gemini.RAGTemperature, onChunk)
+}
+
+func (a *GeminiClientAdapter) chatStream(ctx context.Context, messages []domain.AIMessage, maxTokens int, temperature float64, onChunk func(text string) error) (*domain.AIResponse, error) {
+	// Convert domain messages to gemini messages
+	geminiMessages := make([]gemini.Message, len(messages))
+	for i, msg := range messages {
+		geminiMessages[i] = gemini.Message{
+			Role:    msg.Role,
+			Content: msg.Content,
+		}
+	}
+
+	response, err := a.client.ChatStream(ctx, geminiMessages, maxTokens, temperature, onChunk)
+	if err != nil {
+		return nil, err
+	}
+
+	return &domain.AIResponse{
+		Content:    response.Content,
+		TokensUsed: response.Usage.TotalTokens,
+	}, nil
+}
+
 // ============================================================================
 // EMBEDDING GENERATOR ADAPTERS
 // ============================================================================
@@ -2,11 +2,20 @@ package adapters
 
 import (
 	"context"
+	"crypto/aes"
+	"crypto/cipher"
+	"crypto/rand"
+	"crypto/sha256"
+	"encoding/base64"
+	"errors"
 	"fmt"
+	"io"
 	"time"
 
+	redisClient "github.com/petpeevephobia/solvia-v2/api/internal/infrastructure/redis"
 	chatDomain "github.com/petpeevephobia/solvia-v2/api/internal/modules/chat/domain"
 	dashboardDomain "github.com/petpeevephobia/solvia-v2/api/internal/modules/dashboard/domain"
+	"github.com/rs/zerolog/log"
 )
 
 // GSCMetricsProvider defines the interface for GSC service to provide metrics
@@ -122,37 +131,148 @@ func NewCacheCleanerAdapter(gscRepo GSCCacheClearer, dashboardRepo DashboardCach
 // ClearAllCaches clears all caches before audit (1:1 with Python ULTRATHINK)
 // This clears GSC metrics cache for all common date ranges [7, 14, 28, 30, 90]
 func (a *CacheCleanerAdapter) ClearAllCaches(ctx context.Context, userEmail, websiteURL string) error {
-	fmt.Printf("[AUDIT CACHE CLEAR] 🧹 Clearing all caches for fresh data...\n")
+	log.Info().Str("website", websiteURL).Msg("[AUDIT CACHE CLEAR] Clearing all caches for fresh data")
 
 	// 1. Clear GSC metrics cache for all date ranges (1:1 with Python)
 	// Python iterates through [7, 14, 28, 30, 90] days and clears each
 	// Go's InvalidateMetricsCache clears ALL entries at once, which is more efficient
-	// We log the date ranges for parity with Python's logging
-	for _, days := range DateRangesToClear {
+	// The date ranges are only logged for parity with Python, so only build them at debug level
+	if e := log.Debug(); e.Enabled() {
 		endDate := time.Now().AddDate(0, 0, -1) // GSC data delayed by 1 day
-		startDate := endDate.AddDate(0, 0, -(days - 1))
-		fmt.Printf("[AUDIT CACHE CLEAR] Clearing cache for %d days: %s to %s\n",
-			days, startDate.Format("2006-01-02"), endDate.Format("2006-01-02"))
+		ranges := make([]string, 0, len(DateRangesToClear))
+		for _, days := range DateRangesToClear {
+			startDate := endDate.AddDate(0, 0, -(days - 1))
+			ranges = append(ranges, fmt.Sprintf("%dd: %s to %s", days, startDate.Format("2006-01-02"), endDate.Format("2006-01-02")))
+		}
+		e.Strs("date_ranges", ranges).Msg("[AUDIT CACHE CLEAR] Clearing GSC metrics cache")
 	}
 
 	// Clear all GSC metrics cache (Go clears all at once, more efficient)
 	if err := a.gscRepo.InvalidateMetricsCache(ctx, userEmail, websiteURL); err != nil {
-		fmt.Printf("[AUDIT CACHE CLEAR] ⚠️ Warning: Could not clear metrics cache: %v\n", err)
+		log.Warn().Err(err).Str("website", websiteURL).Msg("[AUDIT CACHE CLEAR] Could not clear metrics cache")
 	} else {
-		fmt.Printf("[AUDIT CACHE CLEAR] ✅ Cleared GSC metrics cache for %s\n", websiteURL)
+		log.Debug().Str("website", websiteURL).Msg("[AUDIT CACHE CLEAR] Cleared GSC metrics cache")
 	}
 
 	// 2. Clear dashboard cache (1:1 with Python)
 	if err := a.dashboardRepo.ClearCache(ctx, userEmail, websiteURL); err != nil {
-		fmt.Printf("[AUDIT CACHE CLEAR] ⚠️ Warning: Could not clear dashboard cache: %v\n", err)
+		log.Warn().Err(err).Str("website", websiteURL).Msg("[AUDIT CACHE CLEAR] Could not clear dashboard cache")
 	} else {
-		fmt.Printf("[AUDIT CACHE CLEAR] ✅ Cleared dashboard cache for %s\n", websiteURL)
+		log.Debug().Str("website", websiteURL).Msg("[AUDIT CACHE CLEAR] Cleared dashboard cache")
 	}
 
-	fmt.Printf("[AUDIT CACHE CLEAR] 🎯 All caches cleared - audit will use fresh Google API data\n")
 	return nil
 }
 
+// ============================================================================
+// CREDENTIAL STORE ADAPTER
+// ============================================================================
+
+// TokenCacheClient defines the Redis operations used for shared credential caching
+type TokenCacheClient interface {
+	GetTokens(ctx context.Context, userEmail string) (*redisClient.TokenCache, error)
+	SetTokensWithTTL(ctx context.Context, userEmail string, tokens *redisClient.TokenCache, ttl time.Duration) error
+	DeleteTokens(ctx context.Context, userEmail string) error
+}
+
+// CredentialStoreAdapter adapts the Redis token cache to auth repository CredentialStore interface
+// Tokens are encrypted with AES-GCM before they reach Redis, so the cache never holds a
+// usable access or refresh token in plaintext
+type CredentialStoreAdapter struct {
+	client TokenCacheClient
+	aead   cipher.AEAD
+}
+
+// NewCredentialStoreAdapter creates a new credential store adapter whose encryption key is
+// derived from secret (the server's JWT secret)
+func NewCredentialStoreAdapter(client TokenCacheClient, secret string) (*CredentialStoreAdapter, error) {
+	if secret == "" {
+		return nil, errors.New("credential store secret is empty")
+	}
+
+	key := sha256.Sum256([]byte("solvia-credential-store:" + secret))
+	block, err := aes.NewCipher(key[:])
+	if err != nil {
+		return nil, err
+	}
+	aead, err := cipher.NewGCM(block)
+	if err != nil {
+		return nil, err
+	}
+
+	return &CredentialStoreAdapter{client: client, aead: aead}, nil
+}
+
+// GetCredentials implements auth repository CredentialStore interface
+// Entries that don't decrypt (written by another key or before encryption) count as misses
+func (a *CredentialStoreAdapter) GetCredentials(ctx context.Context, email string) (accessToken, refreshToken string, expiry time.Time, found bool) {
+	tokens, err := a.client.GetTokens(ctx, email)
+	if err != nil || tokens == nil {
+		return "", "", time.Time{}, false
+	}
+
+	accessToken, err = a.decrypt(email, tokens.AccessToken)
+	if err != nil {
+		return "", "", time.Time{}, false
+	}
+	refreshToken, err = a.decrypt(email, tokens.RefreshToken)
+	if err != nil {
+		return "", "", time.Time{}, false
+	}
+	return accessToken, refreshToken, tokens.ExpiresAt, true
+}
+
+// SetCredentials implements auth repository CredentialStore interface
+func (a *CredentialStoreAdapter) SetCredentials(ctx context.Context, email, accessToken, refreshToken string, expiry time.Time, ttl time.Duration) error {
+	encryptedAccess, err := a.encrypt(email, accessToken)
+	if err != nil {
+		return err
+	}
+	encryptedRefresh, err := a.encrypt(email, refreshToken)
+	if err != nil {
+		return err
+	}
+
+	return a.client.SetTokensWithTTL(ctx, email, &redisClient.TokenCache{
+		AccessToken:  encryptedAccess,
+		RefreshToken: encryptedRefresh,
+		ExpiresAt:    expiry,
+	}, ttl)
+}
+
+// DeleteCredentials implements auth repository CredentialStore interface
+func (a *CredentialStoreAdapter) DeleteCredentials(ctx context.Context, email string) error {
+	return a.client.DeleteTokens(ctx, email)
+}
+
+// encrypt seals a token as base64(nonce || ciphertext). The email is bound as additional
+// data, so a value copied to another user's key fails to decrypt
+func (a *CredentialStoreAdapter) encrypt(email, token string) (string, error) {
+	nonce := make([]byte, a.aead.NonceSize())
+	if _, err := io.ReadFull(rand.Reader, nonce); err != nil {
+		return "", fmt.Errorf("failed to generate nonce: %w", err)
+	}
+	sealed := a.aead.Seal(nonce, nonce, []byte(token), []byte(email))
+	return base64.StdEncoding.EncodeToString(sealed), nil
+}
+
+// decrypt reverses encrypt
+func (a *CredentialStoreAdapter) decrypt(email, value string) (string, error) {
+	sealed, err := base64.StdEncoding.DecodeString(value)
+	if err != nil {
+		return "", err
+	}
+	nonceSize := a.aead.NonceSize()
+	if len(sealed) < nonceSize {
+		return "", errors.New("encrypted token too short")
+	}
+	token, err := a.aead.Open(nil, sealed[:nonceSize], sealed[nonceSize:], []byte(email))
+	if err != nil {
+		return "", err
+	}
+	return string(token), nil
+}
+
 // ============================================================================
 // RAG ADAPTERS (1:1 with Python RAG integration)
 // ============================================================================
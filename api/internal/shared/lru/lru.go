@@ -0,0 +1,135 @@
+package lru
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+// Cache is a thread-safe in-memory cache with per-entry expiry. It holds at most
+// maxEntries keys and evicts the least recently used one when full, so caches keyed
+// by user or device don't grow for the life of the process
+type Cache[K comparable, V any] struct {
+	mu         sync.Mutex
+	items      map[K]*list.Element // key -> element in order holding *entry[K, V]
+	order      *list.List          // most recently used at the front
+	maxEntries int
+	ttl        time.Duration
+}
+
+type entry[K comparable, V any] struct {
+	key       K
+	value     V
+	expiresAt time.Time
+}
+
+// New creates a cache holding at most maxEntries keys, each kept for ttl unless set
+// with its own TTL
+func New[K comparable, V any](maxEntries int, ttl time.Duration) *Cache[K, V] {
+	return &Cache[K, V]{
+		items:      make(map[K]*list.Element),
+		order:      list.New(),
+		maxEntries: maxEntries,
+		ttl:        ttl,
+	}
+}
+
+// Get returns the value for key if present and not expired, marking it recently used.
+// An expired entry is removed
+func (c *Cache[K, V]) Get(key K) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	var zero V
+	elem, ok := c.items[key]
+	if !ok {
+		return zero, false
+	}
+
+	e := elem.Value.(*entry[K, V])
+	if time.Now().After(e.expiresAt) {
+		c.removeElement(elem)
+		return zero, false
+	}
+
+	c.order.MoveToFront(elem)
+	return e.value, true
+}
+
+// Set stores value for key with the cache's default TTL
+func (c *Cache[K, V]) Set(key K, value V) {
+	c.SetWithTTL(key, value, c.ttl)
+}
+
+// SetWithTTL stores value for key for ttl, evicting the least recently used key when full.
+// A ttl of zero or less removes any existing entry instead of storing the value
+func (c *Cache[K, V]) SetWithTTL(key K, value V, ttl time.Duration) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, exists := c.items[key]
+	if ttl <= 0 {
+		if exists {
+			c.removeElement(elem)
+		}
+		return
+	}
+
+	e := &entry[K, V]{key: key, value: value, expiresAt: time.Now().Add(ttl)}
+	if exists {
+		elem.Value = e
+		c.order.MoveToFront(elem)
+		return
+	}
+
+	if c.order.Len() >= c.maxEntries {
+		c.removeElement(c.order.Back())
+	}
+	c.items[key] = c.order.PushFront(e)
+}
+
+// Delete removes key from the cache
+func (c *Cache[K, V]) Delete(key K) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if elem, ok := c.items[key]; ok {
+		c.removeElement(elem)
+	}
+}
+
+// Clear removes every entry
+func (c *Cache[K, V]) Clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.items = make(map[K]*list.Element)
+	c.order.Init()
+}
+
+// RemoveExpired removes every entry whose TTL has passed
+func (c *Cache[K, V]) RemoveExpired() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	now := time.Now()
+	for _, elem := range c.items {
+		if now.After(elem.Value.(*entry[K, V]).expiresAt) {
+			c.removeElement(elem)
+		}
+	}
+}
+
+// Len returns the number of entries, including expired ones not yet removed
+func (c *Cache[K, V]) Len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	return c.order.Len()
+}
+
+// removeElement drops elem from both the list and the map; the caller holds mu
+func (c *Cache[K, V]) removeElement(elem *list.Element) {
+	c.order.Remove(elem)
+	delete(c.items, elem.Value.(*entry[K, V]).key)
+}
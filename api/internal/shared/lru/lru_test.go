@@ -0,0 +1,108 @@
+package lru
+
+import (
+	"fmt"
+	"testing"
+	"time"
+)
+
+// TestEvictsLeastRecentlyUsed verifies a full cache drops the key used longest ago
+func TestEvictsLeastRecentlyUsed(t *testing.T) {
+	cache := New[string, int](3, time.Minute)
+	cache.Set("a", 1)
+	cache.Set("b", 2)
+	cache.Set("c", 3)
+
+	// Reading "a" makes "b" the least recently used
+	if _, ok := cache.Get("a"); !ok {
+		t.Fatal("Expected a to be cached")
+	}
+	cache.Set("d", 4)
+
+	if cache.Len() != 3 {
+		t.Errorf("Expected 3 entries, got %d", cache.Len())
+	}
+	if _, ok := cache.Get("b"); ok {
+		t.Error("Expected b to be evicted")
+	}
+	for key, expected := range map[string]int{"a": 1, "c": 3, "d": 4} {
+		if value, ok := cache.Get(key); !ok || value != expected {
+			t.Errorf("Expected %s=%d, got %d (found=%v)", key, expected, value, ok)
+		}
+	}
+}
+
+// TestSetReplacesExistingKey verifies re-setting a key updates it without growing the cache
+// and counts as a use
+func TestSetReplacesExistingKey(t *testing.T) {
+	cache := New[string, string](2, time.Minute)
+	cache.Set("a", "old")
+	cache.Set("b", "b")
+	cache.Set("a", "new")
+	cache.Set("c", "c")
+
+	if value, ok := cache.Get("a"); !ok || value != "new" {
+		t.Errorf("Expected a=new, got %q (found=%v)", value, ok)
+	}
+	if _, ok := cache.Get("b"); ok {
+		t.Error("Expected b to be evicted after a was re-set")
+	}
+}
+
+// TestExpiry verifies expired entries miss on Get and are dropped by RemoveExpired
+func TestExpiry(t *testing.T) {
+	cache := New[string, bool](10, time.Hour)
+	cache.SetWithTTL("short", true, 20*time.Millisecond)
+	cache.SetWithTTL("also-short", true, 20*time.Millisecond)
+	cache.Set("long", true)
+	time.Sleep(30 * time.Millisecond)
+
+	if _, ok := cache.Get("short"); ok {
+		t.Error("Expected expired entry to miss")
+	}
+
+	cache.RemoveExpired()
+	if cache.Len() != 1 {
+		t.Errorf("Expected only the unexpired entry to remain, got %d entries", cache.Len())
+	}
+	if _, ok := cache.Get("long"); !ok {
+		t.Error("Expected unexpired entry to survive RemoveExpired")
+	}
+}
+
+// TestNonPositiveTTLRemoves verifies a zero TTL stores nothing and drops the old value
+func TestNonPositiveTTLRemoves(t *testing.T) {
+	cache := New[string, int](10, time.Minute)
+	cache.Set("a", 1)
+	cache.SetWithTTL("a", 2, 0)
+	cache.SetWithTTL("b", 3, -time.Second)
+
+	if cache.Len() != 0 {
+		t.Errorf("Expected an empty cache, got %d entries", cache.Len())
+	}
+}
+
+// TestDeleteAndClear verifies keys can be removed individually and all at once
+func TestDeleteAndClear(t *testing.T) {
+	cache := New[int, string](100, time.Minute)
+	for i := 0; i < 10; i++ {
+		cache.Set(i, fmt.Sprint(i))
+	}
+
+	cache.Delete(3)
+	if _, ok := cache.Get(3); ok {
+		t.Error("Expected deleted key to miss")
+	}
+	if cache.Len() != 9 {
+		t.Errorf("Expected 9 entries after Delete, got %d", cache.Len())
+	}
+
+	cache.Clear()
+	if cache.Len() != 0 {
+		t.Errorf("Expected an empty cache after Clear, got %d entries", cache.Len())
+	}
+	cache.Set(1, "again")
+	if value, ok := cache.Get(1); !ok || value != "again" {
+		t.Errorf("Expected the cache to be usable after Clear, got %q (found=%v)", value, ok)
+	}
+}
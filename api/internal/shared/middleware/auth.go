@@ -22,16 +22,14 @@ func Auth(jwtSecret string) gin.HandlerFunc {
 			return
 		}
 
-		// Check Bearer prefix
-		parts := strings.SplitN(authHeader, " ", 2)
-		if len(parts) != 2 || parts[0] != "Bearer" {
+		// Check Bearer prefix (Cut splits at the first space without allocating a slice)
+		scheme, tokenString, ok := strings.Cut(authHeader, " ")
+		if !ok || scheme != "Bearer" {
 			response.Error(c, http.StatusUnauthorized, "UNAUTHORIZED", "Invalid authorization format")
 			c.Abort()
 			return
 		}
 
-		tokenString := parts[1]
-
 		if tokenString == "" {
 			response.Error(c, http.StatusUnauthorized, "UNAUTHORIZED", "Invalid token")
 			c.Abort()
@@ -97,13 +95,11 @@ func OptionalAuth(jwtSecret string) gin.HandlerFunc {
 			return
 		}
 
-		parts := strings.SplitN(authHeader, " ", 2)
-		if len(parts) != 2 || parts[0] != "Bearer" {
+		scheme, tokenString, ok := strings.Cut(authHeader, " ")
+		if !ok || scheme != "Bearer" {
 			c.Next()
 			return
 		}
-
-		tokenString := parts[1]
 		if tokenString == "" {
 			c.Next()
 			return
@@ -216,17 +216,7 @@ func (a *RAGAnalyzer) AnalyzeAuditData(ctx context.Context, metrics *SEOMetrics,
 	// Add pattern-based issues
 	for _, pattern := range patterns {
 		if pattern.Severity == SeverityCritical || pattern.Severity == SeverityHigh {
-			issue := SEOIssue{
-				Title:           a.patternToTitle(pattern.PatternType),
-				Description:     a.patternToDescription(pattern.PatternType, pattern.Evidence),
-				Severity:        pattern.Severity,
-				Impact:          a.patternToImpact(pattern.PatternType),
-				Recommendation:  a.patternToRecommendation(pattern.PatternType),
-				Category:        a.patternToCategory(pattern.PatternType),
-				DataPoints:      pattern.Evidence,
-				ConfidenceScore: pattern.Confidence,
-			}
-			issues = append(issues, issue)
+			issues = append(issues, a.patternToIssue(pattern))
 		}
 	}
 
@@ -260,31 +250,32 @@ func (a *RAGAnalyzer) detectIssues(metrics *SEOMetrics, benchmarks IndustryBench
 		})
 	}
 
-	// CRITICAL: Very low traffic
-	if metrics.Clicks < 10 && metrics.Impressions > 100 {
-		template := a.knowledgeBase.IssueTemplates["low_traffic"]
-		issues = append(issues, SEOIssue{
-			Title:           "Critically Low Organic Traffic",
-			Description:     fmt.Sprintf("Your site received only %d clicks despite %d impressions. Users are seeing your site but not clicking.", metrics.Clicks, metrics.Impressions),
-			Severity:        SeverityCritical,
-			Impact:          "You're missing nearly all potential organic traffic. At current rates, you're losing hundreds of potential visitors monthly.",
-			Recommendation:  template.Recommendation,
-			Category:        "traffic",
-			DataPoints:      map[string]interface{}{"clicks": metrics.Clicks, "impressions": metrics.Impressions, "threshold": 10},
-			ConfidenceScore: 0.95,
-		})
-	} else if metrics.Clicks < 100 && metrics.Impressions > 0 {
+	// CRITICAL: Very low traffic; both tiers share the low_traffic template, so look it up once
+	if metrics.Clicks < 100 && metrics.Impressions > 0 {
 		template := a.knowledgeBase.IssueTemplates["low_traffic"]
-		issues = append(issues, SEOIssue{
-			Title:           template.Title,
-			Description:     fmt.Sprintf("Your site receives only %d monthly clicks. Most healthy sites get 100+ clicks per month.", metrics.Clicks),
-			Severity:        SeverityHigh,
-			Impact:          template.Impact,
-			Recommendation:  template.Recommendation,
-			Category:        "traffic",
-			DataPoints:      map[string]interface{}{"clicks": metrics.Clicks, "threshold": 100},
-			ConfidenceScore: 0.9,
-		})
+		if metrics.Clicks < 10 && metrics.Impressions > 100 {
+			issues = append(issues, SEOIssue{
+				Title:           "Critically Low Organic Traffic",
+				Description:     fmt.Sprintf("Your site received only %d clicks despite %d impressions. Users are seeing your site but not clicking.", metrics.Clicks, metrics.Impressions),
+				Severity:        SeverityCritical,
+				Impact:          "You're missing nearly all potential organic traffic. At current rates, you're losing hundreds of potential visitors monthly.",
+				Recommendation:  template.Recommendation,
+				Category:        "traffic",
+				DataPoints:      map[string]interface{}{"clicks": metrics.Clicks, "impressions": metrics.Impressions, "threshold": 10},
+				ConfidenceScore: 0.95,
+			})
+		} else {
+			issues = append(issues, SEOIssue{
+				Title:           template.Title,
+				Description:     fmt.Sprintf("Your site receives only %d monthly clicks. Most healthy sites get 100+ clicks per month.", metrics.Clicks),
+				Severity:        SeverityHigh,
+				Impact:          template.Impact,
+				Recommendation:  template.Recommendation,
+				Category:        "traffic",
+				DataPoints:      map[string]interface{}{"clicks": metrics.Clicks, "threshold": 100},
+				ConfidenceScore: 0.9,
+			})
+		}
 	}
 
 	// HIGH: Poor CTR compared to benchmark
@@ -439,91 +430,107 @@ func (a *RAGAnalyzer) sortIssuesByImpact(issues []SEOIssue) {
 	}
 }
 
-// Pattern helper functions
-func (a *RAGAnalyzer) patternToTitle(pt PatternType) string {
-	titles := map[PatternType]string{
-		PatternTrafficDrop:     "Significant Traffic Decline Detected",
-		PatternAlgorithmUpdate: "Possible Algorithm Impact",
-		PatternTechnicalIssue:  "Technical SEO Problems",
-		PatternContentDecay:    "Content Performance Decay",
-		PatternSeasonalTrend:   "Seasonal Traffic Pattern",
-		PatternCompetitorSurge: "Competitive Pressure Increasing",
-		PatternHighVolatility:  "Unstable Performance Metrics",
-		PatternRankingIssues:   "Critical Ranking Problems",
-	}
-	if title, ok := titles[pt]; ok {
-		return title
-	}
-	return "Performance Issue Detected"
+// patternDetails holds the static issue text for a detected pattern
+type patternDetails struct {
+	title          string
+	description    string
+	impact         string
+	recommendation string
+	category       string
 }
 
-func (a *RAGAnalyzer) patternToDescription(pt PatternType, evidence map[string]interface{}) string {
-	evidenceJSON, _ := json.Marshal(evidence)
-	descriptions := map[PatternType]string{
-		PatternTrafficDrop:     "Your traffic has dropped significantly, indicating a potential issue that needs immediate attention.",
-		PatternAlgorithmUpdate: "Your metrics suggest possible impact from a Google algorithm update.",
-		PatternTechnicalIssue:  "Technical problems may be preventing your site from performing optimally.",
-		PatternContentDecay:    "Your content is showing signs of decay - freshness and updates are needed.",
-		PatternSeasonalTrend:   "This appears to be a seasonal pattern in your traffic.",
-		PatternCompetitorSurge: "Competitors may be outranking you with new or improved content.",
-		PatternHighVolatility:  "Your rankings are fluctuating significantly, indicating instability.",
-		PatternRankingIssues:   fmt.Sprintf("Critical ranking issues detected. Evidence: %s", string(evidenceJSON)),
-	}
-	if desc, ok := descriptions[pt]; ok {
-		return desc
-	}
-	return "Issue detected in your SEO performance."
+// patternIssueDetails maps each pattern to its issue text in one table (built once at package
+// init), so turning a pattern into an issue is a single lookup
+var patternIssueDetails = map[PatternType]patternDetails{
+	PatternTrafficDrop: {
+		title:          "Significant Traffic Decline Detected",
+		description:    "Your traffic has dropped significantly, indicating a potential issue that needs immediate attention.",
+		impact:         "Lost traffic directly impacts potential customers and revenue.",
+		recommendation: "Audit recent changes, check for technical issues, and review competitor activity.",
+		category:       "traffic",
+	},
+	PatternAlgorithmUpdate: {
+		title:          "Possible Algorithm Impact",
+		description:    "Your metrics suggest possible impact from a Google algorithm update.",
+		impact:         "Algorithm changes can significantly affect your search visibility.",
+		recommendation: "Review Google's recent updates and adjust content strategy accordingly.",
+		category:       "algorithm",
+	},
+	PatternTechnicalIssue: {
+		title:          "Technical SEO Problems",
+		description:    "Technical problems may be preventing your site from performing optimally.",
+		impact:         "Technical issues prevent proper indexing and ranking of your pages.",
+		recommendation: "Run a technical SEO audit and fix crawl errors in Search Console.",
+		category:       "technical",
+	},
+	PatternContentDecay: {
+		title:          "Content Performance Decay",
+		description:    "Your content is showing signs of decay - freshness and updates are needed.",
+		impact:         "Outdated content loses relevance and rankings over time.",
+		recommendation: "Update and refresh your top-performing content with new information.",
+		category:       "content",
+	},
+	PatternSeasonalTrend: {
+		title:          "Seasonal Traffic Pattern",
+		description:    "This appears to be a seasonal pattern in your traffic.",
+		impact:         "Seasonal patterns affect traffic predictability but are normal.",
+		recommendation: "Plan content strategy around seasonal patterns for your industry.",
+		category:       "seasonal",
+	},
+	PatternCompetitorSurge: {
+		title:          "Competitive Pressure Increasing",
+		description:    "Competitors may be outranking you with new or improved content.",
+		impact:         "Increased competition requires content and SEO improvements.",
+		recommendation: "Analyze competitor content and improve your content depth and quality.",
+		category:       "competition",
+	},
+	PatternHighVolatility: {
+		title:          "Unstable Performance Metrics",
+		description:    "Your rankings are fluctuating significantly, indicating instability.",
+		impact:         "Unstable rankings make traffic prediction difficult.",
+		recommendation: "Improve content quality and build consistent backlink growth.",
+		category:       "stability",
+	},
+	PatternRankingIssues: {
+		title:          "Critical Ranking Problems",
+		impact:         "Poor rankings mean your content isn't reaching potential visitors.",
+		recommendation: "Focus on comprehensive content improvements and quality backlinks.",
+		category:       "visibility",
+	},
 }
 
-func (a *RAGAnalyzer) patternToImpact(pt PatternType) string {
-	impacts := map[PatternType]string{
-		PatternTrafficDrop:     "Lost traffic directly impacts potential customers and revenue.",
-		PatternAlgorithmUpdate: "Algorithm changes can significantly affect your search visibility.",
-		PatternTechnicalIssue:  "Technical issues prevent proper indexing and ranking of your pages.",
-		PatternContentDecay:    "Outdated content loses relevance and rankings over time.",
-		PatternSeasonalTrend:   "Seasonal patterns affect traffic predictability but are normal.",
-		PatternCompetitorSurge: "Increased competition requires content and SEO improvements.",
-		PatternHighVolatility:  "Unstable rankings make traffic prediction difficult.",
-		PatternRankingIssues:   "Poor rankings mean your content isn't reaching potential visitors.",
-	}
-	if impact, ok := impacts[pt]; ok {
-		return impact
-	}
-	return "May affect your SEO performance."
+// defaultPatternDetails is used for patterns without a table entry
+var defaultPatternDetails = patternDetails{
+	title:          "Performance Issue Detected",
+	description:    "Issue detected in your SEO performance.",
+	impact:         "May affect your SEO performance.",
+	recommendation: "Review and optimize based on SEO best practices.",
+	category:       "general",
 }
 
-func (a *RAGAnalyzer) patternToRecommendation(pt PatternType) string {
-	recommendations := map[PatternType]string{
-		PatternTrafficDrop:     "Audit recent changes, check for technical issues, and review competitor activity.",
-		PatternAlgorithmUpdate: "Review Google's recent updates and adjust content strategy accordingly.",
-		PatternTechnicalIssue:  "Run a technical SEO audit and fix crawl errors in Search Console.",
-		PatternContentDecay:    "Update and refresh your top-performing content with new information.",
-		PatternSeasonalTrend:   "Plan content strategy around seasonal patterns for your industry.",
-		PatternCompetitorSurge: "Analyze competitor content and improve your content depth and quality.",
-		PatternHighVolatility:  "Improve content quality and build consistent backlink growth.",
-		PatternRankingIssues:   "Focus on comprehensive content improvements and quality backlinks.",
-	}
-	if rec, ok := recommendations[pt]; ok {
-		return rec
+// patternToIssue builds the issue for a detected pattern
+func (a *RAGAnalyzer) patternToIssue(pattern SEOPattern) SEOIssue {
+	details, ok := patternIssueDetails[pattern.PatternType]
+	if !ok {
+		details = defaultPatternDetails
 	}
-	return "Review and optimize based on SEO best practices."
-}
 
-func (a *RAGAnalyzer) patternToCategory(pt PatternType) string {
-	categories := map[PatternType]string{
-		PatternTrafficDrop:     "traffic",
-		PatternAlgorithmUpdate: "algorithm",
-		PatternTechnicalIssue:  "technical",
-		PatternContentDecay:    "content",
-		PatternSeasonalTrend:   "seasonal",
-		PatternCompetitorSurge: "competition",
-		PatternHighVolatility:  "stability",
-		PatternRankingIssues:   "visibility",
+	// Ranking issues embed their evidence, so only they pay for the JSON encoding
+	if pattern.PatternType == PatternRankingIssues {
+		evidenceJSON, _ := json.Marshal(pattern.Evidence)
+		details.description = fmt.Sprintf("Critical ranking issues detected. Evidence: %s", string(evidenceJSON))
 	}
-	if cat, ok := categories[pt]; ok {
-		return cat
+
+	return SEOIssue{
+		Title:           details.title,
+		Description:     details.description,
+		Severity:        pattern.Severity,
+		Impact:          details.impact,
+		Recommendation:  details.recommendation,
+		Category:        details.category,
+		DataPoints:      pattern.Evidence,
+		ConfidenceScore: pattern.Confidence,
 	}
-	return "general"
 }
 
 // GetSEOContext returns SEO best practices context for AI (1:1 with Python)
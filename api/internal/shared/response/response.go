@@ -1,6 +1,8 @@
 package response
 
 import (
+	"encoding/json"
+
 	"github.com/gin-gonic/gin"
 )
 
@@ -81,3 +83,26 @@ func Paginate(page, perPage int, total int64) *Meta {
 		TotalPages: totalPages,
 	}
 }
+
+// SetSSEHeaders prepares the response for a Server-Sent Events stream
+func SetSSEHeaders(c *gin.Context) {
+	c.Header("Content-Type", "text/event-stream")
+	c.Header("Cache-Control", "no-cache")
+	c.Header("Connection", "keep-alive")
+	c.Header("X-Accel-Buffering", "no")
+}
+
+// SSEEvent encodes v as JSON and writes it as a single SSE data event.
+// The encoded bytes go straight to the writer rather than through a string and Sprintf
+func SSEEvent(w gin.ResponseWriter, v interface{}) error {
+	data, err := json.Marshal(v)
+	if err != nil {
+		return err
+	}
+
+	w.WriteString("data: ")
+	w.Write(data)
+	w.WriteString("\n\n")
+	w.Flush()
+	return nil
+}
@@ -41,17 +41,19 @@ const (
 )
 
 // Industry standard CTR benchmarks by position (matching Python exactly)
-var ctrBenchmarks = map[int]float64{
-	1:  0.285, // Position 1: 28.5% CTR
-	2:  0.157, // Position 2: 15.7% CTR
-	3:  0.094, // Position 3: 9.4% CTR
-	4:  0.062, // Position 4: 6.2% CTR
-	5:  0.050, // Position 5: 5.0% CTR
-	6:  0.038, // Position 6: 3.8% CTR
-	7:  0.030, // Position 7: 3.0% CTR
-	8:  0.024, // Position 8: 2.4% CTR
-	9:  0.020, // Position 9: 2.0% CTR
-	10: 0.025, // Position 10: 2.5% CTR
+// Indexed directly by position (1-10); index 0 is unused so lookups need no map access
+var ctrBenchmarks = [...]float64{
+	0,     // unused
+	0.285, // Position 1: 28.5% CTR
+	0.157, // Position 2: 15.7% CTR
+	0.094, // Position 3: 9.4% CTR
+	0.062, // Position 4: 6.2% CTR
+	0.050, // Position 5: 5.0% CTR
+	0.038, // Position 6: 3.8% CTR
+	0.030, // Position 7: 3.0% CTR
+	0.024, // Position 8: 2.4% CTR
+	0.020, // Position 9: 2.0% CTR
+	0.025, // Position 10: 2.5% CTR
 }
 
 // CalculateGSCScore calculates SEO score from GSC metrics
@@ -207,12 +209,6 @@ func getExpectedCTR(position float64) float64 {
 		return 0
 	}
 
-	// Exact match
-	posInt := int(position)
-	if benchmark, ok := ctrBenchmarks[posInt]; ok && position == float64(posInt) {
-		return benchmark
-	}
-
 	if position < 1 {
 		return ctrBenchmarks[1]
 	} else if position > 10 {
@@ -220,22 +216,39 @@ func getExpectedCTR(position float64) float64 {
 		return ctrBenchmarks[10] * math.Pow(0.9, position-10)
 	}
 
-	// Linear interpolation between known points
+	// Exact match
 	lower := int(position)
-	upper := lower + 1
+	weight := position - float64(lower)
+	if weight == 0 {
+		return ctrBenchmarks[lower]
+	}
 
-	lowerBench, lowerOk := ctrBenchmarks[lower]
-	upperBench, upperOk := ctrBenchmarks[upper]
+	// Linear interpolation between known points (lower is 1-9 here, so upper is always in range)
+	return ctrBenchmarks[lower]*(1-weight) + ctrBenchmarks[lower+1]*weight
+}
 
-	if lowerOk && upperOk {
-		weight := position - float64(lower)
-		return lowerBench*(1-weight) + upperBench*weight
-	} else if lowerOk {
-		return lowerBench
-	}
+// Trend thresholds: a change beyond the threshold moves the trends score by
+// trendMajorPoints, any smaller non-zero change by trendMinorPoints
+const (
+	trafficTrendThreshold  = 20.0 // percent change in clicks
+	positionTrendThreshold = 2.0  // positions gained or lost
+	trendMajorPoints       = 25.0
+	trendMinorPoints       = 12.0
+)
 
-	// Fallback to position 10 benchmark
-	return ctrBenchmarks[10]
+// trendPoints scores a change where positive means improvement (matching Python's ±25/±12 ladder)
+func trendPoints(change, threshold float64) float64 {
+	switch {
+	case change > threshold:
+		return trendMajorPoints
+	case change > 0:
+		return trendMinorPoints
+	case change < -threshold:
+		return -trendMajorPoints
+	case change < 0:
+		return -trendMinorPoints
+	}
+	return 0
 }
 
 // calculateTrendsScore calculates trend component score (0-100)
@@ -247,55 +260,23 @@ func calculateTrendsScore(metrics *GSCMetrics, historical *HistoricalData) float
 	// If we have change data from metrics directly
 	if metrics.ClicksChange != 0 || metrics.PositionChange != 0 {
 		// Traffic trend (±25 points)
-		if metrics.ClicksChange > 20 {
-			score += 25
-		} else if metrics.ClicksChange > 0 {
-			score += 12
-		} else if metrics.ClicksChange < -20 {
-			score -= 25
-		} else if metrics.ClicksChange < 0 {
-			score -= 12
-		}
+		score += trendPoints(metrics.ClicksChange, trafficTrendThreshold)
 
 		// Position trend (±25 points, inverse - lower is better)
 		// PositionChange < 0 means position improved (went from 20 to 15)
-		if metrics.PositionChange < -2 {
-			score += 25
-		} else if metrics.PositionChange < 0 {
-			score += 12
-		} else if metrics.PositionChange > 2 {
-			score -= 25
-		} else if metrics.PositionChange > 0 {
-			score -= 12
-		}
+		score += trendPoints(-metrics.PositionChange, positionTrendThreshold)
 	} else if historical != nil {
 		// Use historical data if provided
 		// Traffic trend
 		if historical.Clicks > 0 {
 			changePct := (float64(metrics.Clicks-historical.Clicks) / float64(historical.Clicks)) * 100
-			if changePct > 20 {
-				score += 25
-			} else if changePct > 0 {
-				score += 12
-			} else if changePct < -20 {
-				score -= 25
-			} else if changePct < 0 {
-				score -= 12
-			}
+			score += trendPoints(changePct, trafficTrendThreshold)
 		}
 
 		// Position trend (inverse - lower is better)
 		if historical.Position > 0 && metrics.Position > 0 {
 			positionChange := historical.Position - metrics.Position // Positive = improvement
-			if positionChange > 2 {
-				score += 25
-			} else if positionChange > 0 {
-				score += 12
-			} else if positionChange < -2 {
-				score -= 25
-			} else if positionChange < 0 {
-				score -= 12
-			}
+			score += trendPoints(positionChange, positionTrendThreshold)
 		}
 	}
 
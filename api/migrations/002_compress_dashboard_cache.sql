@@ -0,0 +1,9 @@
+-- Solvia V2 Database Schema Migration
+-- Version: 002
+-- Description: Use lz4 TOAST compression for the cached dashboard JSON
+-- dashboard_cache.data holds the whole dashboard payload (time series, keywords, AI insights)
+-- and is rewritten on every refresh. lz4 compresses and decompresses considerably faster than
+-- the default pglz, so large payloads cost less to write and read back. Existing rows keep
+-- their current compression until they are next rewritten. Requires PostgreSQL 14+.
+
+ALTER TABLE dashboard_cache ALTER COLUMN data SET COMPRESSION lz4;
@@ -0,0 +1,8 @@
+-- Migration: 010_add_audit_lookup_indexes
+-- Description: Composite indexes for the per-user audit lookups
+-- GetLatestAudit, ListAudits and DeleteOldAudits filter by user (and website) and take
+-- the newest rows; with only single-column indexes Postgres has to collect every audit
+-- for the user and sort them. These let it read the newest rows straight off the index.
+
+CREATE INDEX IF NOT EXISTS idx_audits_user_website_created ON audits(user_email, website_url, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audits_user_created ON audits(user_email, created_at DESC);
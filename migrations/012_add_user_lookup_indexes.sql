@@ -0,0 +1,10 @@
+-- Migration: 012_add_user_lookup_indexes
+-- Description: Composite indexes for the per-user on-page and chat lookups
+-- GetLatestAnalysis, GetAnalysesByUser, GetConversationsByUser and the message history queries
+-- filter by owner and take rows in time order; with only single-column indexes Postgres
+-- has to collect every row for the owner and sort them. These serve them from the index.
+
+CREATE INDEX IF NOT EXISTS idx_page_analyses_user_url_created ON page_analyses(user_email, url, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_page_analyses_user_created ON page_analyses(user_email, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_conversations_user_updated ON conversations(user_email, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_created ON messages(conversation_id, created_at);
@@ -16,7 +16,7 @@ echo ""
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Run migrations in order
-for migration in "$SCRIPT_DIR"/00*.sql; do
+for migration in "$SCRIPT_DIR"/[0-9][0-9][0-9]_*.sql; do
     if [ -f "$migration" ]; then
         echo "📦 Running: $(basename "$migration")"
         psql "$DB_URL" -f "$migration"